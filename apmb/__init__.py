@@ -0,0 +1,6 @@
+"""
+APMB dashboard core - data access and analytics used by the Streamlit app
+
+Author: APMB Data Analytics Team
+License: Government of Andhra Pradesh - Internal Use
+"""
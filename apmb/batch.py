@@ -0,0 +1,193 @@
+"""
+Headless batch reports (weekly board packs)
+
+    python -m apmb.batch --out board_pack [--workers 4] [--as-of 2025-12-01]
+                         [--charts png|svg|html|none] [--appendix]
+
+Builds, for every location x investor type combination (each dimension also
+includes "All"), a folder with:
+
+    summary.html        executive summary (`apmb.report`)
+    investors.csv       the combination's investors (`apmb.exports`)
+    charts/<id>.<ext>   the dashboard charts (`apmb.charts`)
+
+plus an `index.csv` listing every combination. The data source, event log and
+risk settings are the dashboard's (APMB_* environment variables or
+.streamlit/secrets.toml). Combinations are rendered in parallel on a process
+pool; each worker receives the portfolio once, then only row positions.
+
+PNG and SVG charts need the optional `kaleido` package; without it charts
+are written as standalone HTML (plotly.js loaded from its CDN).
+"""
+
+import argparse
+import importlib.util
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .charts import (
+    plot_country_distribution, plot_employment_by_location, plot_employment_impact,
+    plot_international_infrastructure, plot_investment_by_location, plot_investor_type_pie,
+    plot_land_demand_by_location, plot_risk_distribution, plot_stage_funnel, plot_waterfront_draft_scatter
+)
+from .config import get_setting
+from .data_sources import get_data_source
+from .dataset import build_dataset, with_view_columns
+from .events import EventStore, get_as_of_date
+from .exports import csv_bytes
+from .kpis import compute_kpis
+from .report import generate_executive_summary_html
+
+CHART_FORMATS = ('png', 'svg', 'html', 'none')
+
+# (chart id, builder, input): 'rows' and 'located' (with the location bridge)
+# take the combination's rows, 'international' its international investors
+BOARD_CHARTS = [
+    ('investment_by_location', plot_investment_by_location, 'located'),
+    ('investor_type_pie', plot_investor_type_pie, 'rows'),
+    ('stage_funnel', plot_stage_funnel, 'rows'),
+    ('land_demand_by_location', plot_land_demand_by_location, 'located'),
+    ('waterfront_draft_scatter', plot_waterfront_draft_scatter, 'rows'),
+    ('employment_impact', plot_employment_impact, 'rows'),
+    ('employment_by_location', plot_employment_by_location, 'located'),
+    ('risk_distribution', plot_risk_distribution, 'rows'),
+    ('country_distribution', plot_country_distribution, 'international'),
+    ('international_infrastructure', plot_international_infrastructure, 'international'),
+]
+
+# Set in each worker process by `_init_worker`
+_PORTFOLIO = {}
+
+
+def images_available():
+    """Whether the optional kaleido dependency (static chart images) is installed"""
+    return importlib.util.find_spec('kaleido') is not None
+
+
+def load_portfolio(as_of=None):
+    """Dataset from the configured source, with activity and risk columns at `as_of`"""
+    dataset = build_dataset(get_data_source().load(), 'batch')
+    events = EventStore(get_setting("EVENT_LOG_PATH"))
+    as_of = get_as_of_date() if as_of is None else as_of
+    return dataset, with_view_columns(dataset.df, events, as_of)
+
+
+def _slug(name):
+    return re.sub(r'[^A-Za-z0-9]+', '_', str(name)).strip('_').lower() or 'unnamed'
+
+
+def report_combinations(dataset):
+    """(location, investor type, row positions) for every non-empty combination"""
+    filter_index = dataset.filter_index
+    combinations = []
+    for location in ['All'] + filter_index.options('Location_Interest'):
+        for investor_type in ['All'] + filter_index.options('Investor_Type'):
+            mask = filter_index.mask({'Location_Interest': location, 'Investor_Type': investor_type})
+            positions = np.arange(filter_index.n_rows) if mask is None else np.flatnonzero(mask)
+            if len(positions):
+                combinations.append((location, investor_type, positions))
+    return combinations
+
+
+def _init_worker(df, bridge, options):
+    _PORTFOLIO.update(df=df, bridge=bridge, options=options)
+
+
+def write_chart(fig, path, chart_format):
+    """Write one figure as an image (kaleido) or standalone HTML"""
+    if chart_format == 'html':
+        fig.write_html(f"{path}.html", include_plotlyjs='cdn')
+    else:
+        fig.write_image(f"{path}.{chart_format}", width=1200, height=fig.layout.height or 500, scale=2)
+
+
+def build_report(task):
+    """Write one combination's folder; returns its index row"""
+    location, investor_type, positions = task
+    df, bridge, options = _PORTFOLIO['df'], _PORTFOLIO['bridge'], _PORTFOLIO['options']
+    rows = df.take(positions)
+    kpis = compute_kpis(rows)
+
+    folder = os.path.join(options['out'], f"{_slug(location)}__{_slug(investor_type)}")
+    os.makedirs(folder, exist_ok=True)
+    html = generate_executive_summary_html(rows, kpis, options['appendix'], bridge)
+    with open(os.path.join(folder, 'summary.html'), 'w', encoding='utf-8') as handle:
+        handle.write(html)
+    with open(os.path.join(folder, 'investors.csv'), 'wb') as handle:
+        handle.write(csv_bytes(rows))
+
+    charts = 0
+    if options['charts'] != 'none':
+        os.makedirs(os.path.join(folder, 'charts'), exist_ok=True)
+        international = rows[rows['Investor_Type'] == 'International']
+        for chart_id, build, source in BOARD_CHARTS:
+            if source == 'international':
+                if not len(international):
+                    continue
+                fig = build(international)
+            else:
+                fig = build(rows, bridge) if source == 'located' else build(rows)
+            write_chart(fig, os.path.join(folder, 'charts', chart_id), options['charts'])
+            charts += 1
+
+    return {
+        'Location': location,
+        'Investor_Type': investor_type,
+        'Investors': len(rows),
+        'Investment_INR_Cr': kpis['Total_Investment'],
+        'Charts': charts,
+        'Folder': os.path.basename(folder),
+    }
+
+
+def run_batch(out, workers=None, as_of=None, charts=None, appendix=False):
+    """Write every combination's report under `out`; returns the index frame"""
+    charts = charts or ('png' if images_available() else 'html')
+    dataset, df = load_portfolio(as_of)
+    tasks = report_combinations(dataset)
+    options = {'out': out, 'charts': charts, 'appendix': appendix}
+
+    os.makedirs(out, exist_ok=True)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(df, dataset.bridge, options)
+    ) as pool:
+        index = pd.DataFrame(list(pool.map(build_report, tasks)))
+    index.to_csv(os.path.join(out, 'index.csv'), index=False)
+    return index
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m apmb.batch',
+        description="Write executive summaries, investor CSVs and charts for every location x investor type"
+    )
+    parser.add_argument('--out', required=True, help="output directory")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument('--as-of', default=None, help="reporting date, YYYY-MM-DD (default: AS_OF_DATE or today)")
+    parser.add_argument(
+        '--charts', choices=CHART_FORMATS, default=None,
+        help="chart output (default: png when kaleido is installed, else html)"
+    )
+    parser.add_argument('--appendix', action='store_true', help="append the full investor table to each summary")
+    args = parser.parse_args(argv)
+
+    if args.charts in ('png', 'svg') and not images_available():
+        parser.error("--charts png/svg needs the kaleido package (pip install kaleido), or use --charts html")
+    as_of = pd.Timestamp(args.as_of).normalize() if args.as_of else None
+
+    started = time.perf_counter()
+    index = run_batch(args.out, args.workers, as_of, args.charts, args.appendix)
+    print(f"Wrote {len(index)} reports to {args.out} in {time.perf_counter() - started:.1f}s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""
+Process-wide caches for results derived from a filtered view
+
+Results (KPIs, tables, exports) are keyed on a small `FilterKey` - the
+dataset version, sidebar selections, search query and ranges - so a lookup
+never hashes the filtered frame. One `LRUCache` serves every session.
+"""
+
+import threading
+from collections import OrderedDict, namedtuple
+
+FilterKey = namedtuple('FilterKey', ['version', 'location', 'investor', 'stage', 'risk', 'search', 'ranges'])
+
+
+class LRUCache:
+    """Thread-safe, size-bounded LRU mapping with hit/miss counters
+
+    Bounded by entry count (`maxsize`), by the summed `sizeof(value)` of the
+    entries (`maxbytes`), or both; `None` disables a bound.
+    """
+
+    def __init__(self, maxsize=256, maxbytes=None, sizeof=len):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.sizeof = sizeof
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+        self._sizes = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        """Return a cached value (counting the hit or miss)"""
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        """Store a value, evicting the least recently used entries"""
+        size = self.sizeof(value) if self.maxbytes is not None else 0
+        with self._lock:
+            self.nbytes += size - self._sizes.get(key, 0)
+            self._sizes[key] = size
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while self._data and self._over_bounds():
+                evicted, _ = self._data.popitem(last=False)
+                self.nbytes -= self._sizes.pop(evicted)
+                self.evictions += 1
+
+    def _over_bounds(self):
+        if self.maxsize is not None and len(self._data) > self.maxsize:
+            return True
+        return self.maxbytes is not None and self.nbytes > self.maxbytes
+
+    def get_or_compute(self, key, compute):
+        """Cached value for `key`, calling `compute()` on a miss
+
+        `compute` runs outside the lock; two sessions missing the same key at
+        once may both compute it, which is harmless for pure results.
+        """
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        """Drop every entry (counters are kept)"""
+        with self._lock:
+            self._data.clear()
+            self._sizes.clear()
+            self.nbytes = 0
+
+    def stats(self):
+        """Hit/miss counters and occupancy"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'size': len(self._data),
+            'maxsize': self.maxsize,
+            'nbytes': self.nbytes,
+            'maxbytes': self.maxbytes,
+        }
@@ -0,0 +1,483 @@
+"""
+Plotly chart builders shared by the dashboard and the batch reports
+
+Each `plot_*` function takes a (filtered) portfolio frame and returns a
+figure. Builders that aggregate by location take the dataset's location
+bridge, as `location_totals` does. Builders of aggregate charts also accept
+the aggregate itself (KPI counts, per-port totals), which the dashboard reads
+from the rollup cube instead of the rows.
+
+Plotly is imported inside each builder, so importing this module (e.g. in a
+batch worker or a test) stays cheap until a chart is actually drawn. Every
+builder is a profiling stage (`apmb.instrumentation`) when profiling is on.
+
+Charts that draw one mark per firm switch to a large-data mode when they
+would draw more than LARGE_DATA_THRESHOLD marks (0 turns it off): the
+waterfront/draft scatter is binned on a grid server-side and drawn with
+WebGL (`Scattergl`), and per-firm bars keep the CHART_TOP_N largest firms
+plus one "Other" bar. Figures are shipped through `figure_json`, which drops
+the template's defaults for trace types the figure doesn't draw.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .config import get_setting
+from .instrumentation import profiled
+from .kpis import category_counts, float_values
+from .locations import location_totals
+
+RISK_COLORS = {
+    'Active': '#10b981',
+    'Delayed': '#f59e0b',
+    'Stalled': '#ef4444',
+    'Closed': '#6b7280'
+}
+
+# Per-port totals behind the location charts
+LOCATION_CHART_COLUMNS = ['Investment_INR_Cr', 'Land_Requirement_Acres', 'Direct_Employment', 'Indirect_Employment']
+
+# Grid cells per axis of the binned scatter (at most SCATTER_BINS ** 2 markers)
+SCATTER_BINS = 60
+# Subplot types none of the charts use; their template defaults are never shipped
+_UNUSED_SUBPLOTS = ('geo', 'mapbox', 'polar', 'scene', 'ternary')
+
+
+def get_large_data_threshold():
+    """Marks per chart above which large-data mode applies (LARGE_DATA_THRESHOLD, 0 = never)"""
+    return int(get_setting("LARGE_DATA_THRESHOLD", 2000))
+
+
+def get_top_n():
+    """Firms kept as individual bars in large-data mode (CHART_TOP_N)"""
+    return int(get_setting("CHART_TOP_N", 30))
+
+
+def is_large(n_marks):
+    """Whether a chart drawing `n_marks` marks is in large-data mode"""
+    threshold = get_large_data_threshold()
+    return threshold > 0 and n_marks > threshold
+
+
+def top_with_other(df, columns, n, label='Firm_Name'):
+    """(labels, {column: values}) of the first `n` rows plus one "Other" entry summing the rest"""
+    head, rest = df.iloc[:n], df.iloc[n:]
+    labels = [str(name) for name in head[label]]
+    values = {col: float_values(head[col]) for col in columns}
+    if len(rest):
+        labels.append(f"Other ({len(rest):,} firms)")
+        values = {col: np.append(values[col], np.nansum(float_values(rest[col]))) for col in columns}
+    return labels, values
+
+
+def _location_totals(df, columns, bridge, totals):
+    """`columns` of the precomputed per-port `totals`, or computed from the rows"""
+    return location_totals(df, columns, bridge) if totals is None else totals[columns]
+
+
+def figure_json(fig):
+    """Plotly JSON of `fig` without template defaults for trace and subplot types it doesn't use"""
+    import plotly.io as pio
+
+    spec = fig.to_plotly_json()
+    template = spec['layout'].get('template')
+    if template:
+        used = {trace.get('type', 'scatter') for trace in spec['data']}
+        template['data'] = {kind: traces for kind, traces in template.get('data', {}).items() if kind in used}
+        for subplot in _UNUSED_SUBPLOTS:
+            template.get('layout', {}).pop(subplot, None)
+    return pio.to_json(spec, validate=False)
+
+
+@profiled
+def plot_investment_by_location(df, bridge=None, totals=None):
+    """Bar chart of investment by location (`totals`: precomputed `location_totals`)"""
+    import plotly.graph_objects as go
+
+    location_inv = _location_totals(df, ['Investment_INR_Cr'], bridge, totals)['Investment_INR_Cr'].sort_values(ascending=True)
+    location_inv = location_inv[location_inv > 0]
+
+    fig = go.Figure(go.Bar(
+        x=location_inv.values,
+        y=location_inv.index,
+        orientation='h',
+        marker=dict(
+            color=location_inv.values,
+            colorscale='Viridis',
+            showscale=True,
+            colorbar=dict(title="₹ Cr")
+        ),
+        text=[f"₹{v:,.0f} Cr" for v in location_inv.values],
+        textposition='auto',
+    ))
+
+    fig.update_layout(
+        title="Investment Distribution by Location",
+        xaxis_title="Investment (₹ Crores)",
+        yaxis_title="Location",
+        height=400,
+        template="plotly_white",
+        showlegend=False
+    )
+
+    return fig
+
+
+@profiled
+def plot_investor_type_pie(df, type_counts=None):
+    """Pie chart of investor types (`type_counts`: precomputed {type: investors})"""
+    import plotly.graph_objects as go
+
+    if type_counts is None:
+        type_counts = df['Investor_Type'].value_counts()
+    else:
+        type_counts = pd.Series(type_counts, dtype=int).sort_values(ascending=False)
+    type_counts = type_counts[type_counts > 0]
+
+    fig = go.Figure(go.Pie(
+        labels=type_counts.index,
+        values=type_counts.values,
+        hole=0.4,
+        marker=dict(colors=['#667eea', '#764ba2']),
+        textinfo='label+percent+value',
+        textfont_size=14
+    ))
+
+    fig.update_layout(
+        title="Investor Type Distribution",
+        height=400,
+        template="plotly_white"
+    )
+
+    return fig
+
+
+@profiled
+def plot_stage_funnel(df, stage_counts=None):
+    """Funnel chart showing stage progression (`stage_counts`: precomputed {stage: investors})"""
+    import plotly.graph_objects as go
+
+    stage_order = ['Early Discussion', 'EOI Submitted', 'Site Visit Complete', 
+                   'DPR Pending', 'MoU Signed', 'Land Allotted', 'High-Level Meeting']
+
+    stage_counts = df['Current_Stage'].value_counts() if stage_counts is None else pd.Series(stage_counts, dtype=int)
+    stage_counts = stage_counts[stage_counts > 0]
+
+    # Filter to stages present in data
+    stages_present = [s for s in stage_order if s in stage_counts.index]
+    values = [stage_counts[s] for s in stages_present]
+
+    fig = go.Figure(go.Funnel(
+        y=stages_present,
+        x=values,
+        textinfo="value+percent initial",
+        marker=dict(color=['#f59e0b', '#10b981', '#3b82f6', '#8b5cf6', '#06b6d4', '#14b8a6', '#f43f5e']),
+        connector=dict(line=dict(color="#64748b", width=2))
+    ))
+
+    fig.update_layout(
+        title="Investment Pipeline Funnel",
+        height=500,
+        template="plotly_white"
+    )
+
+    return fig
+
+
+@profiled
+def plot_land_demand_by_location(df, bridge=None, totals=None):
+    """Bar chart of land demand by location (`totals`: precomputed `location_totals`)"""
+    import plotly.graph_objects as go
+
+    land_data = _location_totals(df, ['Land_Requirement_Acres'], bridge, totals)['Land_Requirement_Acres'].sort_values(ascending=False)
+    land_data = land_data[land_data > 0].head(10)
+
+    fig = go.Figure(go.Bar(
+        x=land_data.index,
+        y=land_data.values,
+        marker=dict(color='#10b981'),
+        text=[f"{v:,.0f}" for v in land_data.values],
+        textposition='auto'
+    ))
+
+    fig.update_layout(
+        title="Land Demand by Location (Top 10)",
+        xaxis_title="Location",
+        yaxis_title="Land Required (Acres)",
+        height=450,
+        template="plotly_white",
+        xaxis_tickangle=-45
+    )
+
+    return fig
+
+
+@profiled
+def plot_waterfront_draft_scatter(df):
+    """Scatter plot of waterfront vs draft requirements"""
+    import plotly.graph_objects as go
+
+    df_clean = df.dropna(subset=['Waterfront_Requirement_Meters', 'Draft_Requirement_Meters'])
+    if is_large(len(df_clean)):
+        return _binned_waterfront_draft_scatter(df_clean)
+
+    fig = go.Figure(go.Scatter(
+        x=df_clean['Waterfront_Requirement_Meters'],
+        y=df_clean['Draft_Requirement_Meters'],
+        mode='markers+text',
+        marker=dict(
+            size=df_clean['Land_Requirement_Acres'] / 10,
+            color=df_clean['Investment_INR_Cr'],
+            colorscale='Plasma',
+            showscale=True,
+            colorbar=dict(title="Investment<br>₹ Cr"),
+            line=dict(width=1, color='white')
+        ),
+        text=df_clean['Firm_Name'].str.split().str[0],
+        textposition='top center',
+        textfont=dict(size=9),
+        hovertemplate='<b>%{text}</b><br>Waterfront: %{x}m<br>Draft: %{y}m<extra></extra>'
+    ))
+
+    fig.update_layout(
+        title="Waterfront vs Draft Requirements (Bubble size = Land needed)",
+        xaxis_title="Waterfront Required (Meters)",
+        yaxis_title="Draft Requirement (Meters)",
+        height=500,
+        template="plotly_white"
+    )
+
+    return fig
+
+
+def _grid_cells(values, bins):
+    """Cell of each value on a `bins`-cell grid spanning its range"""
+    low, high = values.min(), values.max()
+    if high == low:
+        return np.zeros(len(values), dtype=np.int64)
+    return np.minimum(((values - low) / (high - low) * bins).astype(np.int64), bins - 1)
+
+
+def _binned_waterfront_draft_scatter(df_clean):
+    """Large-data scatter: one WebGL marker per occupied grid cell, at its firms' mean position"""
+    import plotly.graph_objects as go
+
+    x = float_values(df_clean['Waterfront_Requirement_Meters'])
+    y = float_values(df_clean['Draft_Requirement_Meters'])
+    cells = _grid_cells(x, SCATTER_BINS) * SCATTER_BINS + _grid_cells(y, SCATTER_BINS)
+    _, cell = np.unique(cells, return_inverse=True)
+    firms = np.bincount(cell)
+    land = np.bincount(cell, weights=np.nan_to_num(float_values(df_clean['Land_Requirement_Acres'])))
+    investment = np.bincount(cell, weights=np.nan_to_num(float_values(df_clean['Investment_INR_Cr'])))
+    size = 6 + 34 * np.sqrt(land / land.max()) if land.max() > 0 else np.full(len(firms), 8.0)
+
+    # Rounded well below display precision, which keeps the JSON payload small
+    fig = go.Figure(go.Scattergl(
+        x=np.round(np.bincount(cell, weights=x) / firms, 2),
+        y=np.round(np.bincount(cell, weights=y) / firms, 2),
+        mode='markers',
+        marker=dict(
+            size=np.round(size, 1),
+            color=np.round(investment, 1),
+            colorscale='Plasma',
+            showscale=True,
+            colorbar=dict(title="Investment<br>₹ Cr"),
+            line=dict(width=1, color='white')
+        ),
+        customdata=np.column_stack([firms, np.round(land)]),
+        hovertemplate=(
+            '<b>%{customdata[0]:,} firms</b><br>Waterfront: ~%{x:,.0f}m<br>Draft: ~%{y:,.1f}m'
+            '<br>Land: %{customdata[1]:,.0f} acres<br>Investment: ₹%{marker.color:,.0f} Cr<extra></extra>'
+        )
+    ))
+
+    fig.update_layout(
+        title=f"Waterfront vs Draft Requirements ({len(df_clean):,} firms in {len(firms):,} groups; size = Land needed)",
+        xaxis_title="Waterfront Required (Meters)",
+        yaxis_title="Draft Requirement (Meters)",
+        height=500,
+        template="plotly_white"
+    )
+
+    return fig
+
+
+@profiled
+def plot_employment_impact(df):
+    """Stacked bar chart of employment impact"""
+    import plotly.graph_objects as go
+
+    df_emp = df[df['Direct_Employment'].notna()].sort_values('Direct_Employment', ascending=False)
+    title = "Employment Impact by Firm"
+    if is_large(len(df_emp)):
+        top_n = get_top_n()
+        firms, jobs = top_with_other(df_emp, ['Direct_Employment', 'Indirect_Employment'], top_n)
+        title = f"Employment Impact by Firm (Top {top_n} of {len(df_emp):,})"
+    else:
+        firms = df_emp['Firm_Name']
+        jobs = {col: float_values(df_emp[col]) for col in ('Direct_Employment', 'Indirect_Employment')}
+
+    fig = go.Figure()
+
+    fig.add_trace(go.Bar(
+        name='Direct Employment',
+        x=firms,
+        y=jobs['Direct_Employment'],
+        marker_color='#3b82f6'
+    ))
+
+    fig.add_trace(go.Bar(
+        name='Indirect Employment',
+        x=firms,
+        y=jobs['Indirect_Employment'],
+        marker_color='#8b5cf6'
+    ))
+
+    fig.update_layout(
+        title=title,
+        xaxis_title="Firm",
+        yaxis_title="Number of Jobs",
+        barmode='stack',
+        height=450,
+        template="plotly_white",
+        xaxis_tickangle=-45,
+        showlegend=True,
+        legend=dict(x=0.8, y=1)
+    )
+
+    return fig
+
+
+@profiled
+def plot_employment_by_location(df, bridge=None, totals=None):
+    """Grouped bar chart of direct and indirect jobs by location (`totals`: precomputed `location_totals`)"""
+    import plotly.graph_objects as go
+
+    emp_location = _location_totals(df, ['Direct_Employment', 'Indirect_Employment'], bridge, totals)
+    emp_location = emp_location[emp_location['Direct_Employment'] > 0]
+
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        name='Direct',
+        x=emp_location.index,
+        y=emp_location['Direct_Employment'],
+        marker_color='#3b82f6'
+    ))
+    fig.add_trace(go.Bar(
+        name='Indirect',
+        x=emp_location.index,
+        y=emp_location['Indirect_Employment'],
+        marker_color='#8b5cf6'
+    ))
+
+    fig.update_layout(
+        barmode='group',
+        height=400,
+        template="plotly_white",
+        xaxis_tickangle=-45,
+        xaxis_title="Location",
+        yaxis_title="Jobs",
+        showlegend=True
+    )
+
+    return fig
+
+
+@profiled
+def plot_risk_distribution(df, risk_counts=None):
+    """Bar chart of investor count by risk status (`risk_counts`: precomputed {status: investors})"""
+    import plotly.graph_objects as go
+
+    risk_counts = category_counts(df['Risk_Status']) if risk_counts is None else risk_counts
+    risk_counts = pd.Series(risk_counts, dtype=int).sort_values(ascending=False)
+    risk_counts = risk_counts[risk_counts > 0]
+
+    fig = go.Figure(go.Bar(
+        x=risk_counts.index,
+        y=risk_counts.values,
+        marker=dict(color=[RISK_COLORS.get(status, '#94a3b8') for status in risk_counts.index]),
+        text=risk_counts.values,
+        textposition='auto'
+    ))
+
+    fig.update_layout(
+        title="Investor Count by Risk Status",
+        xaxis_title="Risk Status",
+        yaxis_title="Count",
+        height=350,
+        template="plotly_white"
+    )
+
+    return fig
+
+
+@profiled
+def plot_country_distribution(df):
+    """Bar chart of investor count by country"""
+    import plotly.graph_objects as go
+
+    country_counts = df['Country'].value_counts()
+    country_counts = country_counts[country_counts > 0]
+
+    fig = go.Figure(go.Bar(
+        x=country_counts.index,
+        y=country_counts.values,
+        marker_color='#764ba2',
+        text=country_counts.values,
+        textposition='auto'
+    ))
+
+    fig.update_layout(
+        title="International Investors by Country",
+        xaxis_title="Country",
+        yaxis_title="Number of Investors",
+        height=350,
+        template="plotly_white"
+    )
+
+    return fig
+
+
+@profiled
+def plot_international_infrastructure(df):
+    """Side-by-side land and waterfront requirement bars per firm"""
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    fig = make_subplots(
+        rows=1, cols=2,
+        subplot_titles=("Land Requirement", "Waterfront Requirement")
+    )
+
+    land = _firm_bars(df, 'Land_Requirement_Acres')
+
+    fig.add_trace(
+        go.Bar(x=land[0], y=land[1], 
+               name='Land (Acres)', marker_color='#10b981'),
+        row=1, col=1
+    )
+
+    water = _firm_bars(df, 'Waterfront_Requirement_Meters')
+
+    fig.add_trace(
+        go.Bar(x=water[0], y=water[1],
+               name='Waterfront (m)', marker_color='#3b82f6'),
+        row=1, col=2
+    )
+
+    fig.update_layout(
+        height=400,
+        showlegend=False,
+        template="plotly_white"
+    )
+
+    return fig
+
+
+def _firm_bars(df, col):
+    """(firms, values) of the rows with `col`; the CHART_TOP_N largest plus "Other" in large-data mode"""
+    rows = df[df[col].notna()]
+    if not is_large(len(rows)):
+        return rows['Firm_Name'], rows[col]
+    firms, values = top_with_other(rows.sort_values(col, ascending=False), [col], get_top_n())
+    return firms, values[col]
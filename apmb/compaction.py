@@ -0,0 +1,140 @@
+"""
+Memory-compact column types for the loaded portfolio
+
+    python -m apmb.compaction      # report for the configured data source
+
+`compact_frame` runs on every load (`DataSource.load`), after the schema
+casts, and gives each column the narrowest type that keeps every value:
+
+    text      categorical when at most CATEGORY_MAX_RATIO of the values are
+              distinct (firm names stay strings)
+    counts    nullable integers (UInt16, Int32, ...) when every present value
+              is whole (COUNT_COLUMNS)
+    measures  float32 when every value survives the round trip, else float64
+
+Measures are read through `kpis.float_values`, which turns missing counts
+into NaN. The report lists each column's type and deep size before and after.
+With MEMORY_BUDGET_MB set, a portfolio that is still larger than the budget
+after compaction is rejected with a ValueError; a refresh then keeps serving
+the previous data.
+"""
+
+import sys
+
+import numpy as np
+import pandas as pd
+
+from .config import get_setting
+from .memory import format_bytes
+
+COUNT_COLUMNS = ['Direct_Employment', 'Indirect_Employment']
+# Text columns with at most this share of distinct values become categoricals
+CATEGORY_MAX_RATIO = 0.5
+
+
+def _integer_dtype(low, high):
+    """Narrowest nullable integer dtype holding [low, high], or None"""
+    for bits in (8, 16, 32, 64):
+        if low >= 0 and high <= np.iinfo(f'uint{bits}').max:
+            return f'UInt{bits}'
+        info = np.iinfo(f'int{bits}')
+        if info.min <= low and high <= info.max:
+            return f'Int{bits}'
+    return None
+
+
+def compact_dtype(series, count=False):
+    """Narrowest lossless dtype for `series` (its own dtype when nothing narrower fits)"""
+    dtype = series.dtype
+    if dtype == object:
+        if len(series) and series.nunique() <= CATEGORY_MAX_RATIO * len(series):
+            return 'category'
+        return dtype
+    if not isinstance(dtype, np.dtype) or dtype.kind != 'f':
+        return dtype
+
+    values = series.to_numpy()
+    present = values[~np.isnan(values)]
+    if not len(present):
+        return dtype
+    if count and np.all(np.mod(present, 1) == 0):
+        integer = _integer_dtype(present.min(), present.max())
+        if integer is not None:
+            return integer
+    if dtype.itemsize > 4 and np.array_equal(present.astype(np.float32).astype(dtype), present):
+        return 'float32'
+    return dtype
+
+
+def memory_report(before, after):
+    """Per-column dtype and deep size before and after, largest saving first"""
+    bytes_before = before.memory_usage(index=False, deep=True)
+    # Deep sizes of string columns are costly; unchanged columns are measured once
+    changed = [col for col in after.columns if after[col].dtype != before[col].dtype]
+    bytes_after = bytes_before.copy()
+    bytes_after[changed] = after[changed].memory_usage(index=False, deep=True)
+    report = pd.DataFrame({
+        'dtype_before': before.dtypes.astype(str),
+        'dtype_after': after.dtypes.astype(str),
+        'bytes_before': bytes_before,
+        'bytes_after': bytes_after,
+    })
+    report['bytes_saved'] = report['bytes_before'] - report['bytes_after']
+    return report.sort_values('bytes_saved', ascending=False)
+
+
+def compact_frame(df):
+    """(`df` with compacted column types, memory report)"""
+    dtypes = {col: compact_dtype(df[col], col in COUNT_COLUMNS) for col in df.columns}
+    changed = {col: dtype for col, dtype in dtypes.items() if dtype != df[col].dtype}
+    compacted = df.astype(changed) if changed else df
+    return compacted, memory_report(df, compacted)
+
+
+def get_memory_budget():
+    """MEMORY_BUDGET_MB in bytes, or None when unlimited (the default)"""
+    value = float(get_setting("MEMORY_BUDGET_MB", 0))
+    return int(value * 1024 * 1024) if value > 0 else None
+
+
+def check_budget(report, budget):
+    """Raise ValueError if the compacted columns exceed `budget` bytes"""
+    total = int(report['bytes_after'].sum())
+    if budget is None or total <= budget:
+        return
+    largest = report['bytes_after'].nlargest(3)
+    columns = ', '.join(f"{col} {format_bytes(size)}" for col, size in largest.items())
+    raise ValueError(
+        f"Portfolio needs {format_bytes(total)} after compaction, over MEMORY_BUDGET_MB "
+        f"({format_bytes(budget)}). Largest columns: {columns}"
+    )
+
+
+def main():
+    from .data_sources import get_data_source
+
+    source = get_data_source()
+    try:
+        source.load()
+        error = None
+    except ValueError as exc:
+        error = exc
+    report = source.compaction
+    if report is None:
+        print(f"{source!r}: {error}")
+        return 1
+
+    print(f"{source!r}: {len(report)} columns")
+    print(report.to_string())
+    before, after = report['bytes_before'].sum(), report['bytes_after'].sum()
+    print(f"\nTotal {format_bytes(before)} -> {format_bytes(after)} ({1 - after / before:.0%} saved)")
+    budget = get_memory_budget()
+    print(f"MEMORY_BUDGET_MB: {'unlimited' if budget is None else format_bytes(budget)}")
+    if error is not None:
+        print(error)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,27 @@
+"""
+Dashboard settings
+
+Every setting can be given as an `APMB_<NAME>` environment variable (handy for
+workers and local runs) or as `<NAME>` in `.streamlit/secrets.toml`.
+"""
+
+import os
+
+
+def get_setting(name, default=None):
+    """Return a setting from the environment or Streamlit secrets"""
+    value = os.environ.get(f"APMB_{name}")
+    if value not in (None, ""):
+        return value
+
+    try:
+        import streamlit as st
+        # load_if_toml_exists() avoids st.secrets rendering a "no secrets" error
+        value = st.secrets.get(name, None) if st.secrets.load_if_toml_exists() else None
+    except Exception:
+        # Secrets file doesn't exist or Streamlit isn't available
+        value = None
+
+    if value is None or value == "":
+        return default
+    return value
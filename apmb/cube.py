@@ -0,0 +1,197 @@
+"""
+Pre-aggregated rollup cube over the four sidebar dimensions
+
+The sidebar filters location, investor type, stage and risk status, all of
+low cardinality. `RollupCube` holds, for every combination of their values,
+the sums behind the KPIs and location charts in one dense NumPy array:
+
+    axis 0   location set: a firm's distinct ports in listed order, so a
+             multi-port firm is counted once however many ports are selected
+    axis 1   investor type
+    axis 2   current stage
+    axis 3   risk status
+    axis 4   measures (MEASURES: row count, summed measure columns, draft count)
+
+Every dimension axis starts with an "All" slot (the rollup over the axis),
+then a slot for rows without a value (they count towards "All" only), then
+one slot per value. A sidebar selection therefore reads a handful of cells -
+never the rows - whatever the size of the portfolio: `sums` returns the same
+dict as `kpis.kpi_sums` over the matching rows and `location_totals` the same
+frame as `locations.location_totals`. Search and range filters are per row,
+so with either active the dashboard aggregates the filtered rows instead.
+
+Cubes are immutable: `apply_changes` returns a new cube with the removed
+rows' cells subtracted and the appended rows' cells added, so sessions still
+reading the old snapshot are unaffected.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .kpis import SUM_COLUMNS, category_codes, float_values
+from .locations import LOCATION_COLUMN, LOCATION_SEPARATOR, allocation_weights, get_allocation_rule
+
+DIMENSIONS = [LOCATION_COLUMN, 'Investor_Type', 'Current_Stage', 'Risk_Status']
+MEASURES = ['Rows', *SUM_COLUMNS.values(), 'Draft_Requirement_Meters', 'Draft_Count']
+
+# Slots before the values on each dimension axis
+ALL, MISSING, FIRST_VALUE = 0, 1, 2
+
+
+def location_set(value):
+    """A Location_Interest value's distinct ports in listed order, slash-joined ('' when none)"""
+    if pd.isna(value):
+        return ''
+    ports = [port.strip() for port in str(value).split(LOCATION_SEPARATOR)]
+    return LOCATION_SEPARATOR.join(dict.fromkeys(port for port in ports if port))
+
+
+def _dimension_values(df, col):
+    """(distinct values in category order, per-row values with None where missing) of a dimension
+
+    Location_Interest values are reduced to their location sets.
+    """
+    codes, values = category_codes(df[col])
+    if col == LOCATION_COLUMN:
+        values = [location_set(value) or None for value in values]
+    lookup = np.array(values + [None], dtype=object)
+    return [value for value in dict.fromkeys(values) if value is not None], lookup[codes]
+
+
+def _measure_values(df):
+    """(rows, MEASURES) matrix; missing values count as 0"""
+    columns = [np.ones(len(df))]
+    columns += [np.nan_to_num(float_values(df[col])) for col in SUM_COLUMNS.values()]
+    draft = float_values(df['Draft_Requirement_Meters'])
+    columns += [np.nan_to_num(draft), (~np.isnan(draft)).astype(float)]
+    return np.column_stack(columns)
+
+
+class RollupCube:
+    """Sums of MEASURES for every combination of the DIMENSIONS values, with "All" rollups"""
+
+    def __init__(self, labels, cells):
+        self.labels = labels
+        self.cells = cells
+        self._slots = {col: {value: FIRST_VALUE + i for i, value in enumerate(values)} for col, values in labels.items()}
+        # Allocation rule -> (ports, shares), built on first use
+        self._shares = {}
+
+    @classmethod
+    def build(cls, df):
+        """Cube of every row of `df`"""
+        dimensions = {col: _dimension_values(df, col) for col in DIMENSIONS}
+        cube = cls({col: values for col, (values, _) in dimensions.items()}, None)
+        rows = {col: per_row for col, (_, per_row) in dimensions.items()}
+        return cls(cube.labels, cube._accumulate(rows, _measure_values(df)))
+
+    @staticmethod
+    def _shape(labels):
+        return tuple(FIRST_VALUE + len(labels[col]) for col in DIMENSIONS) + (len(MEASURES),)
+
+    def _accumulate(self, rows, measures):
+        """Cells of the rows given by their per-row dimension values and `measures`, rolled up"""
+        shape = self._shape(self.labels)
+        slots = []
+        for col in DIMENSIONS:
+            # Missing values (None) are not labels, so they land in the MISSING slot
+            positions = pd.Index(self.labels[col], dtype=object).get_indexer(rows[col])
+            slots.append(np.where(positions < 0, MISSING, positions + FIRST_VALUE))
+        size = int(np.prod(shape[:-1]))
+        flat = np.ravel_multi_index(slots, shape[:-1]) if len(measures) else np.zeros(0, dtype=np.int64)
+        cells = np.column_stack([
+            np.bincount(flat, weights=measures[:, i], minlength=size) for i in range(len(MEASURES))
+        ]).reshape(shape)
+        # "All" sums the missing and value slots; rolling up one axis at a time fills every combination
+        for axis in range(len(DIMENSIONS)):
+            index = [slice(None)] * len(shape)
+            index[axis] = ALL
+            cells[tuple(index)] = np.take(cells, range(MISSING, shape[axis]), axis=axis).sum(axis=axis)
+        return cells
+
+    def apply_changes(self, removed, appended):
+        """New cube without the `removed` rows and with the `appended` rows (both frames)"""
+        removed_rows = {col: _dimension_values(removed, col)[1] for col in DIMENSIONS}
+        appended_dimensions = {col: _dimension_values(appended, col) for col in DIMENSIONS}
+        labels = {
+            col: self.labels[col] + [value for value in appended_dimensions[col][0] if value not in self._slots[col]]
+            for col in DIMENSIONS
+        }
+
+        # New values get new slots at the end of their axis
+        cells = np.zeros(self._shape(labels))
+        cells[tuple(slice(0, size) for size in self.cells.shape)] = self.cells
+        cube = RollupCube(labels, None)
+        cells -= cube._accumulate(removed_rows, _measure_values(removed))
+        cells += cube._accumulate({col: per_row for col, (_, per_row) in appended_dimensions.items()}, _measure_values(appended))
+        return RollupCube(labels, cells)
+
+    def _selection_slots(self, col, selected):
+        """Slots matching a selection on `col` ([ALL] when nothing is selected)"""
+        if not selected:
+            return [ALL]
+        if col == LOCATION_COLUMN:
+            # A firm matches when any of its ports is selected
+            ports = set(selected)
+            return [
+                slot for value, slot in self._slots[col].items()
+                if not ports.isdisjoint(value.split(LOCATION_SEPARATOR))
+            ]
+        return [self._slots[col][value] for value in selected if value in self._slots[col]]
+
+    def _select(self, selections, by=None):
+        """Measures summed over the selected cells; one row per value of dimension `by` if given"""
+        index = []
+        for col in DIMENSIONS:
+            slots = self._selection_slots(col, (selections or {}).get(col, ()))
+            if col == by:
+                selected, slots = slots, list(self._slots[col].values())
+            index.append(np.asarray(slots, dtype=np.int64))
+        block = self.cells[np.ix_(*index)]
+        if by is None:
+            return block.sum(axis=tuple(range(len(DIMENSIONS))))
+        keep = DIMENSIONS.index(by)
+        per_value = block.sum(axis=tuple(axis for axis in range(len(DIMENSIONS)) if axis != keep))
+        if ALL not in selected:
+            per_value[~np.isin(index[keep], selected)] = 0
+        return per_value
+
+    def sums(self, selections=None):
+        """`kpis.kpi_sums` of the rows matching `selections` ({dimension: selected values})"""
+        total = dict(zip(MEASURES, self._select(selections)))
+        sums = {name: float(total[col]) for name, col in SUM_COLUMNS.items()}
+        sums['Draft_Sum'] = float(total['Draft_Requirement_Meters'])
+        sums['Draft_Count'] = int(round(total['Draft_Count']))
+        sums['Rows'] = int(round(total['Rows']))
+
+        rows, investment = MEASURES.index('Rows'), MEASURES.index(SUM_COLUMNS['Total_Investment'])
+        for key, col in (('Stage_Counts', 'Current_Stage'), ('Risk_Counts', 'Risk_Status'), ('Type_Counts', 'Investor_Type')):
+            per_value = self._select(selections, by=col)
+            sums[key] = dict(zip(self.labels[col], np.rint(per_value[:, rows]).astype(int).tolist()))
+            if col == 'Investor_Type':
+                sums['Investment_By_Type'] = dict(zip(self.labels[col], per_value[:, investment].tolist()))
+        return sums
+
+    def _port_shares(self, rule):
+        """(ports, ports x location sets matrix of each set's share per port) under allocation `rule`"""
+        if rule not in self._shares:
+            sets = [value.split(LOCATION_SEPARATOR) for value in self.labels[LOCATION_COLUMN]]
+            ports = sorted({port for ports_of_set in sets for port in ports_of_set})
+            # A bridge with one firm per location set gives each set's share per port
+            bridge = pd.DataFrame({
+                'set': [i for i, ports_of_set in enumerate(sets) for _ in ports_of_set],
+                'port': [ports.index(port) for ports_of_set in sets for port in ports_of_set],
+                'rank': [rank for ports_of_set in sets for rank in range(len(ports_of_set))],
+                'n_locations': [len(ports_of_set) for ports_of_set in sets for _ in ports_of_set],
+            })
+            shares = np.zeros((len(ports), len(sets)))
+            np.add.at(shares, (bridge['port'].to_numpy(), bridge['set'].to_numpy()), allocation_weights(bridge, rule))
+            self._shares[rule] = ports, shares
+        return self._shares[rule]
+
+    def location_totals(self, selections, columns, rule=None):
+        """`locations.location_totals` of the rows matching `selections`"""
+        ports, shares = self._port_shares(rule or get_allocation_rule())
+        per_set = self._select(selections, by=LOCATION_COLUMN)
+        totals = shares @ per_set[:, [MEASURES.index(col) for col in columns]]
+        return pd.DataFrame(totals, index=pd.Index(ports, name=LOCATION_COLUMN), columns=columns)
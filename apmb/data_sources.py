@@ -0,0 +1,258 @@
+"""
+Pluggable data sources for the investor portfolio
+
+The backend is selected by configuration (see `get_data_source`):
+
+    DATA_SOURCE = "csv"            # sample | csv | parquet | arrow | sqlite
+    DATA_PATH = "data/investors.csv"
+    DATA_TABLE = "investors"       # sqlite only
+
+Every backend reads only the columns the dashboard uses, parses the dimension
+columns straight into categoricals and returns the same schema as the
+built-in sample, so `load_data()` and everything downstream is unaffected by
+where the rows come from. Loaded frames are then compacted to their narrowest
+lossless column types (`apmb.compaction`).
+"""
+
+import hashlib
+import os
+import sqlite3
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from .compaction import check_budget, compact_frame, get_memory_budget
+from .config import get_setting
+from .sample_data import SAMPLE_PORTFOLIO
+
+# Schema shared by every plot_* function and calculate_kpis()
+CATEGORICAL_COLUMNS = ['Investor_Type', 'Sector', 'Current_Stage', 'Risk_Status', 'Country']
+NUMERIC_COLUMNS = [
+    'Investment_INR_Cr', 'Land_Requirement_Acres', 'Waterfront_Requirement_Meters',
+    'Draft_Requirement_Meters', 'Direct_Employment', 'Indirect_Employment'
+]
+COLUMNS = [
+    'Firm_Name', 'Investor_Type', 'Sector', 'Location_Interest', 'Current_Stage',
+    'Investment_INR_Cr', 'Land_Requirement_Acres', 'Waterfront_Requirement_Meters',
+    'Draft_Requirement_Meters', 'Direct_Employment', 'Indirect_Employment',
+    'Support_Requested', 'Risk_Status', 'Next_Action', 'Last_Activity_Month', 'Country'
+]
+
+# Rows parsed per chunk; bounds peak memory for text-heavy CSV and SQLite reads
+CHUNK_ROWS = 100_000
+
+_COLUMN_DTYPES = {
+    col: ('category' if col in CATEGORICAL_COLUMNS else
+          'float64' if col in NUMERIC_COLUMNS else 'object')
+    for col in COLUMNS
+}
+
+_EXTENSIONS = {
+    '.csv': 'csv',
+    '.gz': 'csv',
+    '.parquet': 'parquet',
+    '.pq': 'parquet',
+    '.feather': 'arrow',
+    '.arrow': 'arrow',
+    '.ipc': 'arrow',
+    '.db': 'sqlite',
+    '.sqlite': 'sqlite',
+    '.sqlite3': 'sqlite',
+}
+
+
+def _apply_dtypes(df):
+    """Cast a raw frame to the dashboard schema"""
+    return df.astype({col: _COLUMN_DTYPES[col] for col in df.columns if col in _COLUMN_DTYPES})
+
+
+def concat_frames(chunks):
+    """Concatenate schema-typed frames, merging categorical dictionaries"""
+    frames = list(chunks)
+    if not frames:
+        return _apply_dtypes(pd.DataFrame(columns=COLUMNS))
+    if len(frames) == 1:
+        return frames[0].reset_index(drop=True)
+
+    combined = {}
+    for col in frames[0].columns:
+        parts = [frame[col] for frame in frames]
+        if all(isinstance(part.dtype, pd.CategoricalDtype) for part in parts):
+            combined[col] = union_categoricals(parts, ignore_order=True)
+        elif all(isinstance(part.dtype, np.dtype) for part in parts):
+            combined[col] = np.concatenate([part.to_numpy() for part in parts])
+        else:
+            # Nullable integers, or a column whose compacted type differs between loads
+            combined[col] = pd.concat(parts, ignore_index=True)
+    return pd.DataFrame(combined)
+
+
+class DataSource:
+    """Base class for portfolio backends"""
+
+    kind = None
+    # Memory report of the latest load (`apmb.compaction.memory_report`)
+    compaction = None
+
+    def read(self):
+        """Return a frame with (at least) the schema columns"""
+        raise NotImplementedError
+
+    def version(self):
+        """Cheap token that changes whenever the underlying data changes"""
+        return self.kind
+
+    def fingerprint(self):
+        """Hash of the underlying content (same content, same fingerprint)"""
+        return self.version()
+
+    def load(self):
+        """Read the portfolio and return it in the dashboard schema, compacted
+
+        Raises ValueError when the compacted frame exceeds MEMORY_BUDGET_MB.
+        """
+        df = self.read()
+        missing = [col for col in COLUMNS if col not in df.columns]
+        if missing:
+            raise ValueError(f"{self!r} is missing required columns: {', '.join(missing)}")
+        df, self.compaction = compact_frame(_apply_dtypes(df[COLUMNS]).reset_index(drop=True))
+        check_budget(self.compaction, get_memory_budget())
+        return df
+
+    def __repr__(self):
+        return f"{type(self).__name__}()"
+
+
+class SampleSource(DataSource):
+    """The built-in 20-investor sample portfolio"""
+
+    kind = 'sample'
+
+    def read(self):
+        return pd.DataFrame(SAMPLE_PORTFOLIO)
+
+
+class FileSource(DataSource):
+    """Base class for backends that read a single file"""
+
+    def __init__(self, path):
+        self.path = os.fspath(path)
+
+    def version(self):
+        """Fingerprint of the file's identity, size and modification time"""
+        stat = os.stat(self.path)
+        token = f"{self!r}:{stat.st_mtime_ns}:{stat.st_size}"
+        return hashlib.sha1(token.encode()).hexdigest()[:16]
+
+    def fingerprint(self):
+        """SHA-1 of the file's bytes, read in 1 MiB blocks"""
+        digest = hashlib.sha1()
+        with open(self.path, 'rb') as handle:
+            for block in iter(lambda: handle.read(1 << 20), b''):
+                digest.update(block)
+        return digest.hexdigest()[:16]
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.path!r})"
+
+
+class CsvSource(FileSource):
+    """CSV file (optionally gzip-compressed), parsed in chunks"""
+
+    kind = 'csv'
+
+    def read(self):
+        chunks = pd.read_csv(
+            self.path,
+            usecols=lambda col: col in _COLUMN_DTYPES,
+            dtype=_COLUMN_DTYPES,
+            chunksize=CHUNK_ROWS,
+        )
+        return concat_frames(chunks)
+
+
+class ParquetSource(FileSource):
+    """Parquet file; only the schema columns are decoded"""
+
+    kind = 'parquet'
+
+    def _available_columns(self):
+        import pyarrow.parquet as pq
+        return pq.read_schema(self.path).names
+
+    def read(self):
+        available = set(self._available_columns())
+        return pd.read_parquet(self.path, columns=[col for col in COLUMNS if col in available])
+
+
+class ArrowSource(ParquetSource):
+    """Arrow IPC / Feather v2 file; only the schema columns are decoded"""
+
+    kind = 'arrow'
+
+    def _available_columns(self):
+        import pyarrow as pa
+        with pa.memory_map(self.path) as source:
+            return pa.ipc.open_file(source).schema.names
+
+    def read(self):
+        available = set(self._available_columns())
+        return pd.read_feather(self.path, columns=[col for col in COLUMNS if col in available])
+
+
+class SqliteSource(FileSource):
+    """Table in a SQLite database, streamed in chunks"""
+
+    kind = 'sqlite'
+
+    def __init__(self, path, table='investors'):
+        super().__init__(path)
+        self.table = table
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.path!r}, table={self.table!r})"
+
+    def read(self):
+        table = '"' + self.table.replace('"', '""') + '"'
+        with sqlite3.connect(f"file:{self.path}?mode=ro", uri=True) as conn:
+            available = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+            selected = ', '.join(f'"{col}"' for col in COLUMNS if col in available)
+            if not selected:
+                raise ValueError(f"{self!r} has no usable columns (does the table exist?)")
+            chunks = pd.read_sql_query(f"SELECT {selected} FROM {table}", conn, chunksize=CHUNK_ROWS)
+            return concat_frames(_apply_dtypes(chunk) for chunk in chunks)
+
+
+BACKENDS = {
+    'sample': SampleSource,
+    'csv': CsvSource,
+    'parquet': ParquetSource,
+    'arrow': ArrowSource,
+    'sqlite': SqliteSource,
+}
+
+
+def _infer_kind(path):
+    """Guess the backend from a file extension"""
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in _EXTENSIONS:
+        raise ValueError(f"Cannot infer DATA_SOURCE from '{path}'; set DATA_SOURCE explicitly")
+    return _EXTENSIONS[ext]
+
+
+def get_data_source():
+    """Build the data source selected by the DATA_SOURCE / DATA_PATH settings"""
+    path = get_setting("DATA_PATH")
+    kind = get_setting("DATA_SOURCE") or (_infer_kind(path) if path else 'sample')
+    kind = str(kind).lower()
+
+    if kind not in BACKENDS:
+        raise ValueError(f"Unknown DATA_SOURCE '{kind}'. Expected one of: {', '.join(BACKENDS)}")
+    if kind == 'sample':
+        return SampleSource()
+    if not path:
+        raise ValueError(f"DATA_SOURCE '{kind}' requires DATA_PATH to be set")
+    if kind == 'sqlite':
+        return SqliteSource(path, table=get_setting("DATA_TABLE", "investors"))
+    return BACKENDS[kind](path)
@@ -0,0 +1,254 @@
+"""
+Process-wide portfolio dataset with incremental refresh
+
+`DatasetStore` loads the configured data source once and keeps the frame and
+everything derived from it - recorded activity date, location bridge, filter
+index, row hashes and the rollup cube (`apmb.cube`) - in an immutable
+`Dataset` snapshot.
+
+On a rerun, `refresh()` checks the source at most every `refresh_seconds`:
+first its cheap stat token, then (only if that moved) a hash of its content.
+When the content really changed, the new rows are diffed against the current
+snapshot by `Firm_Name` and row hash, and only the changed rows are processed:
+
+    deleted / updated rows  tombstoned (hidden via the filter index live mask)
+    inserted / updated rows appended with their derived columns, bridge rows
+                            and filter bitmaps
+    rollup cube             old rows' cells subtracted, new rows' cells added
+
+Once tombstones exceed `COMPACT_FRACTION` of the frame, the live rows are
+rebuilt into a fresh snapshot. With REFRESH_MODE = "reload", or when
+`Firm_Name` is not unique, every change is a full rebuild instead.
+
+`build_dataset_view` adds the activity and risk columns at an as-of date.
+Given the view of an earlier snapshot that the new one only appended to, it
+computes the appended rows alone.
+"""
+
+import threading
+import time
+from collections import namedtuple
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from .cube import RollupCube
+from .data_sources import COLUMNS, concat_frames
+from .events import with_activity
+from .filter_index import FilterIndex
+from .kpis import kpis_from_sums
+from .locations import build_location_bridge
+from .query import SortedColumns
+from .risk import get_risk_status_source, get_risk_thresholds, get_risk_weights, with_risk
+
+KEY_COLUMN = 'Firm_Name'
+REFRESH_MODES = ('incremental', 'reload')
+
+# Fraction of tombstoned rows that triggers a full rebuild of the live rows
+COMPACT_FRACTION = 0.25
+
+
+class Dataset(namedtuple('Dataset', ['version', 'df', 'bridge', 'filter_index', 'hashes', 'cube'])):
+    """Immutable snapshot of the portfolio and its derived structures"""
+
+    __slots__ = ()
+
+    @property
+    def kpis(self):
+        """Portfolio-wide KPIs (no filters applied)"""
+        return kpis_from_sums(self.cube.sums())
+
+    def live_positions(self):
+        """Row positions that are not tombstoned"""
+        live = self.filter_index.live
+        return np.arange(len(self.df)) if live is None else np.flatnonzero(live)
+
+    def live_mask(self):
+        """Boolean mask of the rows that are not tombstoned"""
+        live = self.filter_index.live
+        return np.ones(len(self.df), dtype=bool) if live is None else live
+
+
+def add_activity_columns(df):
+    """Derive the recorded Last_Activity_Date from Last_Activity_Month
+
+    Recency against the reporting date (and logged interactions) is added per
+    view by `apmb.events.activity_columns`.
+    """
+    df['Last_Activity_Date'] = pd.to_datetime(df['Last_Activity_Month'], format='%B %Y')
+    return df
+
+
+def with_view_columns(df, events, as_of):
+    """Copy of `df` with activity columns at `as_of` and the configured risk engine columns"""
+    return with_risk(
+        with_activity(df, events, as_of),
+        get_risk_weights(),
+        get_risk_thresholds(),
+        replace_status=get_risk_status_source() == 'engine'
+    )
+
+
+def row_hashes(df):
+    """64-bit hash of each row's source columns"""
+    return pd.util.hash_pandas_object(df[COLUMNS], index=False).to_numpy()
+
+
+def build_dataset(df, version):
+    """Snapshot of `df` with every derived structure built from scratch"""
+    df = add_activity_columns(df.reset_index(drop=True))
+    bridge = build_location_bridge(df)
+    return Dataset(version, df, bridge, FilterIndex.build(df, bridge), row_hashes(df), RollupCube.build(df))
+
+
+def diff_rows(dataset, df):
+    """Changes turning `dataset` into `df`, matched on KEY_COLUMN
+
+    Returns (removed positions, rows to append, their hashes, inserted count):
+    an updated row is both removed and appended.
+    """
+    positions = dataset.live_positions()
+    keys = pd.Index(dataset.df[KEY_COLUMN].to_numpy(dtype=object)[positions])
+    hashes = row_hashes(df)
+
+    matched = keys.get_indexer(df[KEY_COLUMN].to_numpy(dtype=object))
+    unchanged = matched >= 0
+    unchanged[unchanged] = dataset.hashes[positions[matched[unchanged]]] == hashes[unchanged]
+
+    kept = np.zeros(len(positions), dtype=bool)
+    kept[matched[unchanged]] = True
+    return positions[~kept], df[~unchanged], hashes[~unchanged], int(np.count_nonzero(matched < 0))
+
+
+def apply_changes(dataset, removed, appended, hashes, version):
+    """New snapshot with `removed` tombstoned and `appended` added"""
+    n_rows = len(dataset.df)
+    appended = add_activity_columns(appended.reset_index(drop=True))
+    appended_bridge = build_location_bridge(appended)
+    appended_bridge['row'] += n_rows
+
+    df = concat_frames([dataset.df, appended]) if len(appended) else dataset.df
+    bridge = dataset.bridge[~np.isin(dataset.bridge['row'].to_numpy(), removed)]
+    bridge = concat_frames([bridge, appended_bridge])
+
+    return Dataset(
+        version,
+        df,
+        bridge,
+        dataset.filter_index.apply_changes(removed, appended, appended_bridge),
+        np.concatenate([dataset.hashes, hashes]),
+        dataset.cube.apply_changes(dataset.df.take(removed), appended),
+    )
+
+
+def compact(dataset):
+    """Snapshot rebuilt from the live rows only"""
+    df = dataset.df.take(dataset.live_positions())
+    return build_dataset(df[COLUMNS], dataset.version)
+
+
+def _only_appended(base, dataset):
+    """Whether `dataset` is `base` with rows tombstoned and appended (an incremental refresh)"""
+    n_rows = len(base.df)
+    if len(dataset.df) < n_rows or not np.array_equal(dataset.hashes[:n_rows], base.hashes):
+        return False
+    return not np.any(dataset.live_mask()[:n_rows] & ~base.live_mask())
+
+
+def build_dataset_view(dataset, events, as_of, base=None):
+    """Dataset frame with activity and risk-engine columns, its filter index, presorted range columns and rollup cube
+
+    `base` is an earlier dataset and its view for the same events and as-of
+    date; when `dataset` only tombstoned and appended rows since, the view is
+    extended with the appended rows instead of recomputed.
+    """
+    if base is not None and _only_appended(base[0], dataset):
+        return _extend_dataset_view(base, dataset, events, as_of)
+    df = with_view_columns(dataset.df, events, as_of)
+    filter_index = dataset.filter_index.with_column('Risk_Status', df['Risk_Status'])
+    cube = dataset.cube
+    if 'Risk_Status_Manual' in df:
+        # The dataset's cube files rows under their typed-in status; only rows the engine rates differently move
+        live = dataset.live_positions()
+        engine = df['Risk_Status'].to_numpy(dtype=object)[live]
+        moved = live[engine != df['Risk_Status_Manual'].to_numpy(dtype=object)[live]]
+        cube = cube.apply_changes(dataset.df.take(moved), df.take(moved))
+    return df, filter_index, SortedColumns.build(df, live=filter_index.live), cube
+
+
+def _extend_dataset_view(base, dataset, events, as_of):
+    """`build_dataset_view` computing only the rows appended since the base dataset"""
+    base_dataset, (base_df, _, base_sorted, base_cube) = base
+    n_rows = len(base_dataset.df)
+    appended = with_view_columns(dataset.df.iloc[n_rows:], events, as_of)
+    df = concat_frames([base_df, appended]) if len(appended) else base_df
+    filter_index = dataset.filter_index.with_column('Risk_Status', df['Risk_Status'])
+
+    # The base cube already files rows under their view status
+    removed = np.flatnonzero(base_dataset.live_mask() & ~dataset.live_mask()[:n_rows])
+    cube = base_cube.apply_changes(base_df.take(removed), appended)
+    return df, filter_index, base_sorted.extend(df, live=filter_index.live), cube
+
+
+class DatasetStore:
+    """Current dataset for one data source, kept up to date as the source changes"""
+
+    def __init__(self, source, refresh_seconds=5.0, mode='incremental'):
+        if mode not in REFRESH_MODES:
+            raise ValueError(f"Unknown REFRESH_MODE '{mode}'. Expected one of: {', '.join(REFRESH_MODES)}")
+        self.source = source
+        self.refresh_seconds = refresh_seconds
+        self.mode = mode
+        self.last_change = None
+        self.last_error = None
+        self._lock = threading.Lock()
+        self._stat = source.version()
+        self._checked_at = time.monotonic()
+        self.current = build_dataset(source.load(), source.fingerprint())
+
+    def refresh(self):
+        """Current snapshot, after applying any source changes
+
+        The source is checked at most every `refresh_seconds`, by one session at
+        a time; everyone else keeps reading the current snapshot meanwhile.
+        """
+        now = time.monotonic()
+        if now - self._checked_at < self.refresh_seconds or not self._lock.acquire(blocking=False):
+            return self.current
+        try:
+            self._checked_at = now
+            stat = self.source.version()
+            if stat != self._stat:
+                fingerprint = self.source.fingerprint()
+                if fingerprint != self.current.version:
+                    self.current = self._update(self.source.load(), fingerprint)
+                self._stat = stat
+            self.last_error = None
+        except Exception as exc:  # a half-written or invalid file: keep serving the last good snapshot
+            self.last_error = exc
+        finally:
+            self._lock.release()
+        return self.current
+
+    def _update(self, df, version):
+        current = self.current
+        live_keys = current.df[KEY_COLUMN].take(current.live_positions())
+        if self.mode == 'reload' or not (df[KEY_COLUMN].is_unique and live_keys.is_unique):
+            self.last_change = {'mode': 'reload', 'rows': len(df), 'at': datetime.now()}
+            return build_dataset(df, version)
+
+        removed, appended, hashes, inserted = diff_rows(current, df)
+        updated = len(appended) - inserted
+        self.last_change = {
+            'mode': 'incremental',
+            'inserted': inserted,
+            'updated': updated,
+            'deleted': len(removed) - updated,
+            'at': datetime.now(),
+        }
+        dataset = apply_changes(current, removed, appended, hashes, version)
+        live = dataset.filter_index.live
+        if live is not None and np.count_nonzero(~live) > COMPACT_FRACTION * len(live):
+            dataset = compact(dataset)
+        return dataset
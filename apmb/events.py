@@ -0,0 +1,254 @@
+"""
+Interaction event log and per-firm activity metrics
+
+Meetings, site visits, DPR submissions and stage changes are appended to a
+JSON Lines file (EVENT_LOG_PATH), one event per line:
+
+    {"firm": "Adani Ports SEZ", "type": "site_visit", "date": "2025-11-20", "stage": null, "note": ""}
+
+`EventStore` reads only the bytes appended since its last read and feeds each
+event into an `ActivityIndex`, which keeps, per firm, the latest event day,
+the sorted event days (so trailing 30/60/90-day counts are two bisects) and
+the day the firm entered its latest recorded stage. Nothing is rescanned when
+an event is added.
+
+`activity_columns` combines those metrics with the month recorded in the
+portfolio (`Last_Activity_Month`), measured against the reporting date from
+AS_OF_DATE (default: today).
+"""
+
+import json
+import os
+import threading
+from bisect import bisect_right, insort
+from collections import namedtuple
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from .config import get_setting
+
+EVENT_TYPES = ['meeting', 'site_visit', 'dpr_submission', 'call', 'email', 'stage_change']
+EVENT_LABELS = {
+    'meeting': "Meeting",
+    'site_visit': "Site Visit",
+    'dpr_submission': "DPR Submission",
+    'call': "Call",
+    'email': "Email",
+    'stage_change': "Stage Change",
+}
+ACTIVITY_WINDOWS = (30, 60, 90)
+
+Event = namedtuple('Event', ['firm', 'type', 'date', 'stage', 'note'])
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def get_as_of_date():
+    """Reporting date from the AS_OF_DATE setting (default: today)"""
+    value = get_setting("AS_OF_DATE")
+    return pd.Timestamp(value).normalize() if value else pd.Timestamp.today().normalize()
+
+
+def _event_from_json(line):
+    record = json.loads(line)
+    return Event(
+        firm=record['firm'],
+        type=record.get('type', 'meeting'),
+        date=date.fromisoformat(record['date']),
+        stage=record.get('stage'),
+        note=record.get('note', ''),
+    )
+
+
+class EventLog:
+    """Append-only JSON Lines file, read incrementally by byte offset"""
+
+    def __init__(self, path):
+        self.path = path
+        self.offset = 0
+        self.skipped = 0
+
+    def append(self, event):
+        """Write one event as a line at the end of the file"""
+        record = dict(event._asdict(), date=event.date.isoformat())
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, 'a', encoding='utf-8') as handle:
+            handle.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+    def truncated(self):
+        """Whether the file shrank below what has been read (rotated or rewritten)"""
+        return self.path is not None and os.path.exists(self.path) and os.path.getsize(self.path) < self.offset
+
+    def read_new(self):
+        """Events appended since the last read (a partially written last line is left for later)"""
+        if self.path is None or not os.path.exists(self.path) or os.path.getsize(self.path) == self.offset:
+            return []
+        with open(self.path, 'rb') as handle:
+            handle.seek(self.offset)
+            data = handle.read()
+        end = data.rfind(b'\n') + 1
+        self.offset += end
+
+        events = []
+        for line in data[:end].decode('utf-8').splitlines():
+            if not line.strip():
+                continue
+            try:
+                events.append(_event_from_json(line))
+            except (ValueError, KeyError, TypeError):
+                self.skipped += 1
+        return events
+
+
+class ActivityIndex:
+    """Per-firm latest activity, sorted event days, current-stage entry and DPR submission day"""
+
+    def __init__(self):
+        self.latest = {}
+        self.days = {}
+        self.stage_entered = {}
+        self.dpr_submitted = {}
+        self.count = 0
+
+    def add(self, event):
+        """Index one event (days are proleptic ordinals)"""
+        day = event.date.toordinal()
+        insort(self.days.setdefault(event.firm, []), day)
+        if day > self.latest.get(event.firm, -1):
+            self.latest[event.firm] = day
+        if event.type == 'stage_change' and event.stage:
+            entered = self.stage_entered.get(event.firm)
+            if entered is None or day >= entered[1]:
+                self.stage_entered[event.firm] = (event.stage, day)
+        if event.type == 'dpr_submission' and day < self.dpr_submitted.get(event.firm, day + 1):
+            self.dpr_submitted[event.firm] = day
+        self.count += 1
+
+    def firm_metrics(self, as_of_day, windows=ACTIVITY_WINDOWS):
+        """Latest event day and trailing event counts up to `as_of_day`, one row per firm"""
+        firms = list(self.days)
+        last = np.full(len(firms), np.nan)
+        counts = np.zeros((len(windows), len(firms)), dtype=np.int64)
+        for i, firm in enumerate(firms):
+            days = self.days[firm]
+            end = bisect_right(days, as_of_day)
+            if end:
+                latest = self.latest[firm]
+                last[i] = latest if latest <= as_of_day else days[end - 1]
+            for w, window in enumerate(windows):
+                counts[w, i] = end - bisect_right(days, as_of_day - window)
+
+        metrics = pd.DataFrame({'Last_Event_Day': last}, index=pd.Index(firms, name='Firm_Name'))
+        for w, window in enumerate(windows):
+            metrics[f'Events_{window}d'] = counts[w]
+        entered = {firm: value for firm, value in self.stage_entered.items() if value[1] <= as_of_day}
+        metrics['Stage'] = pd.Series({firm: value[0] for firm, value in entered.items()}, dtype=object)
+        metrics['Stage_Entered_Day'] = pd.Series({firm: value[1] for firm, value in entered.items()}, dtype=float)
+        metrics['DPR_Submitted'] = pd.Series(
+            {firm: day <= as_of_day for firm, day in self.dpr_submitted.items()}, dtype=bool
+        )
+        return metrics
+
+
+class EventStore:
+    """Event log plus its activity index, kept in step as events are appended"""
+
+    def __init__(self, path=None):
+        self.log = EventLog(path)
+        self.index = ActivityIndex()
+        self._lock = threading.Lock()
+        self._metrics = (None, None)
+        self._generation = 0
+        self.refresh()
+
+    @property
+    def enabled(self):
+        return self.log.path is not None
+
+    @property
+    def version(self):
+        """Token that changes whenever events are added (or the log is replaced)"""
+        return f"{self._generation}:{self.log.offset}"
+
+    def refresh(self):
+        """Index events appended to the log since the last call"""
+        with self._lock:
+            if self.log.truncated():
+                self.log = EventLog(self.log.path)
+                self.index = ActivityIndex()
+                self._generation += 1
+            for event in self.log.read_new():
+                self.index.add(event)
+        return self
+
+    def record(self, event):
+        """Append an event to the log and index it"""
+        if event.type not in EVENT_TYPES:
+            raise ValueError(f"Unknown event type '{event.type}'. Expected one of: {', '.join(EVENT_TYPES)}")
+        with self._lock:
+            self.log.append(event)
+        return self.refresh()
+
+    def firm_metrics(self, as_of):
+        """`ActivityIndex.firm_metrics` at `as_of`, memoized until the log grows"""
+        key = (self.version, as_of)
+        cached_key, metrics = self._metrics
+        if cached_key != key:
+            metrics = self.index.firm_metrics(as_of.toordinal())
+            self._metrics = (key, metrics)
+        return metrics
+
+
+def _days(dates):
+    """Datetime series as float days since the epoch (NaN for missing)"""
+    values = dates.to_numpy(dtype='datetime64[ns]')
+    days = values.astype('datetime64[D]').astype(np.int64).astype(float)
+    days[np.isnat(values)] = np.nan
+    return days
+
+
+def _whole_days(days):
+    """Integer days when none are missing (as `.dt.days` would give)"""
+    return days.astype(np.int64) if not np.isnan(days).any() else days
+
+
+def activity_columns(df, events, as_of):
+    """Recency, engagement, stage-age and DPR columns for every row of `df`
+
+    Last activity is the later of the recorded `Last_Activity_Date` and the
+    firm's latest logged event. Days in stage count from the firm's latest
+    stage-change event when it matches its current stage, else from its last
+    recorded activity.
+    """
+    as_of_day = float(as_of.toordinal() - _EPOCH_ORDINAL)
+    metrics = events.firm_metrics(as_of)
+    firms = df['Firm_Name']
+
+    recorded = _days(df['Last_Activity_Date'])
+    logged = firms.map(metrics['Last_Event_Day']).to_numpy(dtype=float) - _EPOCH_ORDINAL
+    last = np.fmax(recorded, logged)
+
+    stage = firms.map(metrics['Stage']).to_numpy(dtype=object)
+    entered = firms.map(metrics['Stage_Entered_Day']).to_numpy(dtype=float) - _EPOCH_ORDINAL
+    in_stage = stage == df['Current_Stage'].to_numpy(dtype=object)
+    stage_start = np.where(in_stage, entered, recorded)
+
+    columns = {
+        'Last_Activity_Date': pd.to_datetime(last, unit='D'),
+        'Days_Since_Activity': _whole_days(as_of_day - last),
+        'Days_In_Stage': _whole_days(as_of_day - stage_start),
+    }
+    for window in ACTIVITY_WINDOWS:
+        name = f'Events_{window}d'
+        columns[name] = firms.map(metrics[name]).fillna(0).to_numpy(dtype=np.int64)
+    columns['DPR_Submitted'] = firms.map(metrics['DPR_Submitted']).fillna(False).to_numpy(dtype=bool)
+    return columns
+
+
+def with_activity(df, events, as_of):
+    """Copy of `df` with the activity columns for `as_of`"""
+    return df.assign(**activity_columns(df, events, as_of))
@@ -0,0 +1,27 @@
+"""
+Export serializers
+
+Exports are only built when a user asks for them. CSV output is produced in
+row chunks and encoded straight into a byte buffer, so a large portfolio is
+never held as one big intermediate string.
+"""
+
+import io
+
+# Rows serialized per CSV chunk
+CSV_CHUNK_ROWS = 50_000
+
+
+def iter_csv_chunks(df, chunk_rows=CSV_CHUNK_ROWS, encoding='utf-8'):
+    """Yield the CSV export of `df` as encoded byte chunks (header in the first)"""
+    for start in range(0, max(len(df), 1), chunk_rows):
+        chunk = df.iloc[start:start + chunk_rows]
+        yield chunk.to_csv(index=False, header=(start == 0)).encode(encoding)
+
+
+def csv_bytes(df, chunk_rows=CSV_CHUNK_ROWS):
+    """CSV export of `df` as bytes, assembled chunk by chunk"""
+    buffer = io.BytesIO()
+    for chunk in iter_csv_chunks(df, chunk_rows):
+        buffer.write(chunk)
+    return buffer.getvalue()
@@ -0,0 +1,328 @@
+"""
+Opt-in per-rerun profiling: stage timings, allocations and cache activity
+
+A rerun is profiled inside `profile_rerun()`. Within it, `stage(name)` blocks
+and `@profiled` functions record, per stage:
+
+    calls     how often the stage ran during the rerun
+    ms        wall time (perf_counter)
+    net_kib   memory still allocated when the stage ended     } memory mode only:
+    peak_kib  peak allocation above the stage's starting level } tracemalloc
+
+Stages nest (a chart inside the view that draws it); their depth is kept for
+display. Outside a profiled rerun - profiling off, batch workers, benchmarks -
+a stage costs one context-variable lookup. The active profile lives in a
+`ContextVar`, so concurrent sessions (one script thread each) never record
+into each other's profiles.
+
+tracemalloc's peak is process-wide, so in memory mode reruns take a process
+lock and run one at a time: their peaks are then each their own, but
+concurrent sessions wait for each other. Allocations by background export
+workers still count towards whichever rerun is running. Use memory mode for
+diagnosis, not in production.
+
+Cache hits and misses are the change in each process-wide cache's counters
+over the rerun, so lookups other sessions make meanwhile are included.
+
+Finished profiles go to a `RerunLog` ring buffer and can be written as JSON
+lines or in the Prometheus text exposition format (textfile collector).
+"""
+
+import contextvars
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from functools import wraps
+
+from .config import get_setting
+
+PROFILING_MODES = ('off', 'on', 'memory')
+
+_CURRENT = contextvars.ContextVar('apmb_profile', default=None)
+# Serializes memory-profiled reruns: tracemalloc.reset_peak() affects the whole process
+_MEMORY_LOCK = threading.Lock()
+
+
+def get_profiling_mode():
+    """'off' (default), 'on' (timings and cache activity) or 'memory' (plus tracemalloc allocations)"""
+    mode = str(get_setting("PROFILING", "off")).lower()
+    if mode not in PROFILING_MODES:
+        raise ValueError(f"Unknown PROFILING '{mode}'. Expected 'off', 'on' or 'memory'")
+    return mode
+
+
+class RerunProfile:
+    """Stages of one rerun (in first-run order), its total time and cache activity"""
+
+    def __init__(self, memory=False, caches=None):
+        self.run_id = None
+        self.started_at = datetime.now()
+        self.memory = memory
+        self.stages = {}
+        self.total_ms = None
+        self.peak_kib = None
+        self.caches = {}
+        self._cache_sources = caches or {}
+        self._cache_start = {name: cache.stats() for name, cache in self._cache_sources.items()}
+        # One frame per open stage; the root frame is the rerun itself
+        self._stack = []
+        self._stack.append(self._open_frame())
+        self._started = time.perf_counter()
+
+    def _open_frame(self):
+        frame = {'peak': 0, 'start': 0}
+        if self.memory:
+            current, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                # The parent's peak so far, before the child resets it
+                parent = self._stack[-1]
+                parent['peak'] = max(parent['peak'], peak)
+            tracemalloc.reset_peak()
+            frame['start'] = current
+        return frame
+
+    def _close_frame(self, frame):
+        """(net KiB, peak KiB) of a finished frame, or (None, None) without tracemalloc"""
+        if not self.memory:
+            return None, None
+        current, peak = tracemalloc.get_traced_memory()
+        peak = max(frame['peak'], peak)
+        if self._stack:
+            self._stack[-1]['peak'] = max(self._stack[-1]['peak'], peak)
+        return (current - frame['start']) / 1024, (peak - frame['start']) / 1024
+
+    @contextmanager
+    def stage(self, name):
+        """Record the enclosed block as stage `name`"""
+        # Entries are created on entry, so a parent stage is listed before its children
+        entry = self.stages.get(name)
+        if entry is None:
+            blank = 0.0 if self.memory else None
+            entry = self.stages[name] = {
+                'depth': len(self._stack) - 1, 'calls': 0, 'ms': 0.0, 'net_kib': blank, 'peak_kib': blank
+            }
+        frame = self._open_frame()
+        self._stack.append(frame)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            entry['ms'] += (time.perf_counter() - started) * 1000
+            entry['calls'] += 1
+            self._stack.pop()
+            net_kib, peak_kib = self._close_frame(frame)
+            if self.memory:
+                entry['net_kib'] += net_kib
+                entry['peak_kib'] = max(entry['peak_kib'], peak_kib)
+
+    def finish(self):
+        """Close the rerun: total time, peak allocation and cache activity"""
+        self.total_ms = (time.perf_counter() - self._started) * 1000
+        root = self._stack.pop(0)
+        self._stack = []
+        self.peak_kib = self._close_frame(root)[1]
+        for name, cache in self._cache_sources.items():
+            before, after = self._cache_start[name], cache.stats()
+            self.caches[name] = {
+                'hits': after['hits'] - before['hits'],
+                'misses': after['misses'] - before['misses'],
+                'size': after['size'],
+                'nbytes': after['nbytes'],
+            }
+
+    def to_dict(self):
+        """JSON-serializable record of the rerun"""
+        return {
+            'run': self.run_id,
+            'started_at': self.started_at.isoformat(timespec='milliseconds'),
+            'total_ms': round(self.total_ms, 3),
+            'peak_kib': None if self.peak_kib is None else round(self.peak_kib, 1),
+            'stages': [
+                {
+                    'stage': name,
+                    'depth': entry['depth'],
+                    'calls': entry['calls'],
+                    'ms': round(entry['ms'], 3),
+                    'net_kib': None if entry['net_kib'] is None else round(entry['net_kib'], 1),
+                    'peak_kib': None if entry['peak_kib'] is None else round(entry['peak_kib'], 1),
+                }
+                for name, entry in self.stages.items()
+            ],
+            'caches': self.caches,
+        }
+
+
+@contextmanager
+def profile_rerun(mode='on', caches=None):
+    """Profile the enclosed rerun; yields the `RerunProfile` (None when mode is 'off')
+
+    `caches` maps names to the `LRUCache`s whose activity is recorded. The
+    profile is finished even when the rerun stops early (st.stop, st.rerun).
+    In memory mode, profiled reruns run one at a time across the process.
+    """
+    if mode == 'off':
+        yield None
+        return
+    memory = mode == 'memory'
+    if memory:
+        _MEMORY_LOCK.acquire()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+    try:
+        profile = RerunProfile(memory, caches)
+        token = _CURRENT.set(profile)
+        try:
+            yield profile
+        finally:
+            _CURRENT.reset(token)
+            profile.finish()
+    finally:
+        if memory:
+            _MEMORY_LOCK.release()
+
+
+def current_profile():
+    """The profile of the rerun running in this context, or None"""
+    return _CURRENT.get()
+
+
+@contextmanager
+def stage(name):
+    """Record the enclosed block as stage `name` of the current rerun, if profiled"""
+    profile = _CURRENT.get()
+    if profile is None:
+        yield
+        return
+    with profile.stage(name):
+        yield
+
+
+def profiled(fn=None, name=None):
+    """Decorator recording every call of `fn` as a stage (named after the function)"""
+    if fn is None:
+        return lambda fn: profiled(fn, name)
+    stage_name = name or fn.__name__
+
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        profile = _CURRENT.get()
+        if profile is None:
+            return fn(*args, **kwargs)
+        with profile.stage(stage_name):
+            return fn(*args, **kwargs)
+    return wrapper
+
+
+class RerunLog:
+    """Thread-safe ring buffer of the last `maxlen` reruns, plus running stage totals"""
+
+    def __init__(self, maxlen=50):
+        self.reruns = 0
+        self.totals = {}
+        self._profiles = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+
+    def append(self, profile):
+        """Number the finished profile and keep it"""
+        with self._lock:
+            self.reruns += 1
+            profile.run_id = self.reruns
+            self._profiles.append(profile)
+            for name, entry in profile.stages.items():
+                total = self.totals.setdefault(name, {'calls': 0, 'ms': 0.0, 'last_ms': 0.0})
+                total['calls'] += entry['calls']
+                total['ms'] += entry['ms']
+                total['last_ms'] = entry['ms']
+            total = self.totals.setdefault('rerun', {'calls': 0, 'ms': 0.0, 'last_ms': 0.0})
+            total['calls'] += 1
+            total['ms'] += profile.total_ms
+            total['last_ms'] = profile.total_ms
+
+    def recent(self):
+        """Kept profiles, newest first"""
+        with self._lock:
+            return list(reversed(self._profiles))
+
+
+def json_lines(profiles):
+    """One JSON object per profile"""
+    return ''.join(json.dumps(profile.to_dict()) + '\n' for profile in profiles)
+
+
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def prometheus_text(log, caches=None, memory=None):
+    """Stage totals, cache counters and memory gauges in the Prometheus text exposition format
+
+    Stage times are cumulative over every rerun since the server started
+    ('rerun' is the whole rerun); `apmb_stage_last_seconds` is the latest run.
+    `memory` is an `apmb.memory.SessionMemory`.
+    """
+    with log._lock:
+        totals = {name: dict(total) for name, total in log.totals.items()}
+    lines = [
+        "# HELP apmb_stage_seconds_total Wall time spent in each dashboard stage",
+        "# TYPE apmb_stage_seconds_total counter",
+    ]
+    lines += [f'apmb_stage_seconds_total{{stage="{_label(name)}"}} {t["ms"] / 1000:.6f}' for name, t in totals.items()]
+    lines += [
+        "# HELP apmb_stage_calls_total Times each dashboard stage ran",
+        "# TYPE apmb_stage_calls_total counter",
+    ]
+    lines += [f'apmb_stage_calls_total{{stage="{_label(name)}"}} {t["calls"]}' for name, t in totals.items()]
+    lines += [
+        "# HELP apmb_stage_last_seconds Wall time of each stage in its latest rerun",
+        "# TYPE apmb_stage_last_seconds gauge",
+    ]
+    lines += [f'apmb_stage_last_seconds{{stage="{_label(name)}"}} {t["last_ms"] / 1000:.6f}' for name, t in totals.items()]
+
+    metrics = [
+        ('hits', 'apmb_cache_hits_total', 'counter', "Cache lookups that found an entry"),
+        ('misses', 'apmb_cache_misses_total', 'counter', "Cache lookups that missed"),
+        ('evictions', 'apmb_cache_evictions_total', 'counter', "Entries evicted from the cache"),
+        ('size', 'apmb_cache_entries', 'gauge', "Entries held by the cache"),
+        ('nbytes', 'apmb_cache_bytes', 'gauge', "Bytes held by size-bounded caches"),
+    ]
+    stats = {name: cache.stats() for name, cache in (caches or {}).items()}
+    for key, metric, kind, help_text in metrics:
+        if not stats:
+            break
+        lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} {kind}"]
+        lines += [f'{metric}{{cache="{_label(name)}"}} {s[key]}' for name, s in stats.items()]
+
+    if memory is not None:
+        lines += [
+            "# HELP apmb_dataset_bytes Deep size of the shared dataset view",
+            "# TYPE apmb_dataset_bytes gauge",
+            f"apmb_dataset_bytes {memory.dataset.get('nbytes', 0)}",
+            "# HELP apmb_sessions Sessions seen recently",
+            "# TYPE apmb_sessions gauge",
+            f"apmb_sessions {len(memory.sessions())}",
+            "# HELP apmb_session_bytes Bytes held by all sessions beyond the shared dataset",
+            "# TYPE apmb_session_bytes gauge",
+            f"apmb_session_bytes {memory.total()}",
+            "# HELP apmb_result_cache_bytes Bytes held by the shared result cache (filtered frames, results, exports)",
+            "# TYPE apmb_result_cache_bytes gauge",
+            f"apmb_result_cache_bytes {memory.results.get('nbytes', 0)}",
+        ]
+    return '\n'.join(lines) + '\n'
+
+
+def export_profile(path, profile, log, caches=None, memory=None):
+    """Append `profile` as a JSON line, or rewrite `path` in Prometheus format if it ends in .prom"""
+    if path.endswith('.prom'):
+        # Written to a temporary file and renamed, so scrapers never see a partial file
+        partial = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(partial, 'w', encoding='utf-8') as handle:
+            handle.write(prometheus_text(log, caches, memory))
+        os.replace(partial, path)
+        return
+    with open(path, 'a', encoding='utf-8') as handle:
+        handle.write(json_lines([profile]))
@@ -0,0 +1,57 @@
+"""
+Background workers for slow exports
+
+`BackgroundJobs` runs export builders (PDF reports, batch archives) on a small
+thread pool so a Streamlit rerun never waits on them. Jobs are keyed like
+cache entries; submitting a key that is already running is a no-op, and a
+finished result is handed to `on_done` (typically `LRUCache.put`) so later
+reruns - from any session - pick it up without rebuilding.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class BackgroundJobs:
+    """Keyed, de-duplicated jobs on a shared thread pool"""
+
+    def __init__(self, max_workers=2):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='apmb-export')
+        self._futures = {}
+        self._lock = threading.Lock()
+
+    def submit(self, key, build, on_done=None):
+        """Start `build()` for `key` unless it is already running"""
+        with self._lock:
+            future = self._futures.get(key)
+            if future is not None and not future.done():
+                return future
+            future = self._executor.submit(build)
+            self._futures[key] = future
+
+        def finish(done):
+            if on_done is not None and done.exception() is None:
+                on_done(key, done.result())
+            with self._lock:
+                if self._futures.get(key) is done and done.exception() is None:
+                    del self._futures[key]
+
+        future.add_done_callback(finish)
+        return future
+
+    def running(self, key):
+        """Whether a job for `key` is queued or in progress"""
+        future = self._futures.get(key)
+        return future is not None and not future.done()
+
+    def error(self, key):
+        """Exception raised by the last job for `key`, if it failed"""
+        future = self._futures.get(key)
+        if future is None or not future.done():
+            return None
+        return future.exception()
+
+    def pending(self, keys):
+        """Futures still running for any of `keys`"""
+        with self._lock:
+            return [self._futures[key] for key in keys if key in self._futures and not self._futures[key].done()]
@@ -0,0 +1,111 @@
+"""
+Single-pass KPI aggregation
+
+`compute_kpis` reads each measure column once as a NumPy view and counts the
+dimension columns with `bincount` over their categorical codes. The result
+dict carries the headline KPIs plus the risk, stage and investor-type
+breakdowns that the Executive Summary, Land, Employment and Risk Monitor tabs
+used to recompute with their own masked copies.
+
+The aggregation is split into additive sums (`kpi_sums`) and the derived KPIs
+(`kpis_from_sums`), so the rollup cube (`apmb.cube`) can produce the same
+KPIs from pre-aggregated cells.
+"""
+
+import numpy as np
+import pandas as pd
+
+# KPI name -> summed measure column
+SUM_COLUMNS = {
+    'Total_Investment': 'Investment_INR_Cr',
+    'Total_Direct_Employment': 'Direct_Employment',
+    'Total_Indirect_Employment': 'Indirect_Employment',
+    'Total_Land_Requested': 'Land_Requirement_Acres',
+    'Total_Waterfront': 'Waterfront_Requirement_Meters',
+}
+RISK_STATUSES = ['Active', 'Delayed', 'Stalled', 'Closed']
+INVESTOR_TYPES = ['Domestic', 'International']
+
+
+def float_values(series):
+    """float64 values of a measure column, NaN where missing (nullable integer counts included)"""
+    return series.to_numpy(dtype=float, na_value=np.nan)
+
+
+def category_codes(series):
+    """Integer codes (-1 for missing) and the values they refer to"""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.codes.to_numpy(), list(series.cat.categories)
+    codes, uniques = pd.factorize(series)
+    return codes, list(uniques)
+
+
+def _bincount(codes, size, weights=None):
+    """bincount that skips missing (-1) codes"""
+    present = codes >= 0
+    if weights is not None:
+        weights = weights[present]
+    return np.bincount(codes[present], weights=weights, minlength=size)
+
+
+def category_counts(series):
+    """Row count per value of a dimension column"""
+    codes, values = category_codes(series)
+    return dict(zip(values, _bincount(codes, len(values)).tolist()))
+
+
+def _observed(values, counts, always=()):
+    """Values for the `always` keys plus every key with rows present"""
+    result = {key: values.get(key, 0) for key in always}
+    result.update((key, value) for key, value in values.items() if counts[key] > 0)
+    return result
+
+
+def kpi_sums(df):
+    """Additive aggregates behind the KPIs; sums of row subsets can be combined"""
+    sums = {name: float(np.nansum(float_values(df[col]))) for name, col in SUM_COLUMNS.items()}
+
+    draft = float_values(df['Draft_Requirement_Meters'])
+    sums['Draft_Sum'] = float(np.nansum(draft))
+    sums['Draft_Count'] = int(np.count_nonzero(~np.isnan(draft)))
+    sums['Rows'] = len(df)
+
+    sums['Stage_Counts'] = category_counts(df['Current_Stage'])
+    sums['Risk_Counts'] = category_counts(df['Risk_Status'])
+
+    type_codes, types = category_codes(df['Investor_Type'])
+    investment = np.nan_to_num(float_values(df['Investment_INR_Cr']))
+    sums['Type_Counts'] = dict(zip(types, _bincount(type_codes, len(types)).tolist()))
+    sums['Investment_By_Type'] = dict(zip(types, _bincount(type_codes, len(types), investment).tolist()))
+    return sums
+
+
+def kpis_from_sums(sums):
+    """Executive KPIs and breakdowns from `kpi_sums` output"""
+    kpis = {name: sums[name] for name in SUM_COLUMNS}
+    draft_count = sums['Draft_Count']
+    kpis['Avg_Draft'] = sums['Draft_Sum'] / draft_count if draft_count else np.nan
+
+    stage_counts = sums['Stage_Counts']
+    risk_counts = sums['Risk_Counts']
+    type_counts = sums['Type_Counts']
+
+    kpis.update({
+        'MoUs_Signed': stage_counts.get('MoU Signed', 0),
+        'Active_Investors': risk_counts.get('Active', 0),
+        'Delayed_Stalled': risk_counts.get('Delayed', 0) + risk_counts.get('Stalled', 0),
+        'Domestic_Count': type_counts.get('Domestic', 0),
+        'International_Count': type_counts.get('International', 0),
+        'Total_Investors': sums['Rows'],
+        'Stage_Counts': _observed(stage_counts, stage_counts),
+        'Risk_Counts': _observed(risk_counts, risk_counts, RISK_STATUSES),
+        'Type_Counts': _observed(type_counts, type_counts, INVESTOR_TYPES),
+        'Investment_By_Type': _observed(sums['Investment_By_Type'], type_counts, INVESTOR_TYPES),
+    })
+    return kpis
+
+
+def compute_kpis(df):
+    """Executive KPIs, risk/stage/type counts and per-type sums in one pass"""
+    return kpis_from_sums(kpi_sums(df))
+
@@ -0,0 +1,105 @@
+"""
+Normalized firm -> location model
+
+`Location_Interest` holds slash-joined ports ('Dugarajapatnam/Mulapeta/Kakinada').
+The bridge table built here has one row per (firm row, port) with an integer
+location code, so per-port aggregations are a single `bincount` over codes
+instead of a groupby on composite strings.
+
+How a multi-port firm's investment, land and jobs are credited to its ports is
+set by the LOCATION_ALLOCATION setting:
+
+    equal    split evenly across the listed ports (default; totals reconcile)
+    primary  credit only the first listed port
+    full     credit every listed port in full (totals double count)
+"""
+
+import numpy as np
+import pandas as pd
+
+from .config import get_setting
+from .kpis import float_values
+
+LOCATION_COLUMN = 'Location_Interest'
+LOCATION_SEPARATOR = '/'
+ALLOCATION_RULES = ('equal', 'primary', 'full')
+
+ALLOCATION_LABELS = {
+    'equal': "Multi-location investors are split equally across their ports",
+    'primary': "Multi-location investors are credited to their first-listed port",
+    'full': "Multi-location investors are counted in full at every port",
+}
+
+
+def split_locations(series):
+    """Explode slash-joined locations into a (row position, token) series"""
+    values = pd.Series(series.to_numpy(dtype=object), dtype=object)
+    tokens = values.str.split(LOCATION_SEPARATOR).explode().str.strip()
+    return tokens[tokens.notna() & (tokens != '')]
+
+
+def get_allocation_rule():
+    """Allocation rule from the LOCATION_ALLOCATION setting"""
+    rule = str(get_setting("LOCATION_ALLOCATION", "equal")).lower()
+    if rule not in ALLOCATION_RULES:
+        raise ValueError(f"Unknown LOCATION_ALLOCATION '{rule}'. Expected one of: {', '.join(ALLOCATION_RULES)}")
+    return rule
+
+
+def build_location_bridge(df):
+    """One row per (firm row, port): row position, location code, rank and port count"""
+    tokens = split_locations(df[LOCATION_COLUMN])
+    pairs = pd.DataFrame({'row': tokens.index.to_numpy(dtype=np.int64), 'location': tokens.to_numpy()})
+    pairs = pairs.drop_duplicates(ignore_index=True)
+
+    rows = pairs['row'].to_numpy()
+    counts = np.bincount(rows, minlength=len(df))
+    return pd.DataFrame({
+        'row': rows,
+        'location': pd.Categorical(pairs['location']),
+        'rank': pairs.groupby('row').cumcount().to_numpy(),
+        'n_locations': counts[rows],
+    })
+
+
+def allocation_weights(bridge, rule):
+    """Share of each firm's values credited to each bridge row"""
+    if rule == 'equal':
+        return 1.0 / bridge['n_locations'].to_numpy()
+    if rule == 'primary':
+        return (bridge['rank'].to_numpy() == 0).astype(float)
+    if rule == 'full':
+        return np.ones(len(bridge))
+    raise ValueError(f"Unknown allocation rule '{rule}'")
+
+
+def location_totals(df, columns, bridge=None, rule=None):
+    """Sum `columns` per port under an allocation rule
+
+    `bridge` is the load-time bridge of the full dataset, in which case `df`
+    must be a row subset of that dataset with its positional index intact.
+    Without a bridge one is built for `df` on the fly.
+    """
+    rule = rule or get_allocation_rule()
+    if bridge is None:
+        bridge = build_location_bridge(df.reset_index(drop=True))
+        local = bridge['row'].to_numpy()
+    else:
+        rows = bridge['row'].to_numpy()
+        positions = df.index.to_numpy()
+        size = max(rows.max(initial=-1), positions.max(initial=-1)) + 1
+        lookup = np.full(size, -1, dtype=np.int64)
+        lookup[positions] = np.arange(len(df))
+        local = lookup[rows]
+
+    keep = local >= 0
+    local = local[keep]
+    codes = bridge['location'].cat.codes.to_numpy()[keep]
+    weights = allocation_weights(bridge, rule)[keep]
+    categories = bridge['location'].cat.categories
+
+    totals = {}
+    for col in columns:
+        values = np.nan_to_num(float_values(df[col])[local])
+        totals[col] = np.bincount(codes, weights=values * weights, minlength=len(categories))
+    return pd.DataFrame(totals, index=pd.Index(categories, name=LOCATION_COLUMN))
@@ -0,0 +1,119 @@
+"""
+Memory accounting for the shared dataset and each session's views
+
+The dashboard keeps one dataset view per version for the whole process and
+runs pandas with Copy-on-Write, so column projections and unfiltered views
+share the dataset's buffers, and a write through any of them copies instead
+of changing the shared frame. What a session adds on top is:
+
+    view    buffers of its filtered frame that the dataset doesn't own (rows
+            gathered by `take`; strings are shared references, so an object
+            column costs one pointer per row). Sessions with the same filters
+            share one frame through the result cache.
+    state   its session_state values
+
+Filtered frames, per-filter results and export bytes shared by all sessions
+live in the result cache, which is bounded by size (RESULT_CACHE_MB).
+`SessionMemory` keeps the latest figures per session, and the result cache's
+occupancy, for the admin panel.
+"""
+
+import sys
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+
+def format_bytes(n_bytes):
+    """Human-readable size, e.g. '12.3 KiB'"""
+    for unit in ('B', 'KiB', 'MiB'):
+        if n_bytes < 1024:
+            return f"{n_bytes:,.1f} {unit}"
+        n_bytes /= 1024
+    return f"{n_bytes:,.1f} GiB"
+
+
+def _buffer(series):
+    """The numpy buffer behind `series` (categorical codes for categoricals), or None"""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.array.codes
+    if isinstance(series.dtype, np.dtype):
+        # A view of the block for numpy-backed columns, never a copy
+        return np.asarray(series)
+    return None
+
+
+def owned_nbytes(df, base=None):
+    """Shallow bytes of `df`'s columns and index that don't share memory with `base`'s"""
+    shared = []
+    if base is not None:
+        shared = [buffer for buffer in (_buffer(base[col]) for col in base.columns) if buffer is not None]
+    total = 0 if isinstance(df.index, pd.RangeIndex) else int(df.index.nbytes)
+    for col in df.columns:
+        series = df[col]
+        buffer = _buffer(series)
+        if buffer is None:
+            total += int(series.memory_usage(index=False))
+        elif not any(np.may_share_memory(buffer, other) for other in shared):
+            total += int(buffer.nbytes)
+    return total
+
+
+def object_nbytes(value):
+    """Approximate shallow size of a session_state value or cached result"""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return int(np.sum(value.memory_usage(index=True)))
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(object_nbytes(k) + object_nbytes(v) for k, v in value.items())
+    if isinstance(value, (set, frozenset, list, tuple)):
+        return sys.getsizeof(value) + sum(object_nbytes(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class SessionMemory:
+    """Thread-safe latest memory figures per session; sessions unseen for `max_age` seconds are dropped"""
+
+    def __init__(self, max_age=1800):
+        self.max_age = max_age
+        self.dataset = {}
+        self.results = {}
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def record_dataset(self, version, nbytes):
+        """Deep size of the shared dataset view of `version` (only the latest is kept)"""
+        with self._lock:
+            self.dataset = {'version': version, 'nbytes': nbytes}
+
+    def record_results(self, nbytes, maxbytes):
+        """Bytes held by the shared result cache and its budget"""
+        with self._lock:
+            self.results = {'nbytes': nbytes, 'maxbytes': maxbytes}
+
+    def record(self, session_id, view_key, view_bytes, state_bytes):
+        """Latest figures for one session; `view_key` identifies frames shared across sessions"""
+        now = time.time()
+        with self._lock:
+            self._sessions[session_id] = {
+                'view_key': view_key,
+                'view_bytes': view_bytes,
+                'state_bytes': state_bytes,
+                'seen': now,
+            }
+            for stale in [sid for sid, entry in self._sessions.items() if now - entry['seen'] > self.max_age]:
+                del self._sessions[stale]
+
+    def sessions(self):
+        """{session id: figures} of the live sessions"""
+        with self._lock:
+            return {sid: dict(entry) for sid, entry in self._sessions.items()}
+
+    def total(self):
+        """Bytes held for all sessions, counting each shared view once"""
+        sessions = self.sessions()
+        views = {entry['view_key']: entry['view_bytes'] for entry in sessions.values()}
+        return sum(views.values()) + sum(entry['state_bytes'] for entry in sessions.values())
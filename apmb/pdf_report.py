@@ -0,0 +1,243 @@
+"""
+Native PDF executive summary
+
+Renders the same KPI tiles and summary tables as `apmb.report` straight to PDF
+with fpdf2 (pure Python, works offline). fpdf2 is an optional dependency and
+is only imported when a PDF is built; `pdf_available()` lets the UI hide the
+PDF exports when it is missing.
+
+The built-in PDF fonts are Latin-1 only, so the rupee sign is written as
+"INR" and any other unsupported character is replaced.
+"""
+
+import importlib.util
+import io
+import re
+import zipfile
+from datetime import datetime
+
+import numpy as np
+
+from .kpis import compute_kpis
+from .locations import build_location_bridge
+from .report import (
+    format_number, format_percent, kpi_tiles, location_count, risk_breakdown,
+    top_investors, top_locations, type_distribution
+)
+
+# Palette shared with the HTML report
+NAVY = (30, 58, 138)
+ACCENT = (102, 126, 234)
+MUTED = (100, 116, 139)
+TEXT = (30, 41, 59)
+TILE = (248, 250, 252)
+RULE = (226, 232, 240)
+RISK_TEXT = {
+    'Active': (16, 185, 129),
+    'Delayed': (245, 158, 11),
+    'Stalled': (239, 68, 68),
+    'Closed': (107, 114, 128),
+}
+
+BATCH_GROUPS = ('location', 'investor')
+
+
+def pdf_available():
+    """Whether the optional fpdf2 dependency is installed"""
+    return importlib.util.find_spec('fpdf') is not None
+
+
+def _latin1(text):
+    """Text the core PDF fonts can draw"""
+    text = str(text).replace('₹', 'INR ')
+    return text.encode('latin-1', 'replace').decode('latin-1')
+
+
+def _crore(series):
+    return format_number(series, prefix='INR ', suffix=' Cr', missing='-')
+
+
+def _new_document(title, subtitle):
+    from fpdf import FPDF
+
+    class SummaryPDF(FPDF):
+        def header(self):
+            self.set_fill_color(*NAVY)
+            self.set_text_color(255, 255, 255)
+            self.set_font('Helvetica', 'B', 18)
+            self.cell(0, 12, _latin1(title), align='C', fill=True, new_x='LMARGIN', new_y='NEXT')
+            self.set_font('Helvetica', '', 10)
+            self.cell(0, 8, _latin1(subtitle), align='C', fill=True, new_x='LMARGIN', new_y='NEXT')
+            self.ln(6)
+            self.set_text_color(*TEXT)
+
+        def footer(self):
+            self.set_y(-15)
+            self.set_font('Helvetica', '', 8)
+            self.set_text_color(*MUTED)
+            self.cell(
+                0, 5,
+                f"AP Maritime Strategic Dashboard | Confidential - For Internal Use Only | Page {self.page_no()}",
+                align='C'
+            )
+
+    pdf = SummaryPDF(format='A4')
+    pdf.set_title(_latin1(title))
+    pdf.set_author('Andhra Pradesh Maritime Board')
+    pdf.set_auto_page_break(True, margin=20)
+    pdf.add_page()
+    return pdf
+
+
+def _section(pdf, title):
+    pdf.ln(4)
+    pdf.set_font('Helvetica', 'B', 13)
+    pdf.set_text_color(*NAVY)
+    pdf.cell(0, 8, _latin1(title), new_x='LMARGIN', new_y='NEXT')
+    pdf.set_draw_color(*ACCENT)
+    pdf.set_line_width(0.8)
+    pdf.line(pdf.l_margin, pdf.get_y(), pdf.w - pdf.r_margin, pdf.get_y())
+    pdf.ln(3)
+    pdf.set_text_color(*TEXT)
+
+
+def _kpi_grid(pdf, kpis):
+    width = (pdf.w - pdf.l_margin - pdf.r_margin) / 3
+    for start in range(0, 6, 3):
+        y = pdf.get_y()
+        for offset, (value, label) in enumerate(kpi_tiles(kpis, currency='INR ')[start:start + 3]):
+            x = pdf.l_margin + offset * width
+            pdf.set_fill_color(*TILE)
+            pdf.rect(x + 1, y, width - 2, 20, style='F')
+            pdf.set_fill_color(*ACCENT)
+            pdf.rect(x + 1, y, 1.2, 20, style='F')
+            pdf.set_xy(x + 4, y + 2)
+            pdf.set_font('Helvetica', 'B', 14)
+            pdf.set_text_color(*ACCENT)
+            pdf.cell(width - 6, 9, _latin1(value))
+            pdf.set_xy(x + 4, y + 11)
+            pdf.set_font('Helvetica', '', 8)
+            pdf.set_text_color(*MUTED)
+            pdf.cell(width - 6, 6, label.upper())
+        pdf.set_xy(pdf.l_margin, y + 23)
+    pdf.set_text_color(*TEXT)
+
+
+def _table(pdf, headers, columns, widths, row_colors=None):
+    """Header row plus one row per element of the aligned string `columns`"""
+    usable = pdf.w - pdf.l_margin - pdf.r_margin
+    widths = [usable * share for share in widths]
+
+    pdf.set_font('Helvetica', 'B', 10)
+    pdf.set_fill_color(*ACCENT)
+    pdf.set_text_color(255, 255, 255)
+    for header, width in zip(headers, widths):
+        pdf.cell(width, 8, _latin1(header), fill=True)
+    pdf.ln()
+
+    pdf.set_font('Helvetica', '', 10)
+    pdf.set_draw_color(*RULE)
+    pdf.set_line_width(0.2)
+    cells = [column.to_numpy(dtype=object) for column in columns]
+    for i in range(len(cells[0]) if cells else 0):
+        for j, (column, width) in enumerate(zip(cells, widths)):
+            color = row_colors[i] if (j == 0 and row_colors is not None) else TEXT
+            pdf.set_text_color(*color)
+            pdf.cell(width, 7, _latin1(column[i]), border='B')
+        pdf.ln()
+    pdf.set_text_color(*TEXT)
+
+
+def build_executive_summary_pdf(df, kpis=None, bridge=None, title="APMB Investor Dashboard"):
+    """Executive summary of `df` as PDF bytes"""
+    kpis = compute_kpis(df) if kpis is None else kpis
+    current_date = datetime.now().strftime('%B %d, %Y')
+    pdf = _new_document(title, f"Executive Summary Report | {current_date}")
+
+    _kpi_grid(pdf, kpis)
+
+    _section(pdf, "Key Investor Highlights")
+    pdf.set_font('Helvetica', '', 10)
+    pdf.multi_cell(
+        0, 6,
+        f"Portfolio Overview: Tracking {len(df)} investors across {location_count(df)} "
+        "locations in Andhra Pradesh maritime sector.",
+        new_x='LMARGIN', new_y='NEXT'
+    )
+
+    investors = top_investors(df)
+    _section(pdf, "Top 5 Investors by Investment")
+    _table(
+        pdf, ["Firm Name", "Investment (INR Cr)", "Current Stage"],
+        [investors['Firm_Name'].astype(str), _crore(investors['Investment_INR_Cr']),
+         investors['Current_Stage'].astype(str)],
+        [0.5, 0.25, 0.25]
+    )
+
+    risk = risk_breakdown(kpis)
+    _section(pdf, "Risk Status Breakdown")
+    _table(
+        pdf, ["Status", "Count", "Percentage"],
+        [risk['Risk_Status'].astype(str), risk['Count'].astype(str), format_percent(risk['Percentage'])],
+        [0.5, 0.25, 0.25],
+        row_colors=[RISK_TEXT.get(status, TEXT) for status in risk['Risk_Status']]
+    )
+
+    locations = top_locations(df, bridge)
+    _section(pdf, "Top 5 Locations by Investment")
+    _table(
+        pdf, ["Location", "Investment (INR Cr)"],
+        [locations['Location'].astype(str), _crore(locations['Investment_INR_Cr'])],
+        [0.6, 0.4]
+    )
+
+    types = type_distribution(kpis)
+    _section(pdf, "Investor Type Distribution")
+    _table(
+        pdf, ["Type", "Count", "Percentage"],
+        [types['Type'], types['Count'].astype(str), format_percent(types['Percentage'])],
+        [0.5, 0.25, 0.25]
+    )
+
+    return bytes(pdf.output())
+
+
+def _slug(name):
+    return re.sub(r'[^A-Za-z0-9]+', '_', str(name)).strip('_') or 'unnamed'
+
+
+def iter_batch_groups(df, by, bridge=None):
+    """(name, rows) for each port or each investor in `df`
+
+    With a `bridge` (from the full dataset), `df.index` must be the master row
+    positions, as for `location_totals`.
+    """
+    if by == 'investor':
+        for name, rows in df.groupby('Firm_Name', sort=True, observed=True):
+            yield name, rows
+        return
+    if by != 'location':
+        raise ValueError(f"Unknown batch grouping '{by}'. Expected one of: {', '.join(BATCH_GROUPS)}")
+
+    if bridge is None:
+        df = df.reset_index(drop=True)
+        bridge = build_location_bridge(df)
+    pairs = bridge[np.isin(bridge['row'].to_numpy(), df.index.to_numpy())]
+    for name, rows in pairs.groupby('location', sort=True, observed=True)['row']:
+        yield name, df.loc[rows.to_numpy()]
+
+
+def build_batch_zip(df, by='location', bridge=None):
+    """Zip archive with one executive summary PDF per port or per investor"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        used = set()
+        for name, rows in iter_batch_groups(df, by, bridge):
+            title = f"{name} - Investor Summary" if by == 'location' else str(name)
+            pdf = build_executive_summary_pdf(rows, bridge=bridge, title=title)
+            slug = base = _slug(name)
+            while slug in used:
+                slug = f"{base}_{len(used)}"
+            used.add(slug)
+            archive.writestr(f"{by}/{slug}.pdf", pdf)
+    return buffer.getvalue()
@@ -0,0 +1,169 @@
+"""
+Combined query plan for the sidebar filters
+
+Multi-value filters on the indexed dimensions (IN predicates) and numeric
+range filters (BETWEEN predicates) are compiled into one plan. Every
+predicate's cardinality is known up front without touching the rows:
+
+    IN       summed bitmap counts of the chosen values (`FilterIndex`)
+    BETWEEN  distance between two `searchsorted` bounds in the presorted
+             column (`SortedColumns`)
+
+The most selective predicate runs first and produces the candidate row
+positions; each further predicate is only evaluated on the surviving
+candidates (a bitmap gather or a value comparison), so adding filters makes
+a rerun cheaper, not slower.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from .kpis import float_values
+
+RANGE_COLUMNS = ['Investment_INR_Cr', 'Land_Requirement_Acres', 'Draft_Requirement_Meters', 'Days_Since_Activity']
+RANGE_LABELS = {
+    'Investment_INR_Cr': "Investment (₹ Cr)",
+    'Land_Requirement_Acres': "Land (Acres)",
+    'Draft_Requirement_Meters': "Draft (m)",
+    'Days_Since_Activity': "Days Since Activity",
+}
+
+# kind is 'in' (operand: tuple of values) or 'range' (operand: (low, high))
+Predicate = namedtuple('Predicate', ['column', 'kind', 'operand', 'estimate'])
+
+
+class SortedColumns:
+    """Live rows of the range columns presorted by value (missing values left out)"""
+
+    def __init__(self, n_rows, values, orders, sorted_values, integral):
+        self.n_rows = n_rows
+        self.values = values
+        self.orders = orders
+        self.sorted_values = sorted_values
+        self.integral = integral
+
+    @classmethod
+    def build(cls, df, columns=RANGE_COLUMNS, live=None):
+        """Sort each of `columns` once (row positions are `df`'s positions)"""
+        values, orders, sorted_values, integral = {}, {}, {}, {}
+        for col in columns:
+            if col not in df:
+                continue
+            column = float_values(df[col])
+            present = ~np.isnan(column)
+            if live is not None:
+                present &= live
+            positions = np.flatnonzero(present)
+            order = positions[np.argsort(column[positions], kind='stable')]
+            values[col], orders[col], sorted_values[col] = column, order, column[order]
+            integral[col] = bool(np.all(np.mod(sorted_values[col], 1) == 0))
+        return cls(len(df), values, orders, sorted_values, integral)
+
+    def extend(self, df, live=None):
+        """Sorted columns of `df`, whose leading rows are this one's frame, with its appended rows merged in
+
+        Only the appended rows are sorted; rows no longer `live` are dropped.
+        """
+        added = SortedColumns.build(
+            df.iloc[self.n_rows:], columns=list(self.orders), live=None if live is None else live[self.n_rows:]
+        )
+        values, orders, sorted_values, integral = {}, {}, {}, {}
+        for col, order in self.orders.items():
+            ordered = self.sorted_values[col]
+            if live is not None:
+                kept = live[order]
+                order, ordered = order[kept], ordered[kept]
+            # Appended rows go after equal values, as a stable sort of all positions would put them
+            at = np.searchsorted(ordered, added.sorted_values[col], 'right')
+            orders[col] = np.insert(order, at, added.orders[col] + self.n_rows)
+            sorted_values[col] = np.insert(ordered, at, added.sorted_values[col])
+            values[col] = np.concatenate([self.values[col], added.values[col]])
+            integral[col] = bool(np.all(np.mod(sorted_values[col], 1) == 0))
+        return SortedColumns(len(df), values, orders, sorted_values, integral)
+
+    def bounds(self, column):
+        """(min, max) of the column's live values (ints for whole-number columns), or None"""
+        ordered = self.sorted_values[column]
+        if not len(ordered):
+            return None
+        kind = int if self.integral[column] else float
+        return kind(ordered[0]), kind(ordered[-1])
+
+    def span(self, column, low, high):
+        """(start, stop) of the rows with low <= value <= high in sorted order"""
+        ordered = self.sorted_values[column]
+        return int(np.searchsorted(ordered, low, 'left')), int(np.searchsorted(ordered, high, 'right'))
+
+
+def plan_query(filter_index, sorted_columns, selections, ranges):
+    """Predicates for {column: values} and {column: (low, high)}, cheapest first
+
+    Empty selections (or 'All') and missing ranges are dropped.
+    """
+    predicates = []
+    for column, chosen in selections.items():
+        if chosen is None or chosen == 'All' or not len(chosen):
+            continue
+        chosen = (chosen,) if isinstance(chosen, str) else tuple(chosen)
+        counts = filter_index.counts(column)
+        estimate = sum(counts.get(value, 0) for value in chosen)
+        predicates.append(Predicate(column, 'in', chosen, estimate))
+    for column, bounds in ranges.items():
+        if bounds is None:
+            continue
+        start, stop = sorted_columns.span(column, *bounds)
+        predicates.append(Predicate(column, 'range', tuple(bounds), stop - start))
+    return sorted(predicates, key=lambda predicate: predicate.estimate)
+
+
+def _candidates(predicate, filter_index, sorted_columns):
+    """Row positions (ascending) matching the plan's first predicate"""
+    if predicate.kind == 'in':
+        bitmaps = [filter_index.bitmaps[predicate.column].get(value) for value in predicate.operand]
+        bitmaps = [bitmap for bitmap in bitmaps if bitmap is not None]
+        if not bitmaps:
+            return np.zeros(0, dtype=np.int64)
+        return np.flatnonzero(np.logical_or.reduce(bitmaps))
+    start, stop = sorted_columns.span(predicate.column, *predicate.operand)
+    return np.sort(sorted_columns.orders[predicate.column][start:stop])
+
+
+def _keep(predicate, candidates, filter_index, sorted_columns):
+    """Which of `candidates` also match `predicate`"""
+    if predicate.kind == 'in':
+        keep = np.zeros(len(candidates), dtype=bool)
+        for value in predicate.operand:
+            bitmap = filter_index.bitmaps[predicate.column].get(value)
+            if bitmap is not None:
+                keep |= bitmap[candidates]
+        return keep
+    low, high = predicate.operand
+    values = sorted_columns.values[predicate.column][candidates]
+    with np.errstate(invalid='ignore'):
+        return (values >= low) & (values <= high)
+
+
+def run_query(plan, filter_index, sorted_columns):
+    """Row positions (ascending) matching every predicate
+
+    None when nothing is filtered and every row is live. Tombstoned rows never
+    match: bitmaps and sorted columns only hold live rows.
+    """
+    if not plan:
+        return None if filter_index.live is None else np.flatnonzero(filter_index.live)
+    candidates = _candidates(plan[0], filter_index, sorted_columns)
+    for predicate in plan[1:]:
+        if not len(candidates):
+            break
+        candidates = candidates[_keep(predicate, candidates, filter_index, sorted_columns)]
+    return candidates
+
+
+def positions_mask(positions, n_rows):
+    """Boolean row mask for `positions` (None, meaning every row, stays None)"""
+    if positions is None:
+        return None
+    mask = np.zeros(n_rows, dtype=bool)
+    mask[positions] = True
+    return mask
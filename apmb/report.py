@@ -0,0 +1,409 @@
+"""
+Executive summary report renderer
+
+The report is assembled from `string.Template` fragments yielded by
+`iter_executive_summary_html`, and joined once at the end. Table bodies are
+rendered from pre-formatted, HTML-escaped string columns in slices of
+`ROW_CHUNK` rows, so building a report over thousands of investors (e.g. with
+the full investor appendix) is linear in the row count and never re-copies
+the document.
+"""
+
+import html
+from datetime import datetime
+from string import Template
+
+import numpy as np
+import pandas as pd
+
+from .locations import location_totals, split_locations
+
+# Table rows rendered (and yielded) per fragment
+ROW_CHUNK = 1_000
+
+STYLE = """\
+    @page {
+        size: A4;
+        margin: 2cm;
+    }
+    body {
+        font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+        line-height: 1.6;
+        color: #1e293b;
+        max-width: 210mm;
+        margin: 0 auto;
+        background: white;
+    }
+    .header {
+        background: linear-gradient(135deg, #1e3a8a 0%, #3b82f6 100%);
+        color: white;
+        padding: 2rem;
+        text-align: center;
+        border-radius: 8px;
+        margin-bottom: 2rem;
+    }
+    .header h1 {
+        margin: 0;
+        font-size: 2rem;
+        font-weight: 700;
+    }
+    .header p {
+        margin: 0.5rem 0 0 0;
+        opacity: 0.9;
+        font-size: 1rem;
+    }
+    .kpi-grid {
+        display: grid;
+        grid-template-columns: repeat(3, 1fr);
+        gap: 1rem;
+        margin: 2rem 0;
+    }
+    .kpi-box {
+        background: #f8fafc;
+        border-left: 4px solid #667eea;
+        padding: 1.5rem;
+        border-radius: 8px;
+    }
+    .kpi-box h3 {
+        margin: 0;
+        font-size: 2rem;
+        color: #667eea;
+        font-weight: 700;
+    }
+    .kpi-box p {
+        margin: 0.5rem 0 0 0;
+        color: #64748b;
+        font-size: 0.9rem;
+        text-transform: uppercase;
+        letter-spacing: 1px;
+    }
+    .section {
+        margin: 2rem 0;
+        page-break-inside: avoid;
+    }
+    .section h2 {
+        color: #1e3a8a;
+        border-bottom: 3px solid #667eea;
+        padding-bottom: 0.5rem;
+        margin-bottom: 1rem;
+        font-size: 1.5rem;
+    }
+    table {
+        width: 100%;
+        border-collapse: collapse;
+        margin: 1rem 0;
+        background: white;
+    }
+    th {
+        background: #667eea;
+        color: white;
+        padding: 0.75rem;
+        text-align: left;
+        font-weight: 600;
+    }
+    td {
+        padding: 0.75rem;
+        border-bottom: 1px solid #e2e8f0;
+    }
+    tr:hover {
+        background: #f8fafc;
+    }
+    .status-active { color: #10b981; font-weight: 600; }
+    .status-delayed { color: #f59e0b; font-weight: 600; }
+    .status-stalled { color: #ef4444; font-weight: 600; }
+    .status-closed { color: #6b7280; font-weight: 600; }
+    .footer {
+        margin-top: 3rem;
+        padding-top: 2rem;
+        border-top: 2px solid #e2e8f0;
+        text-align: center;
+        color: #64748b;
+        font-size: 0.9rem;
+    }
+    .footer-brand {
+        font-size: 1.2rem;
+        font-weight: 700;
+        color: #1e3a8a;
+        margin-bottom: 0.5rem;
+    }
+    .highlight-box {
+        background: #fef3c7;
+        border-left: 4px solid #f59e0b;
+        padding: 1rem;
+        margin: 1rem 0;
+        border-radius: 4px;
+    }
+"""
+
+_DOCUMENT_OPEN = Template("""\
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>APMB Executive Summary | $date</title>
+    <style>
+$style    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>🚢 APMB Investor Dashboard</h1>
+        <p>Executive Summary Report | $date</p>
+    </div>
+""")
+
+_KPI_BOX = Template("""\
+        <div class="kpi-box">
+            <h3>$value</h3>
+            <p>$label</p>
+        </div>
+""")
+
+_HIGHLIGHTS = Template("""\
+    <div class="section">
+        <h2>📊 Key Investor Highlights</h2>
+        <div class="highlight-box">
+            <strong>Portfolio Overview:</strong> Tracking $investors investors across
+            $locations locations in Andhra Pradesh maritime sector.
+        </div>
+    </div>
+""")
+
+_TABLE_OPEN = Template("""\
+    <div class="section">
+        <h2>$title</h2>
+        <table>
+            <tr>$headers</tr>
+""")
+
+_TABLE_CLOSE = """\
+        </table>
+    </div>
+"""
+
+_FOOTER = Template("""\
+    <div class="footer">
+        <div class="footer-brand">AP Maritime Strategic Dashboard</div>
+        <p>Andhra Pradesh Maritime Board | Government of Andhra Pradesh</p>
+        <p style="font-size: 0.8rem; margin-top: 1rem;">
+            Generated on $date | Confidential - For Internal Use Only
+        </p>
+    </div>
+</body>
+</html>
+""")
+
+# Full investor appendix: column -> header
+APPENDIX_COLUMNS = {
+    'Firm_Name': 'Firm Name',
+    'Investor_Type': 'Type',
+    'Location_Interest': 'Location(s)',
+    'Current_Stage': 'Current Stage',
+    'Risk_Status': 'Risk Status',
+    'Investment_INR_Cr': 'Investment (₹ Cr)',
+    'Land_Requirement_Acres': 'Land (Acres)',
+    'Direct_Employment': 'Direct Jobs',
+    'Next_Action': 'Next Action',
+}
+
+
+def escape_column(series):
+    """Series as HTML-escaped strings (missing values become empty)
+
+    Each distinct value is escaped once, then broadcast back by its code.
+    """
+    codes, uniques = pd.factorize(series)
+    escaped = np.array([html.escape(str(value), quote=True) for value in uniques] + [''], dtype=object)
+    return pd.Series(escaped[codes], index=series.index)
+
+
+def format_number(series, prefix='', suffix='', missing='—'):
+    """Series of numbers as thousands-separated strings"""
+    values = pd.to_numeric(series, errors='coerce').astype(float)
+    text = prefix + values.map('{:,.0f}'.format).astype(object) + suffix
+    return text.where(values.notna(), missing)
+
+
+def format_crore(series):
+    """Series of ₹ crore amounts as display strings"""
+    return format_number(series, prefix='₹', suffix=' Cr')
+
+
+def format_percent(series):
+    """Series of percentages as one-decimal strings"""
+    return series.map('{:.1f}%'.format).astype(object)
+
+
+def _share(counts, total):
+    """Percentage of `total` for each count (0 when `total` is 0)"""
+    counts = pd.Series(counts, dtype='int64')
+    return counts * (100.0 / total) if total else counts * 0.0
+
+
+# Summary tables shared by the HTML and PDF reports
+
+def top_investors(df, n=5):
+    """The `n` largest investments"""
+    return df[df['Investment_INR_Cr'].notna()].nlargest(n, 'Investment_INR_Cr')
+
+
+def risk_breakdown(kpis):
+    """Risk statuses with investors, largest first: Risk_Status, Count, Percentage"""
+    counts = pd.Series(kpis['Risk_Counts'], dtype='int64')
+    counts = counts[counts > 0].sort_values(ascending=False, kind='stable')
+    return pd.DataFrame({
+        'Risk_Status': counts.index,
+        'Count': counts.to_numpy(),
+        'Percentage': _share(counts, kpis['Total_Investors']).to_numpy(),
+    })
+
+
+def top_locations(df, bridge=None, n=5):
+    """Ports with the most investment under the allocation rule: Location, Investment_INR_Cr"""
+    totals = location_totals(df, ['Investment_INR_Cr'], bridge)['Investment_INR_Cr']
+    totals = totals[totals > 0].sort_values(ascending=False).head(n)
+    return totals.rename_axis('Location').reset_index()
+
+
+def type_distribution(kpis):
+    """Domestic vs international investors: Type, Count, Percentage"""
+    counts = pd.Series([kpis['Domestic_Count'], kpis['International_Count']], dtype='int64')
+    return pd.DataFrame({
+        'Type': ['Domestic', 'International'],
+        'Count': counts.to_numpy(),
+        'Percentage': _share(counts, counts.sum()).to_numpy(),
+    })
+
+
+def kpi_tiles(kpis, currency='₹'):
+    """(value, label) pairs for the headline KPI grid"""
+    return [
+        (f"{currency}{kpis['Total_Investment']:,.0f} Cr", "Total Investment"),
+        (f"{kpis['Total_Direct_Employment']:,.0f}", "Direct Jobs"),
+        (f"{kpis['Total_Indirect_Employment']:,.0f}", "Indirect Jobs"),
+        (f"{kpis['Active_Investors']}", "Active Investors"),
+        (f"{kpis['MoUs_Signed']}", "MoUs Signed"),
+        (f"{kpis['Total_Land_Requested']:,.0f}", "Acres Required"),
+    ]
+
+
+def location_count(df):
+    """Distinct ports named in `df`"""
+    return split_locations(df['Location_Interest']).nunique()
+
+
+def _header_cells(headers):
+    return ''.join(f"<th>{header}</th>" for header in headers)
+
+
+def render_rows(cells, first_class=None):
+    """Vectorized `<tr>` markup for aligned string columns (one row per element)"""
+    first = cells[0]
+    if first_class is None:
+        rows = '                <tr><td>' + first
+    else:
+        rows = '                <tr><td class="' + first_class + '">' + first
+    for column in cells[1:]:
+        rows = rows + '</td><td>' + column
+    return '\n'.join(rows + '</td></tr>') + '\n'
+
+
+def _table(title, headers, frame, format_cells, first_class=None):
+    """Yield a section table, rendering its body `ROW_CHUNK` rows at a time"""
+    yield _TABLE_OPEN.substitute(title=title, headers=_header_cells(headers))
+    for start in range(0, len(frame), ROW_CHUNK):
+        chunk = frame.iloc[start:start + ROW_CHUNK]
+        cells = [column.to_numpy(dtype=object) for column in format_cells(chunk)]
+        classes = first_class(chunk).to_numpy(dtype=object) if first_class else None
+        yield render_rows(cells, classes)
+    yield _TABLE_CLOSE
+
+
+def _status_class(risk):
+    return 'status-' + escape_column(risk).str.lower()
+
+
+def iter_executive_summary_html(df, kpis, include_appendix=False, bridge=None):
+    """Yield the executive summary HTML document fragment by fragment"""
+    current_date = datetime.now().strftime('%B %d, %Y')
+    total_count = len(df)
+
+    yield _DOCUMENT_OPEN.substitute(date=current_date, style=STYLE)
+
+    # Headline KPIs
+    yield '    <div class="kpi-grid">\n'
+    for value, label in kpi_tiles(kpis):
+        yield _KPI_BOX.substitute(value=value, label=label)
+    yield '    </div>\n'
+
+    yield _HIGHLIGHTS.substitute(investors=total_count, locations=location_count(df))
+
+    yield from _table(
+        "💰 Top 5 Investors by Investment",
+        ["Firm Name", "Investment (₹ Cr)", "Current Stage"],
+        top_investors(df),
+        lambda rows: [
+            escape_column(rows['Firm_Name']),
+            format_crore(rows['Investment_INR_Cr']),
+            escape_column(rows['Current_Stage']),
+        ]
+    )
+
+    yield from _table(
+        "⚠️ Risk Status Breakdown",
+        ["Status", "Count", "Percentage"],
+        risk_breakdown(kpis),
+        lambda rows: [
+            escape_column(rows['Risk_Status']),
+            rows['Count'].astype(str),
+            format_percent(rows['Percentage']),
+        ],
+        first_class=lambda rows: _status_class(rows['Risk_Status'])
+    )
+
+    # Location breakdown (per port, using the configured allocation rule)
+    yield from _table(
+        "📍 Top 5 Locations by Investment",
+        ["Location", "Investment (₹ Cr)"],
+        top_locations(df, bridge),
+        lambda rows: [escape_column(rows['Location']), format_crore(rows['Investment_INR_Cr'])]
+    )
+
+    yield from _table(
+        "🌍 Investor Type Distribution",
+        ["Type", "Count", "Percentage"],
+        type_distribution(kpis),
+        lambda rows: [
+            rows['Type'],
+            rows['Count'].astype(str),
+            format_percent(rows['Percentage']),
+        ]
+    )
+
+    if include_appendix:
+        appendix = df.sort_values('Investment_INR_Cr', ascending=False, na_position='last', kind='stable')
+        yield from _table(
+            f"📋 Investor Appendix ({total_count} investors)",
+            list(APPENDIX_COLUMNS.values()),
+            appendix,
+            _appendix_cells
+        )
+
+    yield _FOOTER.substitute(date=current_date)
+
+
+def _appendix_cells(rows):
+    """Display columns for the full investor appendix"""
+    cells = []
+    for col in APPENDIX_COLUMNS:
+        if col == 'Investment_INR_Cr':
+            cells.append(format_crore(rows[col]))
+        elif col in ('Land_Requirement_Acres', 'Direct_Employment'):
+            cells.append(format_number(rows[col]))
+        else:
+            cells.append(escape_column(rows[col]))
+    return cells
+
+
+def generate_executive_summary_html(df, kpis, include_appendix=False, bridge=None):
+    """Executive summary HTML document (open in a browser and print to PDF)"""
+    return ''.join(iter_executive_summary_html(df, kpis, include_appendix, bridge))
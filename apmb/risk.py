@@ -0,0 +1,195 @@
+"""
+Vectorized risk scoring
+
+Every investor gets a 0-100 `Risk_Score` and a derived `Risk_Status` from five
+factors, each scaled to 0 (no risk) .. 1 (full risk):
+
+    recency      days since the last activity, ramping over RECENCY_DAYS
+    stage        how exposed the current pipeline stage is (STAGE_RISK)
+    stage_age    days in the current stage, ramping over STAGE_AGE_DAYS
+    missing_dpr  a DPR is due (DPR_STAGES or a DPR next action) but none is logged
+    next_action  the category of the Next_Action text (NEXT_ACTION_RULES)
+
+The score is the weighted mean of the factors (RISK_WEIGHTS) and the status
+follows RISK_THRESHOLDS; declined firms and archived follow-ups are Closed.
+It replaces the typed-in status only with RISK_STATUS_SOURCE = "engine".
+
+Dimension lookups go through categorical codes and the Next_Action rules are
+matched once per distinct text, so scoring is a handful of array operations
+regardless of portfolio size.
+"""
+
+import json
+import re
+
+import numpy as np
+import pandas as pd
+
+from .config import get_setting
+from .kpis import RISK_STATUSES, category_codes
+
+RISK_FACTORS = ('recency', 'stage', 'stage_age', 'missing_dpr', 'next_action')
+DEFAULT_WEIGHTS = {
+    'recency': 0.35,
+    'stage': 0.20,
+    'stage_age': 0.15,
+    'missing_dpr': 0.15,
+    'next_action': 0.15,
+}
+# Minimum score for each status (below Delayed is Active)
+DEFAULT_THRESHOLDS = {'Delayed': 35, 'Stalled': 65}
+RISK_STATUS_SOURCES = ('engine', 'manual')
+
+# No risk at or below the first bound, full risk at or above the second
+RECENCY_DAYS = (30, 120)
+STAGE_AGE_DAYS = (60, 180)
+
+STAGE_RISK = {
+    'MoU Signed': 0.0,
+    'Land Allotted': 0.1,
+    'Site Visit Complete': 0.3,
+    'High-Level Meeting': 0.3,
+    'EOI Submitted': 0.4,
+    'Early Discussion': 0.5,
+    'DPR Pending': 0.6,
+    'Inactive': 1.0,
+    'Declined': 1.0,
+}
+DEFAULT_STAGE_RISK = 0.5
+CLOSED_STAGES = ('Declined',)
+DPR_STAGES = ('EOI Submitted', 'DPR Pending')
+
+# (category, pattern, risk) - the first matching pattern wins; None marks closed
+NEXT_ACTION_RULES = [
+    ('archive', r'archiv', None),
+    ('re_engagement', r're-?engage', 1.0),
+    ('awaiting_response', r'awaiting|no response', 0.7),
+    ('dpr', r'\bdpr\b', 0.6),
+    ('follow_up', r'follow|schedule|meeting|reminder', 0.3),
+    ('proposal', r'proposal|finali[sz]', 0.3),
+    ('rfp', r'\brfp\b|tender|bid', 0.1),
+    ('implementation', r'implement|construction|operation', 0.0),
+]
+DEFAULT_ACTION_RISK = 0.4
+
+_ACTION_PATTERNS = [(name, re.compile(pattern, re.IGNORECASE), risk) for name, pattern, risk in NEXT_ACTION_RULES]
+
+
+def _mapping_setting(name, defaults):
+    """Dict setting (TOML table, or JSON text from the environment) merged over defaults"""
+    value = get_setting(name)
+    if not value:
+        return dict(defaults)
+    if isinstance(value, str):
+        value = json.loads(value)
+    unknown = set(value) - set(defaults)
+    if unknown:
+        raise ValueError(f"Unknown {name} keys: {', '.join(sorted(unknown))}. Expected: {', '.join(defaults)}")
+    merged = dict(defaults)
+    merged.update({key: float(amount) for key, amount in value.items()})
+    return merged
+
+
+def get_risk_weights():
+    """Factor weights from the RISK_WEIGHTS setting"""
+    return _mapping_setting("RISK_WEIGHTS", DEFAULT_WEIGHTS)
+
+
+def get_risk_thresholds():
+    """Status thresholds from the RISK_THRESHOLDS setting"""
+    return _mapping_setting("RISK_THRESHOLDS", DEFAULT_THRESHOLDS)
+
+
+def get_risk_status_source():
+    """Whether Risk_Status comes from the engine or the typed-in labels (RISK_STATUS_SOURCE)"""
+    # Opt-in: recency is measured at AS_OF_DATE (default today), so the engine rates a stale extract as all Stalled
+    source = str(get_setting("RISK_STATUS_SOURCE", "manual")).lower()
+    if source not in RISK_STATUS_SOURCES:
+        raise ValueError(f"Unknown RISK_STATUS_SOURCE '{source}'. Expected one of: {', '.join(RISK_STATUS_SOURCES)}")
+    return source
+
+
+def _ramp(days, bounds):
+    """0 at or below bounds[0], 1 at or above bounds[1]; unknown days count as 1"""
+    low, high = bounds
+    scaled = (np.asarray(days, dtype=float) - low) / (high - low)
+    return np.clip(np.nan_to_num(scaled, nan=1.0), 0.0, 1.0)
+
+
+def _per_value(series, score, default):
+    """Score each distinct value once and broadcast it by code (missing -> default)"""
+    codes, values = category_codes(series)
+    table = np.array([score(value) for value in values] + [default], dtype=float)
+    return table[codes]
+
+
+def _action_rule(text):
+    """(category, risk) of the first Next_Action rule matching `text`"""
+    for name, pattern, risk in _ACTION_PATTERNS:
+        if pattern.search(str(text)):
+            return name, risk
+    return 'other', DEFAULT_ACTION_RISK
+
+
+def risk_factors(df):
+    """Per-row factor values (0..1) plus the closed flag"""
+    recency_days = df['Days_Since_Activity']
+    stage_days = df['Days_In_Stage'] if 'Days_In_Stage' in df else recency_days
+    stage = df['Current_Stage']
+
+    # Next_Action rules are matched once per distinct text
+    action_codes, actions = category_codes(df['Next_Action'])
+    rules = [_action_rule(text) for text in actions] + [('other', DEFAULT_ACTION_RISK)]
+    action_risk = np.array([np.nan if risk is None else risk for _, risk in rules])[action_codes]
+    dpr_action = np.array([name == 'dpr' for name, _ in rules])[action_codes]
+
+    dpr_due = dpr_action | (_per_value(stage, lambda value: float(value in DPR_STAGES), 0.0) > 0)
+    if 'DPR_Submitted' in df:
+        dpr_due &= ~df['DPR_Submitted'].to_numpy(dtype=bool)
+
+    closed = np.isnan(action_risk) | (_per_value(stage, lambda value: float(value in CLOSED_STAGES), 0.0) > 0)
+    return {
+        'recency': _ramp(recency_days, RECENCY_DAYS),
+        'stage': _per_value(stage, lambda value: STAGE_RISK.get(value, DEFAULT_STAGE_RISK), DEFAULT_STAGE_RISK),
+        'stage_age': _ramp(stage_days, STAGE_AGE_DAYS),
+        'missing_dpr': dpr_due.astype(float),
+        'next_action': np.nan_to_num(action_risk, nan=0.0),
+    }, closed
+
+
+def score_risk(df, weights=None, thresholds=None):
+    """(Risk_Score 0-100, derived Risk_Status categorical) for every row"""
+    weights = DEFAULT_WEIGHTS if weights is None else weights
+    thresholds = DEFAULT_THRESHOLDS if thresholds is None else thresholds
+    total = sum(weights[name] for name in RISK_FACTORS)
+    if total <= 0:
+        raise ValueError("RISK_WEIGHTS must include at least one positive weight")
+
+    factors, closed = risk_factors(df)
+    score = np.zeros(len(df))
+    for name in RISK_FACTORS:
+        if weights[name]:
+            score += weights[name] * factors[name]
+    score *= 100.0 / total
+
+    codes = np.select(
+        [closed, score >= thresholds['Stalled'], score >= thresholds['Delayed']],
+        [RISK_STATUSES.index('Closed'), RISK_STATUSES.index('Stalled'), RISK_STATUSES.index('Delayed')],
+        RISK_STATUSES.index('Active')
+    )
+    return score, pd.Categorical.from_codes(codes, categories=RISK_STATUSES)
+
+
+def risk_columns(df, weights=None, thresholds=None, replace_status=True):
+    """Risk_Score, and the engine's Risk_Status with the typed-in label kept as Risk_Status_Manual"""
+    score, status = score_risk(df, weights, thresholds)
+    columns = {'Risk_Score': np.round(score, 1)}
+    if replace_status:
+        columns['Risk_Status_Manual'] = df['Risk_Status']
+        columns['Risk_Status'] = status
+    return columns
+
+
+def with_risk(df, weights=None, thresholds=None, replace_status=True):
+    """Copy of `df` with the risk engine columns"""
+    return df.assign(**risk_columns(df, weights, thresholds, replace_status))
@@ -0,0 +1,221 @@
+"""
+Built-in sample portfolio used when no external data source is configured
+
+Reflects investor tracking through November 2025.
+"""
+
+import numpy as np
+
+SAMPLE_PORTFOLIO = {
+    'Firm_Name': [
+        'Hindustan Shipyard Limited (HSL)',
+        'Mazagaon Dock Limited (MDL)',
+        'Goa Shipyard Limited (GSL)',
+        'Garden Reach Shipbuilders & Engineers (GRSE)',
+        'Cochin Shipyard Limited (CSL)',
+        'Reliance Infrastructure',
+        'Adani Ports & SEZ',
+        'Larsen & Toubro (L&T)',
+        'Shapoorji Pallonji',
+        'ABG Shipyard',
+        'Essar Group',
+        'Goodluck Maritime',
+        'Chowgule Group',
+        'Navyuga Constructions',
+        'P&P Marine',
+        'Mahathi Infra Services',
+        'San Marine',
+        'Hyundai HD KSOE',
+        'Hanwha Ocean',
+        'Damen Shipyard Groups'
+    ],
+    'Investor_Type': [
+        'Domestic', 'Domestic', 'Domestic', 'Domestic', 'Domestic',
+        'Domestic', 'Domestic', 'Domestic', 'Domestic', 'Domestic',
+        'Domestic', 'Domestic', 'Domestic', 'Domestic', 'Domestic',
+        'Domestic', 'Domestic',
+        'International', 'International', 'International'
+    ],
+    'Sector': [
+        'Shipbuilding', 'Shipbuilding', 'Shipbuilding', 'Shipbuilding', 'Shipbuilding',
+        'Marine Infra', 'Marine Infra', 'Shipbuilding', 'Marine Infra', 'Ship Repair',
+        'Shipbuilding', 'Shipbuilding', 'Ship Repair', 'Shipbuilding/Marine Infra',
+        'Shipbuilding', 'Shipbuilding', 'Shipbuilding',
+        'Shipbuilding', 'Shipbuilding', 'Shipbuilding'
+    ],
+    'Location_Interest': [
+        'Dugarajapatnam/Mulapeta/Kakinada',
+        'Machilipatnam/Mulapeta',
+        'Machilipatnam',
+        'Machilipatnam/Mulapeta/Kakinada',
+        'Kakinada/Machilipatnam',
+        'Visakhapatnam',
+        'Multiple Locations',
+        'Mulapeta/Kakinada',
+        'Machilipatnam',
+        'Visakhapatnam',
+        'Kakinada',
+        'Bhavanapadu',
+        'Visakhapatnam',
+        'Multiple Locations',
+        'TBD',
+        'TBD',
+        'Kakinada',
+        'Machilipatnam/Dugarajapatnam',
+        'TBD',
+        'TBD'
+    ],
+    'Current_Stage': [
+        'MoU Signed',
+        'Site Visit Complete',
+        'MoU Signed',
+        'DPR Pending',
+        'EOI Submitted',
+        'Inactive',
+        'Early Discussion',
+        'EOI Submitted',
+        'Inactive',
+        'Inactive',
+        'Inactive',
+        'EOI Submitted',
+        'EOI Submitted',
+        'DPR Pending',
+        'Early Discussion',
+        'DPR Pending',
+        'Land Allotted',
+        'High-Level Meeting',
+        'Early Discussion',
+        'Declined'
+    ],
+    'Investment_INR_Cr': [
+        3000.0, np.nan, 1500.0, np.nan, np.nan,
+        np.nan, np.nan, np.nan, np.nan, np.nan,
+        np.nan, np.nan, np.nan, np.nan, np.nan,
+        np.nan, np.nan, np.nan, np.nan, np.nan
+    ],
+    'Land_Requirement_Acres': [
+        225.0, 1100.0, 200.0, 300.0, 150.0,
+        np.nan, np.nan, 200.0, np.nan, np.nan,
+        np.nan, 1200.0, 1200.0, 1200.0, np.nan,
+        100.0, 19.0, 500.0, np.nan, np.nan
+    ],
+    'Waterfront_Requirement_Meters': [
+        800.0, 1250.0, 300.0, 600.0, 400.0,
+        np.nan, np.nan, 500.0, np.nan, np.nan,
+        np.nan, 1000.0, 1000.0, 1000.0, np.nan,
+        800.0, 175.0, 3000.0, np.nan, np.nan
+    ],
+    'Draft_Requirement_Meters': [
+        16.5, 17.0, 12.5, 12.0, 10.0,
+        np.nan, np.nan, 14.0, np.nan, np.nan,
+        np.nan, 8.0, 8.0, 8.0, np.nan,
+        4.5, 7.0, 15.0, np.nan, np.nan
+    ],
+    'Direct_Employment': [
+        300.0, np.nan, 1500.0, np.nan, np.nan,
+        np.nan, np.nan, np.nan, np.nan, np.nan,
+        np.nan, np.nan, np.nan, np.nan, np.nan,
+        np.nan, np.nan, np.nan, np.nan, np.nan
+    ],
+    'Indirect_Employment': [
+        1500.0, np.nan, 5000.0, np.nan, np.nan,
+        np.nan, np.nan, np.nan, np.nan, np.nan,
+        np.nan, np.nan, np.nan, np.nan, np.nan,
+        np.nan, np.nan, np.nan, np.nan, np.nan
+    ],
+    'Support_Requested': [
+        'Land, Infra, Clearances',
+        'Land, Waterfront',
+        'Land, Infra, Housing',
+        'Land, Infra, Data',
+        'Land, Clearances',
+        'Fiscal Incentives',
+        'Land, Exclusivity',
+        'Land, Infra',
+        'Fiscal Incentives',
+        'Restructuring',
+        'Land',
+        'Land, Fiscal, Exclusivity',
+        'Land, Fiscal, Exclusivity',
+        'Land, Fiscal, Exclusivity',
+        'Consultation',
+        'Land, Jetty, Infra',
+        'Land, Infra',
+        'Land, Waterfront, Long Lease',
+        'TBD',
+        'Brownfield Only'
+    ],
+    'Risk_Status': [
+        'Active',
+        'Active',
+        'Active',
+        'Delayed',
+        'Delayed',
+        'Stalled',
+        'Active',
+        'Delayed',
+        'Stalled',
+        'Closed',
+        'Stalled',
+        'Delayed',
+        'Delayed',
+        'Delayed',
+        'Active',
+        'Delayed',
+        'Active',
+        'Active',
+        'Delayed',
+        'Closed'
+    ],
+    'Next_Action': [
+        'RFP Participation (Dec 2025)',
+        'RFP Invitation (Dec 2025)',
+        'RFP Participation (Dec 2025)',
+        'Follow-up on DPR',
+        'DPR Submission Required',
+        'Re-engagement',
+        'Detailed Proposal',
+        'Site Finalization',
+        'Re-engagement',
+        'Archive',
+        'Re-engagement',
+        'DPR Submission',
+        'DPR Submission',
+        'DPR Submission',
+        'Schedule Meeting',
+        'DPR Submission',
+        'Implementation Support',
+        'Follow-up Post Meeting',
+        'Awaiting Response',
+        'Archive'
+    ],
+    'Last_Activity_Month': [
+        'November 2025',
+        'October 2025',
+        'November 2025',
+        'October 2025',
+        'October 2025',
+        'March 2025',
+        'August 2025',
+        'October 2025',
+        'April 2025',
+        'January 2025',
+        'May 2025',
+        'October 2025',
+        'October 2025',
+        'October 2025',
+        'October 2025',
+        'October 2025',
+        'October 2025',
+        'October 2025',
+        'August 2025',
+        'July 2025'
+    ],
+    'Country': [
+        'India', 'India', 'India', 'India', 'India',
+        'India', 'India', 'India', 'India', 'India',
+        'India', 'India', 'India', 'India', 'UAE',
+        'India', 'India',
+        'South Korea', 'South Korea', 'Netherlands'
+    ]
+}
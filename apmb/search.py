@@ -0,0 +1,154 @@
+"""
+Fuzzy full-text search over the investor text fields
+
+`SearchIndex` is built once per dataset version. Each searched field is
+factorized, so the index covers distinct values only ('Early Discussion' is
+indexed once, however many rows hold it). Every distinct value is broken into
+character trigrams of its words, padded as in PostgreSQL's pg_trgm
+('port' -> '  p', ' po', 'por', 'ort', 'rt '), and the trigrams are stored as
+sorted posting arrays.
+
+A query is split into trigrams the same way. One `bincount` over their
+postings counts the shared trigrams of every distinct value, which gives:
+
+    score = shared / query trigrams  (+ a small bonus for tighter values)
+
+Row scores are then the weighted best field score, gathered by each field's
+codes. A misspelt word still shares most of its trigrams, so matching is
+typo-tolerant without any per-row string comparison.
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+
+from .kpis import category_codes
+
+SEARCH_FIELDS = ['Firm_Name', 'Support_Requested', 'Next_Action', 'Sector', 'Location_Interest']
+FIELD_WEIGHTS = {
+    'Firm_Name': 1.0,
+    'Sector': 0.9,
+    'Location_Interest': 0.9,
+    'Support_Requested': 0.8,
+    'Next_Action': 0.8,
+}
+# Fraction of the query's trigrams a match must share
+MIN_SCORE = 0.6
+# Weight of the value's own trigram coverage, ranking tighter values first
+TIGHTNESS_BONUS = 0.1
+
+_WORD = re.compile(r'[0-9a-z]+')
+
+
+def query_terms(text):
+    """Lower-case words of `text`"""
+    return _WORD.findall(str(text).lower())
+
+
+def trigrams(text):
+    """Set of padded word trigrams of `text`"""
+    grams = set()
+    for word in query_terms(text):
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class SearchIndex:
+    """Trigram postings over the distinct values of the searched fields"""
+
+    def __init__(self, codes, spans, doc_sizes, vocabulary, postings, bounds):
+        self.codes = codes
+        self.spans = spans
+        self.doc_sizes = doc_sizes
+        self.vocabulary = vocabulary
+        self.postings = postings
+        self.bounds = bounds
+
+    @classmethod
+    def build(cls, df, fields=SEARCH_FIELDS):
+        """Index `fields` of `df` (row positions are `df`'s positions)"""
+        codes, spans = {}, {}
+        vocabulary = {}
+        gram_ids, doc_ids, doc_sizes = [], [], []
+        n_docs = 0
+        for field in fields:
+            if field not in df:
+                continue
+            field_codes, values = category_codes(df[field])
+            codes[field], start = field_codes, n_docs
+            for value in values:
+                grams = trigrams(value)
+                doc_sizes.append(len(grams))
+                for gram in grams:
+                    gram_ids.append(vocabulary.setdefault(gram, len(vocabulary)))
+                    doc_ids.append(n_docs)
+                n_docs += 1
+            spans[field] = (start, n_docs)
+
+        gram_ids = np.asarray(gram_ids, dtype=np.int64)
+        order = np.argsort(gram_ids, kind='stable')
+        postings = np.asarray(doc_ids, dtype=np.int64)[order]
+        bounds = np.searchsorted(gram_ids[order], np.arange(len(vocabulary) + 1))
+        return cls(codes, spans, np.asarray(doc_sizes, dtype=float), vocabulary, postings, bounds)
+
+    @property
+    def n_docs(self):
+        return len(self.doc_sizes)
+
+    def doc_scores(self, query):
+        """Score of every distinct value for `query` (0 when it shares too little)"""
+        query_grams = trigrams(query)
+        grams = [self.vocabulary[gram] for gram in query_grams if gram in self.vocabulary]
+        n_query = len(query_grams)
+        if not grams:
+            return np.zeros(self.n_docs)
+        hits = np.concatenate([self.postings[self.bounds[g]:self.bounds[g + 1]] for g in grams])
+        shared = np.bincount(hits, minlength=self.n_docs).astype(float)
+
+        coverage = shared / n_query
+        with np.errstate(divide='ignore', invalid='ignore'):
+            tightness = np.nan_to_num(shared / self.doc_sizes)
+        return np.where(coverage >= MIN_SCORE, coverage + TIGHTNESS_BONUS * tightness, 0.0)
+
+    def row_scores(self, query, weights=FIELD_WEIGHTS):
+        """Best weighted field score of every row"""
+        docs = self.doc_scores(query)
+        scores = None
+        for field, codes in self.codes.items():
+            # Missing values (code -1) pick up the appended zero
+            start, stop = self.spans[field]
+            table = np.append(docs[start:stop], 0.0)
+            field_scores = table[codes] * weights.get(field, 1.0)
+            scores = field_scores if scores is None else np.maximum(scores, field_scores)
+        return np.zeros(0) if scores is None else scores
+
+    def search(self, query, mask=None, k=None):
+        """(row positions, scores) of the matches, best first
+
+        `mask` limits the candidates (e.g. the sidebar filters and live rows);
+        `k` keeps only the top matches, selected with `argpartition`.
+        """
+        scores = self.row_scores(query)
+        if mask is not None:
+            scores = np.where(mask, scores, 0.0)
+        positions = np.flatnonzero(scores > 0)
+        if k is not None and len(positions) > k:
+            positions = positions[np.argpartition(-scores[positions], k - 1)[:k]]
+        positions = positions[np.lexsort((positions, -scores[positions]))]
+        return positions, scores[positions]
+
+
+def match_mask(values, query):
+    """Whether each of `values` matches `query` by the index's trigram rule
+
+    Used to highlight the cells of a visible table page; each distinct value
+    is checked once.
+    """
+    query_grams = trigrams(query)
+    codes, uniques = category_codes(pd.Series(values))
+    if not query_grams:
+        return np.zeros(len(codes), dtype=bool)
+    hits = [len(trigrams(value) & query_grams) >= MIN_SCORE * len(query_grams) for value in uniques] + [False]
+    return np.asarray(hits, dtype=bool)[codes]
@@ -0,0 +1,214 @@
+"""
+Daily portfolio snapshots: time travel and KPI trends
+
+    SNAPSHOT_DIR/
+        2025-11-01.full.parquet     every investor (source columns)
+        2025-11-02.delta.parquet    investors changed since the previous snapshot
+        ...
+        rollups.parquet             one row per snapshot: its kind and the KPI card values
+
+`SnapshotStore.record` keeps one snapshot per reporting date (AS_OF_DATE,
+default today): the first data version shown on a date is written, and a
+later version on the same date replaces it. Dates before the latest snapshot
+are never rewritten, so recorded history stays consistent.
+
+Snapshots are Parquet (columnar, dictionary-encoded, zstd-compressed) and
+delta-encoded: most hold only the rows inserted or updated since the previous
+snapshot, matched on Firm_Name as the incremental refresh does, plus the keys
+of deleted rows (`_deleted`). Every KEYFRAME_INTERVAL-th snapshot - and any
+whose delta would hold more than half the portfolio - is stored in full, so a
+past date is rebuilt from one full file and at most KEYFRAME_INTERVAL - 1
+small deltas. `SnapshotSource` loads a date lazily, like any other data
+source.
+
+`rollups.parquet` holds each snapshot's portfolio-wide KPIs, so trend lines
+read one small table and never the snapshots themselves.
+
+Needs the optional `pyarrow` package.
+"""
+
+import importlib.util
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+from .data_sources import COLUMNS, NUMERIC_COLUMNS, DataSource
+from .kpis import float_values
+
+KEY_COLUMN = 'Firm_Name'
+DELETED_COLUMN = '_deleted'
+ROLLUPS_FILE = 'rollups.parquet'
+
+# Snapshots per full keyframe (the others are deltas)
+KEYFRAME_INTERVAL = 30
+# A delta holding more than this fraction of the portfolio is stored in full instead
+MAX_DELTA_FRACTION = 0.5
+
+# KPIs kept per snapshot (the Executive Summary cards)
+TREND_KPIS = [
+    'Total_Investment', 'Total_Direct_Employment', 'Total_Indirect_Employment', 'Total_Land_Requested',
+    'Active_Investors', 'MoUs_Signed', 'Delayed_Stalled', 'Total_Investors',
+]
+
+
+def snapshots_available():
+    """Whether the optional pyarrow dependency (Parquet snapshots) is installed"""
+    return importlib.util.find_spec('pyarrow') is not None
+
+
+def _row_hashes(df):
+    """64-bit hash of each row's source columns, independent of how they are compacted"""
+    normalized = pd.DataFrame({
+        col: float_values(df[col]) if col in NUMERIC_COLUMNS else df[col].to_numpy(dtype=object)
+        for col in COLUMNS
+    })
+    return pd.util.hash_pandas_object(normalized, index=False).to_numpy()
+
+
+def _apply_delta(df, delta):
+    """`df` with the delta's deleted and updated keys dropped and its rows appended"""
+    deleted = delta[DELETED_COLUMN].to_numpy(dtype=bool)
+    kept = df[~df[KEY_COLUMN].isin(delta[KEY_COLUMN])]
+    return pd.concat([kept, delta.loc[~deleted, COLUMNS]], ignore_index=True)
+
+
+class SnapshotStore:
+    """Snapshots and KPI rollups under one directory (SNAPSHOT_DIR); disabled when `path` is empty"""
+
+    def __init__(self, path=None):
+        self.path = path
+        self.enabled = bool(path) and snapshots_available()
+        self._lock = threading.Lock()
+        self._recorded = None
+        # (date, row hashes by key) of the latest snapshot, the base of the next delta
+        self._base = None
+        self._rollups = None
+        if self.enabled:
+            os.makedirs(path, exist_ok=True)
+            rollups = os.path.join(path, ROLLUPS_FILE)
+            self._rollups = pd.read_parquet(rollups) if os.path.exists(rollups) else None
+
+    def rollups(self):
+        """One row per snapshot, oldest first: date, kind, version and the TREND_KPIS"""
+        if self._rollups is None:
+            return pd.DataFrame(columns=['date', 'kind', 'version', 'rows'] + TREND_KPIS)
+        return self._rollups
+
+    def dates(self):
+        """Snapshot dates, newest first"""
+        return [day.date() for day in reversed(pd.to_datetime(self.rollups()['date']))]
+
+    def _file(self, day, kind):
+        return os.path.join(self.path, f"{day:%Y-%m-%d}.{kind}.parquet")
+
+    def _write(self, df, path):
+        # Written to a temporary file and renamed, so readers never see a partial file
+        partial = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        df.to_parquet(partial, compression='zstd', index=False)
+        os.replace(partial, path)
+
+    def read(self, day):
+        """Source columns of the portfolio as of snapshot `day`, rebuilt from its keyframe"""
+        rollups = self.rollups()
+        dates = pd.to_datetime(rollups['date']).dt.date.tolist()
+        if day not in dates:
+            raise ValueError(f"No snapshot for {day:%Y-%m-%d}")
+        end = dates.index(day)
+        start = end
+        while rollups['kind'].iloc[start] != 'full':
+            start -= 1
+
+        df = pd.read_parquet(self._file(dates[start], 'full'))
+        for position in range(start + 1, end + 1):
+            df = _apply_delta(df, pd.read_parquet(self._file(dates[position], 'delta')))
+        return df[COLUMNS]
+
+    def recorded(self, day, version):
+        """Whether `version` is already the snapshot of `day` (or nothing is to be recorded)"""
+        return not self.enabled or self._recorded == (day, version)
+
+    def record(self, day, df, version, kpis):
+        """Store the live portfolio `df` and its portfolio-wide `kpis` as the snapshot of `day`
+
+        A no-op when `version` is already recorded for `day` or `day` is older
+        than the latest snapshot. Returns whether a snapshot was written.
+        """
+        if self.recorded(day, version):
+            return False
+        with self._lock:
+            rollups = self.rollups()
+            dates = pd.to_datetime(rollups['date']).dt.date.tolist()
+            if dates and (day < dates[-1] or (day == dates[-1] and rollups['version'].iloc[-1] == str(version))):
+                self._recorded = (day, version)
+                return False
+
+            # Today's snapshot is replaced: it is encoded against the snapshot before it
+            previous = rollups.iloc[:-1] if dates and dates[-1] == day else rollups
+            kind, snapshot = 'full', df[COLUMNS]
+            since_keyframe = len(previous) - 1 - np.flatnonzero(previous['kind'].to_numpy() == 'full').max(initial=-1)
+            if len(previous) and since_keyframe < KEYFRAME_INTERVAL - 1:
+                delta = self._delta(pd.to_datetime(previous['date']).dt.date.iloc[-1], snapshot)
+                if delta is not None and len(delta) <= MAX_DELTA_FRACTION * len(snapshot):
+                    kind, snapshot = 'delta', delta
+
+            for stale in ('full', 'delta'):
+                if stale != kind and os.path.exists(self._file(day, stale)):
+                    os.remove(self._file(day, stale))
+            self._write(snapshot, self._file(day, kind))
+
+            row = {'date': pd.Timestamp(day), 'kind': kind, 'version': str(version), 'rows': len(df)}
+            row.update({name: float(kpis[name]) for name in TREND_KPIS})
+            rollups = pd.concat([previous, pd.DataFrame([row])], ignore_index=True) if len(previous) else pd.DataFrame([row])
+            self._write(rollups, os.path.join(self.path, ROLLUPS_FILE))
+            self._rollups = rollups
+            self._recorded = (day, version)
+            if df[KEY_COLUMN].is_unique:
+                self._base = (day, pd.Series(_row_hashes(df), index=df[KEY_COLUMN].to_numpy(dtype=object)))
+            return True
+
+    def _delta(self, base_day, df):
+        """Rows of `df` inserted or updated since snapshot `base_day`, plus deleted keys; None if keys repeat"""
+        if not df[KEY_COLUMN].is_unique:
+            return None
+        if self._base is not None and self._base[0] == base_day:
+            base_hashes = self._base[1]
+        else:
+            base = self.read(base_day)
+            if not base[KEY_COLUMN].is_unique:
+                return None
+            base_hashes = pd.Series(_row_hashes(base), index=base[KEY_COLUMN].to_numpy(dtype=object))
+        previous = base_hashes.reindex(df[KEY_COLUMN].to_numpy(dtype=object)).to_numpy()
+        changed = df[~(previous == _row_hashes(df))]
+        deleted = base_hashes.index.difference(pd.Index(df[KEY_COLUMN].to_numpy(dtype=object)))
+
+        delta = changed.astype({col: object for col in COLUMNS if isinstance(changed[col].dtype, pd.CategoricalDtype)})
+        delta = delta.assign(**{DELETED_COLUMN: False})
+        removed = pd.DataFrame({KEY_COLUMN: deleted.to_numpy(dtype=object), DELETED_COLUMN: True})
+        return pd.concat([delta, removed], ignore_index=True) if len(removed) else delta
+
+    def trend(self, until, points=30):
+        """Rollups of the last `points` snapshots up to `until` (a date)"""
+        rollups = self.rollups()
+        dates = pd.to_datetime(rollups['date']).dt.date
+        return rollups[(dates <= until).to_numpy()].tail(points).reset_index(drop=True)
+
+
+class SnapshotSource(DataSource):
+    """The portfolio as of one recorded snapshot date"""
+
+    kind = 'snapshot'
+
+    def __init__(self, store, day):
+        self.store = store
+        self.day = day
+
+    def read(self):
+        return self.store.read(self.day)
+
+    def version(self):
+        return f"snapshot:{self.day:%Y-%m-%d}"
+
+    def __repr__(self):
+        return f"SnapshotSource({self.store.path!r}, {self.day:%Y-%m-%d})"
@@ -0,0 +1,189 @@
+"""
+Paginated, server-side sorted and filtered investor tables
+
+Only the visible page of a table is styled and sent to the browser. Sorting
+and the column filter work on row positions (one `argsort` / one vectorized
+mask over the filtered frame), and colour coding is a lookup from categorical
+codes or an interpolation over a palette, producing the page's CSS in a
+single array operation instead of a Styler callback per row or cell.
+Gradient colours are scaled to the full column, so a value keeps its colour
+whichever page it lands on.
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_bool_dtype, is_datetime64_any_dtype, is_numeric_dtype
+
+from .kpis import category_codes, float_values
+
+PAGE_SIZES = [25, 50, 100, 250]
+
+RISK_ROW_COLORS = {
+    'Active': '#d1fae5',
+    'Delayed': '#fef3c7',
+    'Stalled': '#fee2e2',
+    'Closed': '#fee2e2',
+}
+RISK_CELL_STYLES = {
+    'Active': 'background-color: #d1fae5; color: #065f46',
+    'Delayed': 'background-color: #fef3c7; color: #92400e',
+    'Stalled': 'background-color: #fee2e2; color: #991b1b',
+    'Closed': 'background-color: #fee2e2; color: #991b1b',
+}
+HIGHLIGHT_STYLE = 'background-color: #fde68a; font-weight: 600'
+# ColorBrewer YlOrRd, light to dark
+YLORRD = ['#ffffcc', '#ffeda0', '#fed976', '#feb24c', '#fd8d3c', '#fc4e2a', '#e31a1c', '#bd0026', '#800026']
+
+# A number with optional thousands separators and decimals: `1,200`, `-3.5`, `.25`
+_NUMBER = r'-?(?:\d[\d,]*(?:\.\d*)?|\.\d+)'
+_NUMERIC_FILTER = re.compile(
+    rf'^\s*(?:(?P<op><=|>=|<|>|=)?\s*(?P<value>{_NUMBER})|(?P<low>{_NUMBER})\s*-\s*(?P<high>{_NUMBER}))\s*$'
+)
+
+
+def _is_numeric(series):
+    return is_numeric_dtype(series) and not is_bool_dtype(series)
+
+
+def _sort_key(series):
+    """Float sort key per row (NaN for missing, which sorts last)"""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        key = series.cat.codes.to_numpy().astype(float)
+        key[key < 0] = np.nan
+        return key
+    if is_datetime64_any_dtype(series):
+        values = series.to_numpy(dtype='datetime64[ns]')
+        key = values.astype(np.int64).astype(float)
+        key[np.isnat(values)] = np.nan
+        return key
+    if _is_numeric(series):
+        return float_values(series)
+    codes, _ = pd.factorize(series, sort=True)
+    key = codes.astype(float)
+    key[codes < 0] = np.nan
+    return key
+
+
+def sort_positions(df, column, descending=False):
+    """Row positions of `df` ordered by `column` (stable, missing values last)"""
+    key = _sort_key(df[column])
+    return np.argsort(-key if descending else key, kind='stable')
+
+
+def _number(text):
+    return float(text.replace(',', ''))
+
+
+def filter_mask(df, column, text):
+    """Rows of `df` whose `column` matches the filter `text`
+
+    Text columns match a case-insensitive substring. Numeric columns take
+    `100`, `>100`, `<=50` or a range `10-50`; anything else matches as text.
+    """
+    series = df[column]
+    text = text.strip()
+    if not text:
+        return np.ones(len(df), dtype=bool)
+
+    if _is_numeric(series):
+        match = _NUMERIC_FILTER.match(text)
+        if match:
+            values = float_values(series)
+            with np.errstate(invalid='ignore'):
+                if match.group('low') is not None:
+                    return (values >= _number(match.group('low'))) & (values <= _number(match.group('high')))
+                op, value = match.group('op') or '=', _number(match.group('value'))
+                return {
+                    '<': values < value, '<=': values <= value,
+                    '>': values > value, '>=': values >= value,
+                    '=': values == value,
+                }[op]
+
+    # Substring match on each distinct value, broadcast by code
+    codes, uniques = category_codes(series)
+    hits = pd.Index(uniques, dtype=object).astype(str).str.contains(text, case=False, regex=False)
+    hits = np.append(np.asarray(hits, dtype=bool), False)
+    return hits[codes]
+
+
+def table_positions(df, sort_column=None, descending=False, filter_column=None, filter_text=''):
+    """Row positions of `df` after the column filter and sort"""
+    positions = np.arange(len(df))
+    if filter_column and filter_text.strip():
+        positions = np.flatnonzero(filter_mask(df, filter_column, filter_text))
+    if sort_column:
+        positions = positions[sort_positions(df.take(positions), sort_column, descending)]
+    return positions
+
+
+def page_bounds(n_rows, page, page_size):
+    """(start, stop, number of pages) for a 1-based page number, clamped to range"""
+    n_pages = max(1, -(-n_rows // page_size))
+    page = min(max(int(page), 1), n_pages)
+    start = (page - 1) * page_size
+    return start, min(start + page_size, n_rows), n_pages
+
+
+def category_styles(series, styles, default=''):
+    """CSS per row from a {value: css} mapping, via categorical codes"""
+    codes, uniques = category_codes(series)
+    table = np.array([styles.get(value, default) for value in uniques] + [default], dtype=object)
+    return table[codes]
+
+
+def _hex_to_rgb(colors):
+    return np.array([[int(color[i:i + 2], 16) for i in (1, 3, 5)] for color in colors], dtype=float)
+
+
+def gradient_styles(values, vmin, vmax, palette=YLORRD):
+    """Background colour per value, interpolated over `palette` between vmin and vmax"""
+    values = np.asarray(values, dtype=float)
+    span = vmax - vmin if vmax > vmin else 1.0
+    position = np.clip((values - vmin) / span, 0.0, 1.0) * (len(palette) - 1)
+
+    stops = np.arange(len(palette))
+    rgb = _hex_to_rgb(palette)
+    channels = np.stack([np.interp(position, stops, rgb[:, c]) for c in range(3)], axis=1)
+    channels = np.nan_to_num(channels, nan=255.0).round().astype(int)
+
+    # Light text on dark cells (relative luminance below ~0.4)
+    luminance = (0.2126 * channels[:, 0] + 0.7152 * channels[:, 1] + 0.0722 * channels[:, 2]) / 255
+    text = np.where(luminance < 0.4, '#f1f1f1', '#000000')
+    hex_codes = np.array([f'#{r:02x}{g:02x}{b:02x}' for r, g, b in channels], dtype=object)
+    css = 'background-color: ' + hex_codes + '; color: ' + text.astype(object)
+    return np.where(np.isnan(values), '', css)
+
+
+def column_ranges(df, columns):
+    """(min, max) of each numeric column over the whole table"""
+    ranges = {}
+    for col in columns:
+        values = float_values(df[col])
+        finite = values[~np.isnan(values)]
+        ranges[col] = (float(finite.min()), float(finite.max())) if len(finite) else (0.0, 0.0)
+    return ranges
+
+
+def style_page(page, row_styles=None, cell_styles=None, gradients=None, highlights=None):
+    """Styler for one page with precomputed CSS (one `apply` for the whole page)
+
+    `row_styles` is (column, {value: css}) applied across the row, `cell_styles`
+    maps column -> {value: css}, `gradients` maps column -> (vmin, vmax) and
+    `highlights` maps column -> boolean mask of search matches.
+    """
+    css = pd.DataFrame('', index=page.index, columns=page.columns, dtype=object)
+    if row_styles is not None:
+        column, styles = row_styles
+        row_css = category_styles(page[column], styles)
+        for col in css.columns:
+            css[col] = row_css
+    for column, styles in (cell_styles or {}).items():
+        css[column] = category_styles(page[column], styles)
+    for column, (vmin, vmax) in (gradients or {}).items():
+        css[column] = gradient_styles(float_values(page[column]), vmin, vmax)
+    for column, matched in (highlights or {}).items():
+        current = css[column].to_numpy(dtype=object)
+        css[column] = np.where(matched, current + ';' + HIGHLIGHT_STYLE, current)
+    return page.style.apply(lambda _: css, axis=None)
@@ -0,0 +1,6 @@
+"""
+Streamlit UI layer of the APMB dashboard
+
+`apmb.ui.dashboard.main()` renders the page; the analytics it draws on live
+in the `apmb` core modules, which never import this package.
+"""
@@ -0,0 +1,77 @@
+"""
+Optional password protection (APP_PASSWORD in .streamlit/secrets.toml)
+"""
+
+import hashlib
+
+import streamlit as st
+
+
+def check_password():
+    """Returns `True` if user has entered correct password."""
+    
+    # Check if password protection is enabled
+    try:
+        required_password = st.secrets.get("APP_PASSWORD", None)
+    except:
+        # Secrets file doesn't exist or APP_PASSWORD not set - no protection needed
+        return True
+    
+    if required_password is None or required_password == "":
+        # No password configured - app is public
+        return True
+    
+    def password_entered():
+        """Checks whether a password entered by the user is correct."""
+        if hashlib.sha256(st.session_state["password"].encode()).hexdigest() == hashlib.sha256(required_password.encode()).hexdigest():
+            st.session_state["password_correct"] = True
+            del st.session_state["password"]  # Don't store password
+        else:
+            st.session_state["password_correct"] = False
+
+    if "password_correct" not in st.session_state:
+        # First run, show input for password
+        st.markdown("""
+        <div style='text-align: center; padding: 3rem;'>
+            <h1>🚢 APMB Investor Dashboard</h1>
+            <p style='color: #64748b; font-size: 1.2rem;'>Secure Access Required</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col2:
+            st.text_input(
+                "Enter Password", 
+                type="password", 
+                on_change=password_entered, 
+                key="password",
+                placeholder="Password"
+            )
+            st.caption("Contact APMB administrator for access credentials.")
+        return False
+    
+    elif not st.session_state["password_correct"]:
+        # Password incorrect, show input + error
+        st.markdown("""
+        <div style='text-align: center; padding: 3rem;'>
+            <h1>🚢 APMB Investor Dashboard</h1>
+            <p style='color: #64748b; font-size: 1.2rem;'>Secure Access Required</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col2:
+            st.text_input(
+                "Enter Password", 
+                type="password", 
+                on_change=password_entered, 
+                key="password",
+                placeholder="Password"
+            )
+            st.error("😕 Password incorrect. Please try again.")
+            st.caption("Contact APMB administrator for access credentials.")
+        return False
+    
+    else:
+        # Password correct
+        return True
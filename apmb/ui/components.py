@@ -0,0 +1,388 @@
+"""
+Reusable dashboard widgets: KPI cards, paginated tables, export buttons, the
+interaction log form and the profiling panel
+"""
+
+import time
+from concurrent.futures import wait
+
+import pandas as pd
+import streamlit as st
+
+from ..config import get_setting
+from ..events import EVENT_LABELS, Event
+from ..instrumentation import json_lines, prometheus_text, stage
+from ..memory import format_bytes
+from ..search import SEARCH_FIELDS, match_mask
+from ..tables import PAGE_SIZES, column_ranges, page_bounds, style_page, table_positions
+from .resources import get_export_jobs, get_result_cache, get_session_id
+
+
+# Sparkline drawing box (SVG user units)
+SPARKLINE_WIDTH, SPARKLINE_HEIGHT = 120, 28
+
+
+def sparkline_svg(values):
+    """Inline SVG polyline of `values`, scaled to the sparkline box"""
+    values = [float(value) for value in values]
+    low, high = min(values), max(values)
+    if high == low:
+        # A flat line sits mid-box
+        low, high = low - 1, high + 1
+    span = high - low
+    step = SPARKLINE_WIDTH / (len(values) - 1)
+    points = " ".join(
+        f"{i * step:.1f},{SPARKLINE_HEIGHT - 2 - (value - low) / span * (SPARKLINE_HEIGHT - 4):.1f}"
+        for i, value in enumerate(values)
+    )
+    return (
+        f'<svg class="kpi-sparkline" viewBox="0 0 {SPARKLINE_WIDTH} {SPARKLINE_HEIGHT}" preserveAspectRatio="none">'
+        f'<polyline points="{points}" /></svg>'
+    )
+
+
+def _trend_html(trend):
+    """Sparkline and change since the previous snapshot of a KPI trend (values by date)"""
+    if trend is None or len(trend) < 2:
+        return ""
+    change = float(trend.iloc[-1] - trend.iloc[-2])
+    arrow = "▲" if change > 0 else "▼" if change < 0 else "■"
+    return f"""
+        <div class="kpi-trend">
+            {sparkline_svg(trend)}
+            <span>{arrow} {change:+,.0f} since {trend.index[-2]:%d %b}</span>
+        </div>"""
+
+
+def create_kpi_card(title, value, icon="📊", risk_level=None, trend=None):
+    """Create an enhanced animated KPI card with risk-based colors
+
+    `trend` (a KPI's values by snapshot date) adds a sparkline and the change
+    since the previous snapshot.
+    """
+    
+    # Determine card class based on risk level
+    card_class = "kpi-card"
+    if risk_level == "active":
+        card_class += " risk-active"
+    elif risk_level == "delayed":
+        card_class += " risk-delayed"
+    elif risk_level == "stalled":
+        card_class += " risk-stalled"
+    elif risk_level == "closed":
+        card_class += " risk-closed"
+    
+    if isinstance(value, float):
+        if value >= 1000:
+            display_value = f"₹{value:,.0f} Cr"
+        elif value > 0:
+            display_value = f"{value:,.0f}"
+        else:
+            display_value = "N/A"
+    else:
+        display_value = str(value)
+    
+    return f"""
+    <div class="{card_class}">
+        <div class="kpi-label">
+            <span class="kpi-icon">{icon}</span>
+            <span>{title}</span>
+        </div>
+        <div class="kpi-value">{display_value}</div>{_trend_html(trend)}
+    </div>
+    """
+
+
+def get_page_sizes():
+    """Rows-per-page choices, including the TABLE_PAGE_SIZE default"""
+    default = int(get_setting("TABLE_PAGE_SIZE", 50))
+    return sorted(set(PAGE_SIZES) | {default}), default
+
+
+def render_table(df, key, filter_key, height=400, row_colors=None, cell_styles=None, gradient_columns=()):
+    """Paginated table with server-side sorting, a column filter and vectorized colour coding
+    
+    Only the visible page is styled and sent to the browser. `row_colors` is
+    (column, {value: colour}) for whole-row backgrounds, `cell_styles` maps a
+    column to {value: css}, and `gradient_columns` are shaded over the full
+    column's range. Sort, filter and page state live in session_state under `key`.
+    """
+    with stage(f"table.{key}"):
+        _render_table(df, key, filter_key, height, row_colors, cell_styles, gradient_columns)
+
+
+def _render_table(df, key, filter_key, height, row_colors, cell_styles, gradient_columns):
+    columns = list(df.columns)
+    
+    with st.expander("↕️ Sort & filter", expanded=False):
+        col1, col2, col3, col4 = st.columns([2, 1, 2, 3])
+        with col1:
+            sort_column = st.selectbox("Sort by", ["(current order)"] + columns, key=f"{key}_sort")
+        with col2:
+            descending = st.checkbox("Descending", key=f"{key}_descending")
+        with col3:
+            filter_column = st.selectbox("Filter column", ["(none)"] + columns, key=f"{key}_filter_column")
+        with col4:
+            filter_text = st.text_input(
+                "Filter",
+                key=f"{key}_filter_text",
+                help="Text columns: case-insensitive match. Numbers: 100, >100, <=50 or a range 10-50"
+            )
+    
+    view = (
+        sort_column if sort_column in columns else None,
+        descending,
+        filter_column if filter_column in columns else None,
+        filter_text.strip()
+    )
+    positions = get_result_cache().get_or_compute(
+        (filter_key, key, 'positions', view),
+        lambda: table_positions(df, view[0], view[1], view[2], view[3])
+    )
+    
+    # Back to the first page whenever the rows change
+    page_key = f"{key}_page"
+    if st.session_state.get(f"{key}_view") != (filter_key, view):
+        st.session_state[f"{key}_view"] = (filter_key, view)
+        st.session_state[page_key] = 1
+    
+    page_sizes, default_size = get_page_sizes()
+    page_size = st.session_state.get(f"{key}_page_size", default_size)
+    start, stop, n_pages = page_bounds(len(positions), st.session_state.get(page_key, 1), page_size)
+    st.session_state[page_key] = start // page_size + 1
+    
+    page = df.take(positions[start:stop])
+    
+    # Search matches are highlighted on the visible page only
+    highlights = None
+    if filter_key.search:
+        highlights = {col: match_mask(page[col], filter_key.search) for col in SEARCH_FIELDS if col in page}
+    
+    if row_colors is not None or cell_styles or gradient_columns or highlights:
+        ranges = get_result_cache().get_or_compute(
+            (filter_key, key, 'ranges'),
+            lambda: column_ranges(df, gradient_columns)
+        )
+        row_styles = None
+        if row_colors is not None:
+            column, colors = row_colors
+            row_styles = (column, {value: f'background-color: {color}' for value, color in colors.items()})
+        page = style_page(
+            page,
+            row_styles=row_styles,
+            cell_styles=cell_styles,
+            gradients=ranges,
+            highlights=highlights
+        )
+    st.dataframe(page, use_container_width=True, height=height)
+    
+    col1, col2, col3 = st.columns([1, 1, 3])
+    with col1:
+        st.number_input("Page", min_value=1, max_value=n_pages, step=1, key=page_key)
+    with col2:
+        st.selectbox("Rows per page", page_sizes, index=page_sizes.index(default_size), key=f"{key}_page_size")
+    with col3:
+        if len(positions):
+            st.caption(f"Rows {start + 1:,}–{stop:,} of {len(positions):,} · page {start // page_size + 1} of {n_pages}")
+        else:
+            st.caption("No matching rows")
+
+
+def lazy_download_button(label, prepare_label, key, build, file_name, mime, help=None):
+    """Sidebar download button whose payload is only built after the user asks for it"""
+    # Requests are remembered for the current filters only, so the set cannot grow past one per export
+    filter_key, export = key[0], key[1:]
+    requested = st.session_state.get('requested_exports')
+    if requested is None or requested[0] != filter_key:
+        requested = st.session_state['requested_exports'] = (filter_key, set())
+    if export not in requested[1]:
+        st.sidebar.button(
+            prepare_label,
+            key=f"prepare_{key[1]}",
+            on_click=requested[1].add,
+            args=(export,),
+            use_container_width=True,
+            help=help
+        )
+        return
+    
+    with stage(f"export.{file_name.rsplit('.', 1)[-1]}"):
+        data = get_result_cache().get_or_compute(key, build)
+    st.sidebar.download_button(
+        label=label,
+        data=data,
+        file_name=file_name,
+        mime=mime,
+        key=f"download_{key[1]}",
+        use_container_width=True,
+        help=help
+    )
+
+
+def start_background_export(key, build):
+    """Queue an export on the worker pool and remember that this session waits for it"""
+    st.session_state.setdefault('background_exports', set()).add(key)
+    get_export_jobs().submit(key, build, on_done=get_result_cache().put)
+
+
+def background_download_button(label, prepare_label, key, build, file_name, mime, help=None):
+    """Sidebar download button whose payload is built on a background worker"""
+    result_cache = get_result_cache()
+    jobs = get_export_jobs()
+    
+    data = result_cache.get(key) if key in result_cache else None
+    if data is not None:
+        st.sidebar.download_button(
+            label=label,
+            data=data,
+            file_name=file_name,
+            mime=mime,
+            key=f"download_{key[1]}",
+            use_container_width=True,
+            help=help
+        )
+        return
+    
+    if jobs.running(key):
+        st.sidebar.button(
+            "⏳ Generating...",
+            key=f"generating_{key[1]}",
+            disabled=True,
+            use_container_width=True
+        )
+        return
+    
+    error = jobs.error(key)
+    if error is not None:
+        st.sidebar.error(f"Export failed: {error}")
+    st.sidebar.button(
+        prepare_label,
+        key=f"prepare_{key[1]}",
+        on_click=start_background_export,
+        args=(key, build),
+        use_container_width=True,
+        help=help
+    )
+
+
+def poll_background_exports(timeout=1.0):
+    """Rerun when exports this session is waiting for finish (the page is already drawn)"""
+    jobs = get_export_jobs()
+    waiting = st.session_state.get('background_exports', set())
+    # Finished exports are dropped, so the set only holds jobs still running
+    waiting.intersection_update(key for key in waiting if jobs.running(key))
+    pending = jobs.pending(waiting)
+    if pending:
+        wait(pending, timeout=timeout)
+        st.rerun()
+
+
+def log_interaction(events):
+    """Form callback: append the submitted interaction to the event log"""
+    state = st.session_state
+    event_type = {label: key for key, label in EVENT_LABELS.items()}[state['interaction_type']]
+    interaction_stage = None if state['interaction_stage'] == '-' else state['interaction_stage']
+    events.record(Event(state['interaction_firm'], event_type, state['interaction_date'], interaction_stage, state['interaction_note']))
+    state['interaction_logged'] = f"✅ {state['interaction_type']} logged for {state['interaction_firm']}"
+
+
+def render_interaction_form(events, dataset, as_of):
+    """Sidebar form that appends a meeting, visit, DPR submission or stage change to the event log"""
+    st.sidebar.markdown("---")
+    logged = st.session_state.pop('interaction_logged', None)
+    if logged:
+        st.sidebar.success(logged)
+    
+    with st.sidebar.expander("📝 Log Interaction"):
+        with st.form("log_interaction", clear_on_submit=True):
+            firms = sorted(dataset.df['Firm_Name'].take(dataset.live_positions()).unique())
+            st.selectbox("Investor", firms, key="interaction_firm")
+            st.selectbox("Interaction", list(EVENT_LABELS.values()), key="interaction_type")
+            st.date_input("Date", value=as_of.date(), key="interaction_date")
+            st.selectbox("New stage (stage changes only)", ['-'] + dataset.filter_index.options('Current_Stage'), key="interaction_stage")
+            st.text_input("Note", key="interaction_note")
+            st.form_submit_button("Save", on_click=log_interaction, args=(events,), use_container_width=True)
+
+
+def render_profiling_panel(log, caches, memory, compaction=None):
+    """Collapsible admin panel: stages of the latest profiled rerun, cache activity, recent reruns and memory
+
+    `compaction` is the latest load's column compaction report, if any.
+    """
+    profiles = log.recent()
+    if not profiles:
+        return
+    latest = profiles[0].to_dict()
+    
+    with st.expander(f"⏱️ Performance Profile (last {len(profiles)} reruns)", expanded=False):
+        peak = "" if latest['peak_kib'] is None else f" · peak {latest['peak_kib'] / 1024:,.1f} MiB allocated"
+        st.caption(f"Rerun #{latest['run']} at {latest['started_at'][11:19]}: {latest['total_ms']:,.1f} ms{peak}")
+        
+        stages = pd.DataFrame(latest['stages'])
+        if len(stages):
+            stages['stage'] = ['\u2003' * depth + name for depth, name in zip(stages['depth'], stages['stage'])]
+            stages = stages.drop(columns='depth').dropna(axis=1, how='all')
+            st.dataframe(stages, use_container_width=True, hide_index=True)
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("**Cache activity (this rerun, all sessions)**")
+            cache_rows = pd.DataFrame.from_dict(latest['caches'], orient='index')
+            st.dataframe(cache_rows, use_container_width=True)
+        with col2:
+            st.markdown("**Recent reruns (ms)**")
+            history = pd.DataFrame([
+                {
+                    'run': profile.run_id,
+                    'total': round(profile.total_ms, 1),
+                    **{name: round(entry['ms'], 1) for name, entry in profile.stages.items() if entry['depth'] == 0}
+                }
+                for profile in profiles
+            ]).set_index('run')
+            st.dataframe(history, use_container_width=True)
+        
+        # Memory: the dataset view is held once; sessions only add their filtered rows and state
+        sessions = memory.sessions()
+        st.markdown(
+            f"**Memory:** shared dataset {format_bytes(memory.dataset.get('nbytes', 0))} · "
+            f"{len(sessions)} {'session' if len(sessions) == 1 else 'sessions'} holding "
+            f"{format_bytes(memory.total())} beyond it · result cache "
+            f"{format_bytes(memory.results.get('nbytes', 0))} of {format_bytes(memory.results.get('maxbytes') or 0)}"
+        )
+        current = get_session_id()
+        session_rows = pd.DataFrame([
+            {
+                'session': ('▶ ' if sid == current else '') + sid[:8],
+                'view_kib': round(entry['view_bytes'] / 1024, 1),
+                'state_kib': round(entry['state_bytes'] / 1024, 1),
+                'idle_s': round(time.time() - entry['seen']),
+            }
+            for sid, entry in sessions.items()
+        ])
+        st.dataframe(session_rows, use_container_width=True, hide_index=True)
+        
+        if compaction is not None:
+            before, after = compaction['bytes_before'].sum(), compaction['bytes_after'].sum()
+            st.markdown(
+                f"**Column compaction:** {format_bytes(before)} → {format_bytes(after)} "
+                f"({format_bytes(before - after)} saved)"
+            )
+            st.dataframe(compaction, use_container_width=True)
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.download_button(
+                "Download reruns (JSON lines)",
+                data=json_lines(reversed(profiles)),
+                file_name="apmb_profile.jsonl",
+                mime="application/x-ndjson",
+                key="download_profile_jsonl"
+            )
+        with col2:
+            st.download_button(
+                "Download metrics (Prometheus)",
+                data=prometheus_text(log, caches, memory),
+                file_name="apmb_metrics.prom",
+                mime="text/plain",
+                key="download_profile_prom"
+            )
@@ -0,0 +1,336 @@
+"""
+Dashboard page: sidebar filters and exports, the analysis views and footer
+
+Everything Streamlit renders happens inside `main()`, so importing this
+module (or anything in `apmb`) has no side effects.
+"""
+
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+from ..cache import FilterKey
+from ..charts import LOCATION_CHART_COLUMNS
+from ..config import get_setting
+from ..data_sources import get_data_source
+from ..events import get_as_of_date
+from ..exports import csv_bytes
+from ..instrumentation import get_profiling_mode, profile_rerun, stage
+from ..kpis import kpis_from_sums
+from ..locations import location_totals
+from ..pdf_report import BATCH_GROUPS, build_batch_zip, build_executive_summary_pdf, pdf_available
+from ..query import RANGE_COLUMNS, RANGE_LABELS, plan_query, positions_mask, run_query
+from ..report import generate_executive_summary_html
+from ..snapshots import snapshots_available
+from .auth import check_password
+from .components import (
+    background_download_button, lazy_download_button, poll_background_exports, render_interaction_form,
+    render_profiling_panel
+)
+from .resources import (
+    calculate_kpis, get_dataset_store, get_dataset_view, get_event_store, get_profiled_caches, get_result_cache,
+    get_search_index, get_session_memory, get_snapshot_store, load_snapshot, record_profile, record_session_memory
+)
+from .styles import inject_styles
+from .tabs import ANALYSIS_TABS, get_tab_mode
+
+# Snapshots shown in the KPI card trend lines
+TREND_POINTS = 30
+
+
+# Main Application
+def main():
+    # Page Configuration
+    st.set_page_config(
+        page_title="APMB Investor Dashboard",
+        page_icon="🚢",
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+    
+    # Sessions share one dataset view per version: with Copy-on-Write, column
+    # projections and unfiltered views reuse its buffers and can never modify it
+    pd.set_option("mode.copy_on_write", True)
+    
+    # Check password before showing app
+    if not check_password():
+        st.stop()
+    
+    inject_styles()
+    
+    # Opt-in profiling (PROFILING setting): each stage of the rerun is timed
+    caches = get_profiled_caches()
+    with profile_rerun(get_profiling_mode(), caches) as profile:
+        render_dashboard()
+    
+    if profile is not None:
+        compaction = get_dataset_store(repr(get_data_source())).source.compaction
+        render_profiling_panel(record_profile(profile, caches), caches, get_session_memory(), compaction)
+    
+    poll_background_exports()
+
+
+def render_dashboard():
+    """Header, sidebar filters and exports, the analysis views and footer"""
+    # Enhanced Header with better spacing
+    st.markdown('<div class="main-header">🚢 APMB Investor Tracking Dashboard</div>', unsafe_allow_html=True)
+    st.markdown('<div class="sub-header">Andhra Pradesh Maritime Board - Strategic Investment Intelligence Platform</div>', unsafe_allow_html=True)
+    st.markdown('<div style="margin-bottom: 2rem;"></div>', unsafe_allow_html=True)
+    
+    # Daily snapshots (SNAPSHOT_DIR): any recorded date can be viewed instead of the live data
+    snapshots = get_snapshot_store(get_setting("SNAPSHOT_DIR"))
+    history_day = None
+    if snapshots.enabled and snapshots.dates():
+        history_day = st.sidebar.selectbox(
+            "📅 Portfolio as of",
+            [None] + snapshots.dates(),
+            format_func=lambda day: "Latest" if day is None else f"{day:%d %b %Y}",
+            key="snapshot_day",
+            help="Show the portfolio as it was recorded on a past date"
+        )
+    elif get_setting("SNAPSHOT_DIR") and not snapshots_available():
+        st.sidebar.caption("Install `pyarrow` to enable daily snapshots")
+    
+    # Load data: edits to the source are applied incrementally on a later rerun
+    with stage("load_data"):
+        store = get_dataset_store(repr(get_data_source()))
+        dataset = store.refresh() if history_day is None else load_snapshot(snapshots, history_day)
+        
+        # Recency, engagement and risk scores from the interaction log, measured at the reporting date
+        events = get_event_store(get_setting("EVENT_LOG_PATH")).refresh()
+        as_of = get_as_of_date() if history_day is None else pd.Timestamp(history_day)
+        version = f"{dataset.version}:{events.version}:{as_of:%Y%m%d}"
+        df, filter_index, sorted_columns, cube = get_dataset_view(version, dataset, events, as_of)
+    location_bridge = dataset.bridge
+    result_cache = get_result_cache()
+    
+    # One snapshot per reporting date, with the portfolio KPIs its trend lines read. Keyed on the
+    # dataset version: logged interactions alone do not change the stored rows, so they do not rewrite it
+    if history_day is None and not snapshots.recorded(as_of.date(), dataset.version):
+        with stage("snapshot"):
+            rows = dataset.df.take(dataset.live_positions())
+            snapshots.record(as_of.date(), rows, dataset.version, kpis_from_sums(cube.sums()))
+    
+    # Built once per dataset version, so searching never re-scans the text
+    with stage("search_index"):
+        search_index = get_search_index(dataset)
+    
+    # Sidebar filters
+    st.sidebar.header("🔍 Filters")
+    
+    # Fuzzy search over firm, support requested, next action, sector and location
+    search_query = st.sidebar.text_input(
+        "Search",
+        key="search_query",
+        placeholder="Firm, sector, port, support or next action",
+        help="Typo-tolerant; matches are ranked and highlighted in the tables"
+    ).strip()
+    
+    # Multi-value filters (none selected means all); locations are individual ports
+    selected_locations = st.sidebar.multiselect(
+        "Location", filter_index.options('Location_Interest'), placeholder="All locations"
+    )
+    selected_investors = st.sidebar.multiselect(
+        "Investor Type", filter_index.options('Investor_Type'), placeholder="All investor types"
+    )
+    selected_stages = st.sidebar.multiselect(
+        "Current Stage", filter_index.options('Current_Stage'), placeholder="All stages"
+    )
+    selected_risks = st.sidebar.multiselect(
+        "Risk Status", filter_index.options('Risk_Status'), placeholder="All risk statuses"
+    )
+    
+    # Range filters: a range only applies once narrowed (rows without a value then drop out)
+    ranges = {}
+    with st.sidebar.expander("📏 Range Filters"):
+        for col in RANGE_COLUMNS:
+            bounds = sorted_columns.bounds(col)
+            if bounds is None or bounds[0] == bounds[1]:
+                continue
+            key = f"range_{col}"
+            if key in st.session_state:
+                # Reset a stored range that no longer fits the data
+                low, high = st.session_state[key]
+                if low < bounds[0] or high > bounds[1]:
+                    del st.session_state[key]
+            chosen = st.slider(RANGE_LABELS[col], min_value=bounds[0], max_value=bounds[1], value=bounds, key=key)
+            if tuple(chosen) != bounds:
+                ranges[col] = tuple(chosen)
+    
+    # Data refresh status
+    if history_day is not None:
+        st.sidebar.info(f"🕰️ Showing the snapshot of {history_day:%d %b %Y}")
+    elif store.last_error is not None:
+        st.sidebar.warning(f"⚠️ Data refresh failed, showing the last loaded data: {store.last_error}")
+    elif store.last_change is not None:
+        change = store.last_change
+        if change['mode'] == 'incremental':
+            summary = f"+{change['inserted']} new, {change['updated']} updated, -{change['deleted']} removed"
+        else:
+            summary = f"reloaded {change['rows']} investors"
+        st.sidebar.caption(f"🔄 Data updated at {change['at'].strftime('%H:%M:%S')}: {summary}")
+    
+    selections = {
+        'Location_Interest': tuple(selected_locations),
+        'Investor_Type': tuple(selected_investors),
+        'Current_Stage': tuple(selected_stages),
+        'Risk_Status': tuple(selected_risks)
+    }
+    
+    # Derived results are cached on the filter state, never on the frame itself
+    filter_key = FilterKey(
+        version,
+        selections['Location_Interest'],
+        selections['Investor_Type'],
+        selections['Current_Stage'],
+        selections['Risk_Status'],
+        search_query,
+        tuple(sorted(ranges.items()))
+    )
+    
+    # Apply filters as one query plan: the most selective predicate picks the
+    # candidate rows, the others only check those; no copy when unfiltered
+    with stage("filter"):
+        plan = plan_query(filter_index, sorted_columns, selections, ranges)
+        positions = result_cache.get_or_compute(
+            (filter_key, 'rows'),
+            lambda: run_query(plan, filter_index, sorted_columns)
+        )
+    
+    if search_query:
+        # Ranked matches among the filtered rows, best first
+        with stage("search"):
+            positions, _ = result_cache.get_or_compute(
+                (filter_key, 'search'),
+                lambda: search_index.search(search_query, positions_mask(positions, len(df)))
+            )
+        st.sidebar.caption(f"🔎 {len(positions)} {'match' if len(positions) == 1 else 'matches'}, best first")
+    # Sessions with the same filters share one gathered frame
+    df_filtered = df if positions is None else result_cache.get_or_compute(
+        (filter_key, 'frame'),
+        lambda: df.take(positions)
+    )
+    record_session_memory(filter_key, df_filtered, df)
+    
+    # KPIs and per-port totals: sidebar selections read them from the rollup cube,
+    # search and range filters (per-row predicates) aggregate the filtered rows
+    with stage("kpis"):
+        if not search_query and not ranges:
+            kpis = kpis_from_sums(cube.sums(selections))
+            port_totals = cube.location_totals(selections, LOCATION_CHART_COLUMNS)
+            if snapshots.enabled and positions is None:
+                # Trend lines cover the whole portfolio, so they are shown only while unfiltered
+                kpis['Trends'] = snapshots.trend(history_day or as_of.date(), TREND_POINTS)
+        else:
+            kpis = result_cache.get_or_compute((filter_key, 'kpis'), lambda: calculate_kpis(df_filtered))
+            port_totals = result_cache.get_or_compute(
+                (filter_key, 'port_totals'),
+                lambda: location_totals(df_filtered, LOCATION_CHART_COLUMNS, location_bridge)
+            )
+    
+    # Download buttons in sidebar
+    st.sidebar.markdown("---")
+    st.sidebar.markdown("### 📥 Export Options")
+    
+    # Exports are only serialized once requested, then memoized per filter state
+    lazy_download_button(
+        "📊 Download Data (CSV)",
+        "📊 Prepare Data Export (CSV)",
+        key=(filter_key, 'csv'),
+        build=lambda: csv_bytes(df_filtered),
+        file_name=f"apmb_investors_{datetime.now().strftime('%Y%m%d')}.csv",
+        mime="text/csv"
+    )
+    
+    # Generate and export Executive Summary HTML
+    st.sidebar.markdown("")
+    include_appendix = st.sidebar.checkbox(
+        "Include full investor appendix",
+        value=False,
+        help="Append a table of every investor in the current filter to the executive summary"
+    )
+    lazy_download_button(
+        "📄 Executive Summary (HTML)",
+        "📄 Prepare Executive Summary",
+        key=(filter_key, 'executive_html', datetime.now().date(), include_appendix),
+        build=lambda: generate_executive_summary_html(df_filtered, kpis, include_appendix, location_bridge),
+        file_name=f"apmb_executive_summary_{datetime.now().strftime('%Y%m%d')}.html",
+        mime="text/html",
+        help="Download executive summary - Open in browser and print to PDF"
+    )
+    
+    # Native PDF exports are rendered on a background worker
+    st.sidebar.markdown("")
+    if pdf_available():
+        background_download_button(
+            "📕 Executive Summary (PDF)",
+            "📕 Prepare Executive Summary (PDF)",
+            key=(filter_key, 'executive_pdf', datetime.now().date()),
+            build=lambda: build_executive_summary_pdf(df_filtered, kpis, location_bridge),
+            file_name=f"apmb_executive_summary_{datetime.now().strftime('%Y%m%d')}.pdf",
+            mime="application/pdf"
+        )
+        batch_by = st.sidebar.selectbox(
+            "📦 Batch PDF Reports: one per",
+            BATCH_GROUPS,
+            key="batch_pdf_group"
+        )
+        background_download_button(
+            "📦 Download Batch PDFs (ZIP)",
+            "📦 Prepare Batch PDFs",
+            key=(filter_key, 'batch_pdf', datetime.now().date(), batch_by),
+            build=lambda: build_batch_zip(df_filtered, batch_by, location_bridge),
+            file_name=f"apmb_{batch_by}_reports_{datetime.now().strftime('%Y%m%d')}.zip",
+            mime="application/zip",
+            help="Executive summary PDFs for every port or investor in the current filter"
+        )
+    else:
+        st.sidebar.caption("Install `fpdf2` to enable native PDF export")
+    
+    # Interaction log (live data only)
+    if events.enabled and history_day is None:
+        render_interaction_form(events, dataset, as_of)
+    
+    # Analysis views: in lazy mode only the selected view builds its charts and tables
+    tab_labels = [label for label, _ in ANALYSIS_TABS]
+    if get_tab_mode() == 'lazy':
+        active_label = st.radio(
+            "Analysis view",
+            tab_labels,
+            horizontal=True,
+            key="active_tab",
+            label_visibility="collapsed"
+        )
+        render = dict(ANALYSIS_TABS)[active_label]
+        with stage("views"):
+            render(df_filtered, kpis, port_totals, filter_key)
+    else:
+        with stage("views"):
+            for tab, (_, render) in zip(st.tabs(tab_labels), ANALYSIS_TABS):
+                with tab:
+                    render(df_filtered, kpis, port_totals, filter_key)
+    
+    # Enhanced Professional Footer
+    st.markdown('<div style="margin-top: 4rem;"></div>', unsafe_allow_html=True)
+    st.markdown(f"""
+    <div class="dashboard-footer">
+        <div class="footer-title">🚢 AP Maritime Strategic Dashboard</div>
+        <div class="footer-subtitle">
+            Andhra Pradesh Maritime Board • Government of Andhra Pradesh<br>
+            Strategic Investment Intelligence & Portfolio Management System
+        </div>
+        <div style="margin: 1.5rem 0; padding: 1rem 0; border-top: 1px solid rgba(255,255,255,0.1); border-bottom: 1px solid rgba(255,255,255,0.1);">
+            <strong>Dashboard Snapshot:</strong> Tracking {len(df_filtered)} Investors • 
+            ₹{kpis['Total_Investment']:,.0f} Cr Potential Investment • 
+            {kpis['Total_Direct_Employment'] + kpis['Total_Indirect_Employment']:,.0f} Jobs Impact
+        </div>
+        <div class="footer-meta">
+            Version 2.0 • Last Updated: {datetime.now().strftime('%B %d, %Y at %I:%M %p')} • 
+            Powered by Advanced Analytics<br>
+            <span style="font-size: 0.8rem; opacity: 0.5;">
+                For official use only • Confidential investment data
+            </span>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
@@ -0,0 +1,198 @@
+"""
+Process-wide resources shared by every session: dataset and event stores,
+dataset views, search index, result and figure caches, the export pool, the
+profiling log, per-session memory accounting and the snapshot store
+"""
+
+import json
+
+import pandas as pd
+import streamlit as st
+
+from ..cache import LRUCache
+from ..charts import figure_json
+from ..config import get_setting
+from ..data_sources import get_data_source
+from ..dataset import DatasetStore, build_dataset, build_dataset_view
+from ..events import EventStore
+from ..instrumentation import RerunLog, export_profile, stage
+from ..jobs import BackgroundJobs
+from ..kpis import compute_kpis
+from ..memory import SessionMemory, object_nbytes, owned_nbytes
+from ..search import SearchIndex
+from ..snapshots import SnapshotSource, SnapshotStore
+
+
+@st.cache_resource
+def get_dataset_store(source_id=None):
+    """Process-wide dataset for the configured source, refreshed incrementally
+
+    `source_id` (the data source's repr) keys the store, so pointing the app at
+    a different source builds a new one.
+    """
+    return DatasetStore(
+        get_data_source(),
+        refresh_seconds=float(get_setting("REFRESH_SECONDS", 5)),
+        mode=str(get_setting("REFRESH_MODE", "incremental")).lower()
+    )
+
+
+def load_data():
+    """Current dataset snapshot, with any source edits applied"""
+    return get_dataset_store(repr(get_data_source())).refresh()
+
+
+@st.cache_resource
+def get_event_store(path=None):
+    """Process-wide interaction event log (EVENT_LOG_PATH) and its activity index"""
+    return EventStore(path)
+
+
+@st.cache_resource
+def get_view_cache():
+    """Dataset views with activity and risk columns; only the latest versions are kept"""
+    return LRUCache(maxsize=2)
+
+
+@st.cache_resource
+def get_view_bases():
+    """Latest (dataset, view) per events version and as-of date, extended by the next dataset version"""
+    return LRUCache(maxsize=2)
+
+
+def get_dataset_view(version, dataset, events, as_of):
+    """View of `dataset` at `as_of` (see `build_dataset_view`), built once per `version` for every session"""
+    def build():
+        bases = get_view_bases()
+        view = build_dataset_view(dataset, events, as_of, bases.get((events.version, as_of)))
+        bases.put((events.version, as_of), (dataset, view))
+        return view
+    return get_view_cache().get_or_compute(version, build)
+
+
+@st.cache_resource
+def get_search_cache():
+    """Search indexes of the latest dataset versions"""
+    return LRUCache(maxsize=2)
+
+
+def get_search_index(dataset):
+    """Trigram search index over the dataset's text fields, built once per dataset version"""
+    return get_search_cache().get_or_compute(dataset.version, lambda: SearchIndex.build(dataset.df))
+
+
+@st.cache_resource
+def get_figure_cache():
+    """Process-wide cache of serialized Plotly figures, bounded by total JSON size"""
+    return LRUCache(maxsize=None, maxbytes=int(get_setting("FIGURE_CACHE_MB", 64)) * 1024 * 1024)
+
+
+def cached_figure(filter_key, chart_id, build):
+    """Figure `chart_id` for the current filters, rebuilt from cached JSON on a hit"""
+    import plotly.graph_objects as go
+    
+    with stage(f"chart.{chart_id}"):
+        spec = get_figure_cache().get_or_compute((filter_key, chart_id), lambda: figure_json(build()))
+        # The spec was validated when first built; skipping re-validation keeps hits cheap
+        return go.Figure(json.loads(spec), _validate=False)
+
+
+@st.cache_resource
+def get_result_cache():
+    """Process-wide LRU of results derived from filtered views, keyed by FilterKey
+
+    Bounded by entry count (RESULT_CACHE_SIZE) and by the summed size of the
+    frames, arrays and export bytes it holds (RESULT_CACHE_MB).
+    """
+    return LRUCache(
+        maxsize=int(get_setting("RESULT_CACHE_SIZE", 256)),
+        maxbytes=int(get_setting("RESULT_CACHE_MB", 256)) * 1024 * 1024,
+        sizeof=object_nbytes
+    )
+
+
+@st.cache_resource
+def get_export_jobs():
+    """Process-wide worker pool for PDF and batch exports"""
+    return BackgroundJobs(max_workers=int(get_setting("PDF_WORKERS", 2)))
+
+
+# KPI Calculation Functions
+def calculate_kpis(df):
+    """Calculate executive KPIs, risk/stage/type breakdowns and per-type sums in one pass"""
+    return compute_kpis(df)
+
+
+@st.cache_resource
+def get_rerun_log():
+    """Process-wide ring buffer of the last PROFILE_HISTORY profiled reruns"""
+    return RerunLog(maxlen=int(get_setting("PROFILE_HISTORY", 50)))
+
+
+def get_profiled_caches():
+    """The process-wide caches whose activity is profiled, by name"""
+    return {
+        'results': get_result_cache(),
+        'figures': get_figure_cache(),
+        'views': get_view_cache(),
+        'search': get_search_cache(),
+        'snapshots': get_snapshot_cache(),
+    }
+
+
+def record_profile(profile, caches):
+    """Keep a finished rerun profile and export it to PROFILE_LOG_PATH, if set"""
+    log = get_rerun_log()
+    log.append(profile)
+    path = get_setting("PROFILE_LOG_PATH")
+    if path:
+        export_profile(path, profile, log, caches, get_session_memory())
+    return log
+
+
+@st.cache_resource
+def get_session_memory():
+    """Process-wide memory figures of the shared dataset and every session"""
+    return SessionMemory()
+
+
+def get_session_id():
+    """Id of the browser session running this script ('local' outside a Streamlit server)"""
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+    
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx is not None else 'local'
+
+
+def record_session_memory(filter_key, view, base):
+    """Account what this session holds beyond the shared dataset view `base`"""
+    memory = get_session_memory()
+    if memory.dataset.get('version') != filter_key.version:
+        # Deep size (strings included), measured once per dataset version
+        memory.record_dataset(filter_key.version, int(base.memory_usage(deep=True).sum()))
+    state_bytes = sum(object_nbytes(value) for value in st.session_state.to_dict().values())
+    memory.record(get_session_id(), filter_key, owned_nbytes(view, base), state_bytes)
+    results = get_result_cache().stats()
+    memory.record_results(results['nbytes'], results['maxbytes'])
+
+
+@st.cache_resource
+def get_snapshot_store(path=None):
+    """Process-wide daily snapshot store (SNAPSHOT_DIR) and its KPI rollups"""
+    return SnapshotStore(path)
+
+
+@st.cache_resource
+def get_snapshot_cache():
+    """Datasets of the past snapshots viewed most recently"""
+    return LRUCache(maxsize=2)
+
+
+def load_snapshot(snapshots, day):
+    """Dataset of the snapshot of `day`, read from disk on first use"""
+    rollups = snapshots.rollups()
+    version = rollups['version'][(rollups['date'] == pd.Timestamp(day)).to_numpy()].iloc[0]
+    key = (snapshots.path, day, version)
+    return get_snapshot_cache().get_or_compute(
+        key, lambda: build_dataset(SnapshotSource(snapshots, day).load(), f"snapshot:{day:%Y-%m-%d}:{version}")
+    )
@@ -0,0 +1,290 @@
+"""
+Dashboard CSS (animations, KPI cards, tabs, alerts and footer)
+"""
+
+import streamlit as st
+
+DASHBOARD_CSS = """
+<style>
+    /* Main container spacing */
+    .main > div {
+        padding-top: 2rem;
+        padding-bottom: 3rem;
+    }
+    
+    /* Headers */
+    .main-header {
+        font-size: 3rem;
+        font-weight: 800;
+        background: linear-gradient(135deg, #1e3a8a 0%, #3b82f6 100%);
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+        margin-bottom: 0.5rem;
+        letter-spacing: -1px;
+    }
+    .sub-header {
+        font-size: 1.3rem;
+        color: #64748b;
+        margin-bottom: 3rem;
+        font-weight: 500;
+    }
+    
+    /* Animated KPI Cards */
+    .kpi-card {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        padding: 2rem 1.5rem;
+        border-radius: 16px;
+        color: white;
+        box-shadow: 0 10px 30px rgba(102, 126, 234, 0.3);
+        transition: transform 0.3s ease, box-shadow 0.3s ease;
+        height: 100%;
+        position: relative;
+        overflow: hidden;
+    }
+    
+    .kpi-card::before {
+        content: '';
+        position: absolute;
+        top: -50%;
+        right: -50%;
+        width: 200%;
+        height: 200%;
+        background: radial-gradient(circle, rgba(255,255,255,0.1) 0%, transparent 70%);
+        animation: pulse 3s ease-in-out infinite;
+    }
+    
+    @keyframes pulse {
+        0%, 100% { transform: scale(1); opacity: 0.5; }
+        50% { transform: scale(1.1); opacity: 0.8; }
+    }
+    
+    .kpi-card:hover {
+        transform: translateY(-5px);
+        box-shadow: 0 15px 40px rgba(102, 126, 234, 0.4);
+    }
+    
+    .kpi-value {
+        font-size: 2.8rem;
+        font-weight: 800;
+        margin: 0.8rem 0;
+        text-shadow: 2px 2px 4px rgba(0,0,0,0.1);
+        animation: countUp 1.5s ease-out;
+    }
+    
+    @keyframes countUp {
+        from { opacity: 0; transform: translateY(20px); }
+        to { opacity: 1; transform: translateY(0); }
+    }
+    
+    .kpi-label {
+        font-size: 0.95rem;
+        opacity: 0.95;
+        text-transform: uppercase;
+        letter-spacing: 1.5px;
+        font-weight: 600;
+        display: flex;
+        align-items: center;
+        gap: 0.5rem;
+    }
+    
+    .kpi-icon {
+        font-size: 1.5rem;
+    }
+    
+    /* KPI trend since earlier snapshots */
+    .kpi-trend {
+        display: flex;
+        align-items: center;
+        gap: 0.6rem;
+        font-size: 0.8rem;
+        opacity: 0.9;
+    }
+    
+    .kpi-sparkline {
+        width: 120px;
+        height: 28px;
+        flex-shrink: 0;
+    }
+    
+    .kpi-sparkline polyline {
+        fill: none;
+        stroke: currentColor;
+        stroke-width: 2;
+        vector-effect: non-scaling-stroke;
+    }
+    
+    /* Risk status colors */
+    .risk-active {
+        background: linear-gradient(135deg, #10b981 0%, #059669 100%);
+    }
+    
+    .risk-delayed {
+        background: linear-gradient(135deg, #f59e0b 0%, #d97706 100%);
+    }
+    
+    .risk-stalled {
+        background: linear-gradient(135deg, #ef4444 0%, #dc2626 100%);
+    }
+    
+    .risk-closed {
+        background: linear-gradient(135deg, #6b7280 0%, #4b5563 100%);
+    }
+    
+    /* Metric containers */
+    .metric-container {
+        background: white;
+        padding: 2rem;
+        border-radius: 12px;
+        border-left: 5px solid #667eea;
+        box-shadow: 0 4px 12px rgba(0,0,0,0.08);
+        transition: transform 0.2s ease;
+    }
+    
+    .metric-container:hover {
+        transform: translateX(5px);
+        box-shadow: 0 6px 16px rgba(0,0,0,0.12);
+    }
+    
+    /* Tabs styling */
+    .stTabs [data-baseweb="tab-list"] {
+        gap: 2.5rem;
+        background: linear-gradient(to right, #f8fafc 0%, #f1f5f9 100%);
+        padding: 1rem 2rem;
+        border-radius: 12px;
+        margin-bottom: 2rem;
+    }
+    
+    .stTabs [data-baseweb="tab"] {
+        font-size: 1.15rem;
+        font-weight: 600;
+        color: #64748b;
+        padding: 1rem 1.5rem;
+        border-radius: 8px;
+        transition: all 0.3s ease;
+    }
+    
+    .stTabs [data-baseweb="tab"]:hover {
+        background: white;
+        color: #3b82f6;
+    }
+    
+    .stTabs [data-baseweb="tab"][aria-selected="true"] {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white;
+    }
+    
+    /* Lazy tab navigator (TAB_MODE = "lazy") */
+    .main div[role="radiogroup"] {
+        gap: 2.5rem;
+        background: linear-gradient(to right, #f8fafc 0%, #f1f5f9 100%);
+        padding: 1rem 2rem;
+        border-radius: 12px;
+        margin-bottom: 2rem;
+    }
+    
+    .main div[role="radiogroup"] label p {
+        font-size: 1.15rem;
+        font-weight: 600;
+        color: #64748b;
+    }
+    
+    /* Data tables */
+    .dataframe {
+        border-radius: 8px;
+        overflow: hidden;
+    }
+    
+    /* Section spacing */
+    .section-gap {
+        margin: 3rem 0;
+    }
+    
+    /* Footer */
+    .dashboard-footer {
+        background: linear-gradient(135deg, #1e293b 0%, #334155 100%);
+        color: white;
+        padding: 2.5rem 2rem;
+        border-radius: 16px;
+        margin-top: 4rem;
+        text-align: center;
+        box-shadow: 0 -4px 20px rgba(0,0,0,0.1);
+    }
+    
+    .footer-title {
+        font-size: 1.8rem;
+        font-weight: 700;
+        margin-bottom: 0.5rem;
+        background: linear-gradient(135deg, #60a5fa 0%, #a78bfa 100%);
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+    }
+    
+    .footer-subtitle {
+        font-size: 1rem;
+        opacity: 0.8;
+        margin-bottom: 1rem;
+    }
+    
+    .footer-meta {
+        font-size: 0.9rem;
+        opacity: 0.6;
+        margin-top: 1rem;
+    }
+    
+    /* Button styling */
+    .stDownloadButton > button {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white;
+        border: none;
+        padding: 0.75rem 2rem;
+        border-radius: 8px;
+        font-weight: 600;
+        transition: all 0.3s ease;
+    }
+    
+    .stDownloadButton > button:hover {
+        transform: translateY(-2px);
+        box-shadow: 0 8px 20px rgba(102, 126, 234, 0.4);
+    }
+    
+    /* Spacing utilities */
+    div[data-testid="stHorizontalBlock"] {
+        gap: 1.5rem;
+    }
+    
+    div[data-testid="stVerticalBlock"] > div {
+        gap: 1.5rem;
+    }
+    
+    /* Alert boxes */
+    .alert-box {
+        padding: 1.5rem;
+        border-radius: 12px;
+        margin: 1.5rem 0;
+        font-weight: 500;
+    }
+    
+    .alert-warning {
+        background: linear-gradient(135deg, #fef3c7 0%, #fde68a 100%);
+        border-left: 4px solid #f59e0b;
+        color: #92400e;
+    }
+    
+    .alert-success {
+        background: linear-gradient(135deg, #d1fae5 0%, #a7f3d0 100%);
+        border-left: 4px solid #10b981;
+        color: #065f46;
+    }
+    
+    .alert-danger {
+        background: linear-gradient(135deg, #fee2e2 0%, #fecaca 100%);
+        border-left: 4px solid #ef4444;
+        color: #991b1b;
+    }
+</style>
+"""
+
+
+def inject_styles():
+    """Add the dashboard CSS to the page"""
+    st.markdown(DASHBOARD_CSS, unsafe_allow_html=True)
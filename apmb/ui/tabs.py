@@ -0,0 +1,317 @@
+"""
+The five analysis views; each takes the filtered frame, its KPIs, its
+per-port totals (`location_totals` of LOCATION_CHART_COLUMNS) and the FilterKey
+"""
+
+import numpy as np
+import streamlit as st
+
+from ..charts import (
+    plot_country_distribution, plot_employment_by_location, plot_employment_impact,
+    plot_international_infrastructure, plot_investment_by_location, plot_investor_type_pie,
+    plot_land_demand_by_location, plot_risk_distribution, plot_stage_funnel, plot_waterfront_draft_scatter
+)
+from ..config import get_setting
+from ..locations import ALLOCATION_LABELS, get_allocation_rule
+from ..tables import RISK_CELL_STYLES, RISK_ROW_COLORS
+from .components import create_kpi_card, render_table
+from .resources import cached_figure, get_result_cache
+
+
+def render_executive_summary(df_filtered, kpis, port_totals, filter_key):
+    """Tab 1: KPI cards, investment charts and pipeline funnel"""
+    st.markdown("### 🎯 Key Performance Indicators")
+    st.markdown('<div style="margin-bottom: 1.5rem;"></div>', unsafe_allow_html=True)
+    
+    # KPI values by snapshot date, present for the unfiltered portfolio when snapshots are recorded
+    trends = kpis['Trends'].set_index('date') if 'Trends' in kpis else {}
+    
+    # KPI Cards Row 1
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.markdown(create_kpi_card("Total Investment", kpis['Total_Investment'], "💰", trend=trends.get('Total_Investment')), unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(create_kpi_card("Direct Jobs", kpis['Total_Direct_Employment'], "👔", trend=trends.get('Total_Direct_Employment')), unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown(create_kpi_card("Active Investors", kpis['Active_Investors'], "✅", "active", trend=trends.get('Active_Investors')), unsafe_allow_html=True)
+    
+    with col4:
+        st.markdown(create_kpi_card("MoUs Signed", kpis['MoUs_Signed'], "📝", trend=trends.get('MoUs_Signed')), unsafe_allow_html=True)
+    
+    st.markdown('<div style="margin: 2rem 0;"></div>', unsafe_allow_html=True)
+    
+    # KPI Cards Row 2
+    col5, col6, col7, col8 = st.columns(4)
+    
+    with col5:
+        st.markdown(create_kpi_card("Land Required (Acres)", kpis['Total_Land_Requested'], "🏞️", trend=trends.get('Total_Land_Requested')), unsafe_allow_html=True)
+    
+    with col6:
+        st.markdown(create_kpi_card("Indirect Jobs", kpis['Total_Indirect_Employment'], "👥", trend=trends.get('Total_Indirect_Employment')), unsafe_allow_html=True)
+    
+    with col7:
+        st.markdown(create_kpi_card("Delayed/Stalled", kpis['Delayed_Stalled'], "⚠️", "delayed", trend=trends.get('Delayed_Stalled')), unsafe_allow_html=True)
+    
+    with col8:
+        st.markdown(create_kpi_card("Total Investors", kpis['Total_Investors'], "🏢", trend=trends.get('Total_Investors')), unsafe_allow_html=True)
+    
+    st.markdown('<div class="section-gap"></div>', unsafe_allow_html=True)
+    
+    # Charts
+    st.markdown("### 📈 Investment Analytics")
+    col_left, col_right = st.columns(2)
+    
+    with col_left:
+        st.plotly_chart(cached_figure(filter_key, 'investment_by_location', lambda: plot_investment_by_location(df_filtered, totals=port_totals)), use_container_width=True)
+        st.caption(ALLOCATION_LABELS[get_allocation_rule()])
+    
+    with col_right:
+        st.plotly_chart(cached_figure(filter_key, 'investor_type_pie', lambda: plot_investor_type_pie(df_filtered, kpis['Type_Counts'])), use_container_width=True)
+    
+    st.markdown('<div style="margin: 2rem 0;"></div>', unsafe_allow_html=True)
+    
+    st.plotly_chart(cached_figure(filter_key, 'stage_funnel', lambda: plot_stage_funnel(df_filtered, kpis['Stage_Counts'])), use_container_width=True)
+    
+    st.markdown('<div class="section-gap"></div>', unsafe_allow_html=True)
+    
+    # Summary statistics
+    st.markdown("### 💼 Investment Summary by Type")
+    col_stats1, col_stats2 = st.columns(2)
+    
+    with col_stats1:
+        domestic_inv = kpis['Investment_By_Type']['Domestic']
+        st.metric("Domestic Investment", f"₹{domestic_inv:,.0f} Cr" if not np.isnan(domestic_inv) else "N/A")
+    
+    with col_stats2:
+        intl_inv = kpis['Investment_By_Type']['International']
+        st.metric("International Investment", f"₹{intl_inv:,.0f} Cr" if not np.isnan(intl_inv) else "N/A")
+
+
+def render_land_infrastructure(df_filtered, kpis, port_totals, filter_key):
+    """Tab 2: land, waterfront and draft requirements"""
+    st.markdown("### 🏗️ Land & Infrastructure Requirements")
+    st.markdown('<div style="margin-bottom: 2rem;"></div>', unsafe_allow_html=True)
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        total_land = kpis['Total_Land_Requested']
+        st.metric("Total Land Demand", f"{total_land:,.0f} Acres" if not np.isnan(total_land) else "N/A")
+    
+    with col2:
+        total_waterfront = kpis['Total_Waterfront']
+        st.metric("Total Waterfront", f"{total_waterfront:,.0f} m" if not np.isnan(total_waterfront) else "N/A")
+    
+    with col3:
+        avg_draft = kpis['Avg_Draft']
+        st.metric("Average Draft Required", f"{avg_draft:.1f} m" if not np.isnan(avg_draft) else "N/A")
+    
+    st.markdown('<div style="margin: 2rem 0;"></div>', unsafe_allow_html=True)
+    
+    st.plotly_chart(cached_figure(filter_key, 'land_demand_by_location', lambda: plot_land_demand_by_location(df_filtered, totals=port_totals)), use_container_width=True)
+    
+    st.markdown('<div style="margin: 2rem 0;"></div>', unsafe_allow_html=True)
+    
+    st.plotly_chart(cached_figure(filter_key, 'waterfront_draft_scatter', lambda: plot_waterfront_draft_scatter(df_filtered)), use_container_width=True)
+    
+    # Detailed table
+    st.markdown("### Infrastructure Requirements Heatmap")
+    infra_df = get_result_cache().get_or_compute(
+        (filter_key, 'infra_table'),
+        lambda: df_filtered[['Firm_Name', 'Location_Interest', 'Land_Requirement_Acres', 
+                             'Waterfront_Requirement_Meters', 'Draft_Requirement_Meters']].dropna(subset=['Land_Requirement_Acres'])
+    )
+    
+    render_table(
+        infra_df,
+        'infra_table',
+        filter_key,
+        height=400,
+        gradient_columns=('Land_Requirement_Acres', 'Waterfront_Requirement_Meters')
+    )
+
+
+def render_employment_impact(df_filtered, kpis, port_totals, filter_key):
+    """Tab 3: direct and indirect employment"""
+    st.markdown("### 👥 Employment Generation Potential")
+    st.markdown('<div style="margin-bottom: 2rem;"></div>', unsafe_allow_html=True)
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        total_direct = kpis['Total_Direct_Employment']
+        st.metric("Total Direct Jobs", f"{total_direct:,.0f}" if not np.isnan(total_direct) else "N/A")
+    
+    with col2:
+        total_indirect = kpis['Total_Indirect_Employment']
+        st.metric("Total Indirect Jobs", f"{total_indirect:,.0f}" if not np.isnan(total_indirect) else "N/A")
+    
+    with col3:
+        total_jobs = total_direct + total_indirect
+        st.metric("Total Employment", f"{total_jobs:,.0f}" if not np.isnan(total_jobs) else "N/A")
+    
+    st.markdown('<div style="margin: 2rem 0;"></div>', unsafe_allow_html=True)
+    
+    st.plotly_chart(cached_figure(filter_key, 'employment_impact', lambda: plot_employment_impact(df_filtered)), use_container_width=True)
+    
+    st.markdown('<div style="margin: 2rem 0;"></div>', unsafe_allow_html=True)
+    
+    # Location-wise employment
+    st.markdown("### 📍 Employment Distribution by Location")
+    st.plotly_chart(
+        cached_figure(filter_key, 'employment_by_location', lambda: plot_employment_by_location(df_filtered, totals=port_totals)),
+        use_container_width=True
+    )
+
+
+def render_risk_monitor(df_filtered, kpis, port_totals, filter_key):
+    """Tab 4: risk status cards, attention list and status table"""
+    st.markdown("### ⚠️ Risk & Follow-up Monitoring")
+    st.markdown('<div style="margin-bottom: 2rem;"></div>', unsafe_allow_html=True)
+    
+    # Enhanced status overview with color-coded cards
+    col1, col2, col3, col4 = st.columns(4)
+    
+    active_count = kpis['Risk_Counts']['Active']
+    delayed_count = kpis['Risk_Counts']['Delayed']
+    stalled_count = kpis['Risk_Counts']['Stalled']
+    closed_count = kpis['Risk_Counts']['Closed']
+    
+    with col1:
+        st.markdown(create_kpi_card("Active", active_count, "✅", "active"), unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(create_kpi_card("Delayed", delayed_count, "⏱️", "delayed"), unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown(create_kpi_card("Stalled", stalled_count, "⛔", "stalled"), unsafe_allow_html=True)
+    
+    with col4:
+        st.markdown(create_kpi_card("Closed", closed_count, "⚫", "closed"), unsafe_allow_html=True)
+    
+    st.markdown('<div class="section-gap"></div>', unsafe_allow_html=True)
+    
+    # Immediate attention list with enhanced alert box
+    st.markdown("### 🚨 Immediate Attention Required")
+    attention_df = get_result_cache().get_or_compute(
+        (filter_key, 'attention'),
+        lambda: df_filtered[df_filtered['Days_Since_Activity'] > 60].sort_values('Risk_Score', ascending=False)
+    )
+    
+    if len(attention_df) > 0:
+        st.markdown(f"""
+        <div class="alert-box alert-danger">
+            <strong>⚠️ Alert:</strong> {len(attention_df)} investors have not been contacted in over 60 days. 
+            Immediate follow-up action required to prevent further deterioration.
+        </div>
+        """, unsafe_allow_html=True)
+    
+        render_table(
+            attention_df[['Firm_Name', 'Current_Stage', 'Risk_Score', 'Days_Since_Activity', 'Last_Activity_Date',
+                          'Events_90d', 'Next_Action', 'Risk_Status']],
+            'attention_table',
+            filter_key,
+            height=300,
+            cell_styles={'Risk_Status': RISK_CELL_STYLES}
+        )
+    else:
+        st.markdown("""
+        <div class="alert-box alert-success">
+            <strong>✅ Excellent:</strong> All investors have been contacted within the last 60 days! 
+            Proactive engagement is maintaining strong pipeline health.
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown('<div class="section-gap"></div>', unsafe_allow_html=True)
+    
+    # Full risk monitor table
+    st.markdown("### Complete Investor Status Monitor")
+    
+    display_cols = ['Firm_Name', 'Investor_Type', 'Current_Stage', 'Risk_Status', 'Risk_Score',
+                    'Days_Since_Activity', 'Days_In_Stage', 'Next_Action', 'Last_Activity_Month']
+    if 'Risk_Status_Manual' in df_filtered:
+        display_cols.insert(4, 'Risk_Status_Manual')
+    
+    # Highest engine score first
+    monitor_df = get_result_cache().get_or_compute(
+        (filter_key, 'monitor_table'),
+        lambda: df_filtered[display_cols].sort_values('Risk_Score', ascending=False)
+    )
+    render_table(monitor_df, 'monitor_table', filter_key, height=500, row_colors=('Risk_Status', RISK_ROW_COLORS))
+    
+    # Risk distribution chart
+    st.markdown("### Risk Status Distribution")
+    st.plotly_chart(
+        cached_figure(filter_key, 'risk_distribution', lambda: plot_risk_distribution(df_filtered, kpis['Risk_Counts'])),
+        use_container_width=True
+    )
+
+
+def render_international_investors(df_filtered, kpis, port_totals, filter_key):
+    """Tab 5: international investor analysis"""
+    st.markdown("### 🌍 International Investor Analysis")
+    st.markdown('<div style="margin-bottom: 2rem;"></div>', unsafe_allow_html=True)
+    
+    df_intl = get_result_cache().get_or_compute(
+        (filter_key, 'international'),
+        lambda: df_filtered[df_filtered['Investor_Type'] == 'International']
+    )
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric("International Investors", len(df_intl))
+    
+    with col2:
+        active_intl = len(df_intl[df_intl['Risk_Status'] == 'Active'])
+        st.metric("Active International", active_intl)
+    
+    with col3:
+        countries = df_intl['Country'].nunique()
+        st.metric("Countries Represented", countries)
+    
+    st.markdown('<div style="margin: 2rem 0;"></div>', unsafe_allow_html=True)
+    
+    # Country-wise breakdown
+    st.markdown("### 🗺️ Country-wise Distribution")
+    st.plotly_chart(
+        cached_figure(filter_key, 'country_distribution', lambda: plot_country_distribution(df_intl)),
+        use_container_width=True
+    )
+    
+    # International investor details
+    st.markdown("### International Investor Details")
+    intl_display = df_intl[['Firm_Name', 'Country', 'Sector', 'Location_Interest', 
+                             'Current_Stage', 'Land_Requirement_Acres', 
+                             'Waterfront_Requirement_Meters', 'Risk_Status']]
+    
+    render_table(intl_display, 'intl_table', filter_key, height=400, cell_styles={'Risk_Status': RISK_CELL_STYLES})
+    
+    # Land and waterfront demand visualization
+    if len(df_intl[df_intl['Land_Requirement_Acres'].notna()]) > 0:
+        st.markdown("### Infrastructure Requirements - International Investors")
+    
+        st.plotly_chart(
+            cached_figure(filter_key, 'international_infrastructure', lambda: plot_international_infrastructure(df_intl)),
+            use_container_width=True
+        )
+
+
+ANALYSIS_TABS = [
+    ("📊 Executive Summary", render_executive_summary),
+    ("🏗️ Land & Infrastructure", render_land_infrastructure),
+    ("👥 Employment Impact", render_employment_impact),
+    ("⚠️ Risk Monitor", render_risk_monitor),
+    ("🌍 International Investors", render_international_investors)
+]
+
+
+def get_tab_mode():
+    """'lazy' renders only the selected analysis view; 'tabs' renders all five as st.tabs"""
+    mode = str(get_setting("TAB_MODE", "lazy")).lower()
+    if mode not in ('lazy', 'tabs'):
+        raise ValueError(f"Unknown TAB_MODE '{mode}'. Expected 'lazy' or 'tabs'")
+    return mode
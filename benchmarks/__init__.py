@@ -0,0 +1,3 @@
+"""
+Benchmarks for the dashboard hot paths at synthetic scale (python -m benchmarks.run)
+"""
@@ -0,0 +1,275 @@
+"""
+Benchmarks for the dashboard's data, view refresh, KPI, rollup cube, filter, chart, table and export paths
+
+    python -m benchmarks.run [--sizes 1000 10000 100000] [--repeat 5] [--only kpis chart]
+                             [--out results.json] [--baseline benchmarks/baseline.json]
+                             [--threshold 0.25] [--save-baseline] [--check]
+
+Each benchmark runs once to warm up and then `--repeat` times on a synthetic
+portfolio of every size (see `benchmarks.synthetic`); benchmarks slower than
+a second are repeated at most twice. Results are written as JSON:
+
+    {"schema": 1, "created": ..., "environment": {...},
+     "results": [{"name": "kpis.compute", "rows": 100000, "median_ms": 4.1, "min_ms": 3.9, "runs": 5}, ...]}
+
+and compared with the baseline. A benchmark regresses when its median is
+more than `--threshold` slower than the baseline's and at least 1 ms slower;
+`--check` then exits with status 1. Baselines are machine-specific: record
+one with `--save-baseline` on the machine that runs the comparison.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from apmb.batch import BOARD_CHARTS
+from apmb.charts import LOCATION_CHART_COLUMNS, figure_json
+from apmb.cube import RollupCube
+from apmb.dataset import apply_changes, build_dataset, build_dataset_view, diff_rows, with_view_columns
+from apmb.events import EventStore
+from apmb.exports import csv_bytes
+from apmb.kpis import compute_kpis, kpis_from_sums
+from apmb.locations import split_locations
+from apmb.pdf_report import build_executive_summary_pdf, pdf_available
+from apmb.query import SortedColumns, plan_query, run_query
+from apmb.report import generate_executive_summary_html
+from apmb.search import SearchIndex
+from apmb.tables import RISK_ROW_COLORS, column_ranges, style_page, table_positions
+
+from .synthetic import SyntheticSource
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+AS_OF = pd.Timestamp('2025-12-01')
+PAGE_SIZE = 50
+# Regressions smaller than this are treated as timer noise
+MIN_DELTA_MS = 1.0
+SLOW_MS = 1000.0
+
+
+def build_context(n_rows, seed=0):
+    """Everything the benchmarks start from, built outside the timed code"""
+    source = SyntheticSource(n_rows, seed)
+    raw = source.load()
+    dataset = build_dataset(raw, source.version())
+    events = EventStore()
+    df = with_view_columns(dataset.df, events, AS_OF)
+    filter_index = dataset.filter_index.with_column('Risk_Status', df['Risk_Status'])
+
+    # A small source edit, applied as an incremental refresh
+    edited = raw.copy()
+    edited.loc[:9, 'Investment_INR_Cr'] = 1.0
+    removed, appended, hashes, _ = diff_rows(dataset, edited)
+    refreshed = apply_changes(dataset, removed, appended, hashes, 'bench:edited')
+
+    # The busiest values, as a typical sidebar selection across all four dimensions
+    locations = split_locations(df['Location_Interest']).value_counts()
+    stages = df['Current_Stage'].value_counts()
+    selections = {
+        'Location_Interest': (locations.index[0],),
+        'Investor_Type': (df['Investor_Type'].value_counts().index[0],),
+        'Current_Stage': tuple(stages.index[:2]),
+        'Risk_Status': tuple(df['Risk_Status'].value_counts().index[:2]),
+    }
+    return {
+        'raw': raw,
+        'dataset': dataset,
+        'refreshed': refreshed,
+        'view_base': (dataset, build_dataset_view(dataset, events, AS_OF)),
+        'events': events,
+        'df': df,
+        'bridge': dataset.bridge,
+        'filter_index': filter_index,
+        'sorted_columns': SortedColumns.build(df, live=filter_index.live),
+        'kpis': compute_kpis(df),
+        'cube': RollupCube.build(df),
+        'selections': selections,
+        'search_index': SearchIndex.build(dataset.df),
+    }
+
+
+def _cube_query(ctx):
+    # What the dashboard reads for a sidebar selection without search or ranges
+    cube = ctx['cube']
+    return kpis_from_sums(cube.sums(ctx['selections'])), cube.location_totals(ctx['selections'], LOCATION_CHART_COLUMNS)
+
+
+def _filter(ctx):
+    plan = plan_query(ctx['filter_index'], ctx['sorted_columns'], ctx['selections'], {})
+    positions = run_query(plan, ctx['filter_index'], ctx['sorted_columns'])
+    return ctx['df'] if positions is None else ctx['df'].take(positions)
+
+
+def _table_page(ctx):
+    df = ctx['df'][['Firm_Name', 'Current_Stage', 'Risk_Status', 'Risk_Score', 'Land_Requirement_Acres']]
+    positions = table_positions(df, 'Risk_Score', descending=True)
+    page = df.take(positions[:PAGE_SIZE])
+    styles = {value: f'background-color: {color}' for value, color in RISK_ROW_COLORS.items()}
+    gradients = column_ranges(df, ['Land_Requirement_Acres'])
+    return style_page(page, row_styles=('Risk_Status', styles), gradients=gradients).to_html()
+
+
+def _chart(build, source):
+    def run(ctx):
+        if source == 'international':
+            fig = build(ctx['df'][ctx['df']['Investor_Type'] == 'International'])
+        elif source == 'located':
+            fig = build(ctx['df'], ctx['bridge'])
+        else:
+            fig = build(ctx['df'])
+        # The dashboard caches and ships figures as JSON
+        return figure_json(fig)
+    return run
+
+
+BENCHMARKS = [
+    ('dataset.build', lambda ctx: build_dataset(ctx['raw'], 'bench')),
+    ('dataset.view', lambda ctx: with_view_columns(ctx['dataset'].df, ctx['events'], AS_OF)),
+    ('dataset.view_refresh', lambda ctx: build_dataset_view(ctx['refreshed'], ctx['events'], AS_OF, ctx['view_base'])),
+    ('kpis.compute', lambda ctx: compute_kpis(ctx['df'])),
+    ('cube.build', lambda ctx: RollupCube.build(ctx['df'])),
+    ('cube.query', _cube_query),
+    ('filter.query', _filter),
+    ('search.build', lambda ctx: SearchIndex.build(ctx['dataset'].df)),
+    ('search.query', lambda ctx: ctx['search_index'].search('shipyard kakinada')),
+    *[(f'chart.{chart_id}', _chart(build, source)) for chart_id, build, source in BOARD_CHARTS],
+    ('table.page', _table_page),
+    ('export.csv', lambda ctx: csv_bytes(ctx['df'])),
+    ('export.html', lambda ctx: generate_executive_summary_html(ctx['df'], ctx['kpis'], False, ctx['bridge'])),
+]
+if pdf_available():
+    BENCHMARKS.append(
+        ('export.pdf', lambda ctx: build_executive_summary_pdf(ctx['df'], ctx['kpis'], ctx['bridge']))
+    )
+
+
+def time_benchmark(run, ctx, repeat):
+    """Timings in ms after one warm-up call"""
+    started = time.perf_counter()
+    run(ctx)
+    if (time.perf_counter() - started) * 1000 > SLOW_MS:
+        repeat = min(repeat, 2)
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run(ctx)
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def run_benchmarks(sizes, repeat=5, only=None, log=print):
+    """Result records for every selected benchmark at every size"""
+    selected = [(name, run) for name, run in BENCHMARKS if not only or any(name.startswith(p) for p in only)]
+    results = []
+    for n_rows in sizes:
+        ctx = build_context(n_rows)
+        for name, run in selected:
+            timings = time_benchmark(run, ctx, repeat)
+            record = {
+                'name': name,
+                'rows': n_rows,
+                'median_ms': round(statistics.median(timings), 3),
+                'min_ms': round(min(timings), 3),
+                'runs': len(timings),
+            }
+            results.append(record)
+            log(f"{name:<36} {n_rows:>9,} rows  {record['median_ms']:>10.2f} ms")
+    return results
+
+
+def environment():
+    """Interpreter, library versions and machine the results were taken on"""
+    import plotly
+
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'plotly': plotly.__version__,
+    }
+
+
+def compare(results, baseline, threshold=0.25):
+    """One row per result: baseline and current medians, ratio and status"""
+    previous = {(record['name'], record['rows']): record for record in baseline.get('results', [])}
+    rows = []
+    for record in results:
+        base = previous.get((record['name'], record['rows']))
+        if base is None:
+            rows.append(dict(record, baseline_ms=None, ratio=None, status='new'))
+            continue
+        ratio = record['median_ms'] / base['median_ms'] if base['median_ms'] else float('inf')
+        delta = record['median_ms'] - base['median_ms']
+        if ratio > 1 + threshold and delta >= MIN_DELTA_MS:
+            status = 'regression'
+        elif ratio < 1 / (1 + threshold) and -delta >= MIN_DELTA_MS:
+            status = 'improvement'
+        else:
+            status = 'ok'
+        rows.append(dict(record, baseline_ms=base['median_ms'], ratio=round(ratio, 3), status=status))
+    return rows
+
+
+def _write_json(path, document):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as handle:
+        json.dump(document, handle, indent=2)
+        handle.write('\n')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.run', description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="portfolio sizes (rows)")
+    parser.add_argument('--repeat', type=int, default=5, help="timed runs per benchmark")
+    parser.add_argument('--only', nargs='+', default=None, help="benchmark name prefixes, e.g. kpis chart")
+    parser.add_argument('--out', default=None, help="write results JSON here")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="baseline results JSON to compare against")
+    parser.add_argument('--threshold', type=float, default=0.25, help="allowed slowdown before a regression")
+    parser.add_argument('--save-baseline', action='store_true', help="store these results as the baseline")
+    parser.add_argument('--check', action='store_true', help="exit with status 1 on any regression")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.sizes, args.repeat, args.only)
+    document = {
+        'schema': 1,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'environment': environment(),
+        'results': results,
+    }
+    if args.out:
+        _write_json(args.out, document)
+    if args.save_baseline:
+        _write_json(args.baseline, document)
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; record one with --save-baseline")
+        return 0
+
+    with open(args.baseline, encoding='utf-8') as handle:
+        rows = compare(results, json.load(handle), args.threshold)
+    print(f"\n{'benchmark':<36} {'rows':>9} {'baseline':>10} {'current':>10} {'ratio':>7}  status")
+    for row in rows:
+        baseline_ms = '-' if row['baseline_ms'] is None else f"{row['baseline_ms']:.2f}"
+        ratio = '-' if row['ratio'] is None else f"{row['ratio']:.2f}"
+        print(f"{row['name']:<36} {row['rows']:>9,} {baseline_ms:>10} {row['median_ms']:>10.2f} {ratio:>7}  {row['status']}")
+    regressions = [row for row in rows if row['status'] == 'regression']
+    print(f"\n{len(regressions)} regression(s) against {args.baseline}")
+    return 1 if regressions and args.check else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
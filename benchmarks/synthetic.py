@@ -0,0 +1,74 @@
+"""
+Synthetic portfolios with the dashboard schema, at any scale
+
+Rows are modelled on the built-in sample: each synthetic investor copies the
+text columns of a random sample investor (so type, country, sector and
+location stay consistent), gets a unique firm name and a recent activity
+month, and draws its measures around the sample's values (job counts stay
+whole numbers). Measures that are missing together in the sample (e.g.
+investment and employment) are missing together here, at the sample's
+density.
+"""
+
+import numpy as np
+import pandas as pd
+
+from apmb.compaction import COUNT_COLUMNS
+from apmb.data_sources import NUMERIC_COLUMNS, DataSource
+from apmb.sample_data import SAMPLE_PORTFOLIO
+
+# Latest activity month and how many months back activity spreads
+LAST_MONTH = pd.Timestamp('2025-11-01')
+ACTIVITY_MONTHS = 12
+
+
+def _missing_groups(sample):
+    """Numeric columns grouped by identical missing-value pattern in the sample"""
+    groups = {}
+    for col in NUMERIC_COLUMNS:
+        pattern = tuple(sample[col].isna())
+        groups.setdefault(pattern, []).append(col)
+    return list(groups.values())
+
+
+def generate_portfolio(n_rows, seed=0):
+    """Raw synthetic portfolio of `n_rows` investors (apply the schema via `SyntheticSource`)"""
+    rng = np.random.default_rng(seed)
+    sample = pd.DataFrame(SAMPLE_PORTFOLIO)
+    template = rng.integers(0, len(sample), n_rows)
+
+    df = sample.drop(columns=NUMERIC_COLUMNS).iloc[template].reset_index(drop=True)
+    df['Firm_Name'] = df['Firm_Name'] + ' #' + pd.Series(np.arange(n_rows)).astype(str)
+    months = pd.DatetimeIndex([LAST_MONTH - pd.DateOffset(months=k) for k in range(ACTIVITY_MONTHS)])
+    df['Last_Activity_Month'] = months.strftime('%B %Y')[rng.integers(0, ACTIVITY_MONTHS, n_rows)]
+
+    for columns in _missing_groups(sample):
+        density = sample[columns[0]].notna().mean()
+        present = rng.random(n_rows) < density
+        for col in columns:
+            observed = sample[col].dropna().to_numpy()
+            values = np.full(n_rows, np.nan)
+            if len(observed):
+                drawn = rng.choice(observed, size=int(present.sum())) * rng.lognormal(0.0, 0.25, int(present.sum()))
+                values[present] = np.round(drawn, 0 if col in COUNT_COLUMNS else 1)
+            df[col] = values
+    return df
+
+
+class SyntheticSource(DataSource):
+    """Data source serving a synthetic portfolio in the dashboard schema"""
+
+    kind = 'synthetic'
+
+    def __init__(self, n_rows, seed=0):
+        self.n_rows = n_rows
+        self.seed = seed
+
+    def read(self):
+        return generate_portfolio(self.n_rows, self.seed)
+
+    def version(self):
+        return f"synthetic:{self.n_rows}:{self.seed}"
+
+    def __repr__(self):
+        return f"SyntheticSource({self.n_rows}, seed={self.seed})"
@@ -0,0 +1,122 @@
+"""
+Shared test data and assertions
+
+Tests run on synthetic portfolios (`benchmarks.synthetic`) loaded through a
+`DataSource`, so frames carry the same compacted types as in the dashboard.
+Expected values come from plain row-level pandas, never from the structures
+under test.
+"""
+
+import numpy as np
+import pandas as pd
+
+from apmb.cube import DIMENSIONS
+from apmb.data_sources import COLUMNS, NUMERIC_COLUMNS, DataSource
+from apmb.kpis import float_values
+from apmb.locations import LOCATION_COLUMN, LOCATION_SEPARATOR
+from benchmarks.synthetic import generate_portfolio
+
+
+class FrameSource(DataSource):
+    """Data source serving an in-memory frame; `update` replaces it like an edit to a file"""
+
+    kind = 'frame'
+
+    def __init__(self, df):
+        self.df = df
+        self.edits = 0
+
+    def read(self):
+        return self.df
+
+    def version(self):
+        return f"frame:{self.edits}"
+
+    def update(self, df):
+        self.df = df
+        self.edits += 1
+
+
+def raw_portfolio(n_rows=1500, seed=0):
+    """Synthetic portfolio with missing dimension values and repeated ports mixed in"""
+    df = generate_portfolio(n_rows, seed)
+    rng = np.random.default_rng(seed)
+    for col in DIMENSIONS:
+        df.loc[rng.choice(n_rows, 15, replace=False), col] = None
+    df.loc[rng.choice(n_rows, 10, replace=False), LOCATION_COLUMN] = 'Kakinada/ Mulapeta /Kakinada'
+    return df
+
+
+def edited_portfolio(df, rng, step=0):
+    """`df` with rows updated, deleted and inserted, and new stage, type and port values"""
+    df = df.copy()
+    updated = rng.choice(len(df), 25, replace=False)
+    df.loc[updated, 'Investment_INR_Cr'] = df.loc[updated, 'Investment_INR_Cr'].fillna(10) * 2 + 1
+    df.loc[updated[:5], 'Current_Stage'] = f"Board Review {step}"
+    df.loc[updated[5:10], 'Risk_Status'] = 'Delayed'
+    df = df.drop(index=rng.choice(len(df), 20, replace=False)).reset_index(drop=True)
+
+    inserted = generate_portfolio(15, seed=1000 + step)
+    inserted['Firm_Name'] = [f"New Firm {step}-{i}" for i in range(len(inserted))]
+    inserted.loc[:4, 'Investor_Type'] = 'Joint Venture'
+    inserted.loc[5:9, LOCATION_COLUMN] = f"Ramayapatnam {step}/Kakinada"
+    return pd.concat([df, inserted], ignore_index=True)
+
+
+def random_selections(options, rng, n):
+    """`n` sidebar selections of 0-2 values per dimension, drawn from {dimension: values}"""
+    selections = []
+    for _ in range(n):
+        selection = {}
+        for col in DIMENSIONS:
+            k = int(rng.integers(0, 3))
+            values = list(options[col])
+            selection[col] = tuple(rng.choice(values, size=min(k, len(values)), replace=False)) if k else ()
+        selections.append(selection)
+    return selections
+
+
+def dimension_options(df):
+    """Distinct values of each dimension; Location_Interest is split into ports"""
+    options = {col: df[col].dropna().astype(object).unique().tolist() for col in DIMENSIONS}
+    ports = {port.strip() for value in options[LOCATION_COLUMN] for port in str(value).split(LOCATION_SEPARATOR)}
+    options[LOCATION_COLUMN] = sorted(port for port in ports if port)
+    return options
+
+
+def matching_rows(df, selections):
+    """Rows of `df` matching the selections, by plain pandas comparisons"""
+    mask = np.ones(len(df), dtype=bool)
+    for col, chosen in selections.items():
+        if not chosen:
+            continue
+        values = df[col].astype(object)
+        if col == LOCATION_COLUMN:
+            chosen = set(chosen)
+            mask &= np.array([
+                pd.notna(value) and not chosen.isdisjoint(port.strip() for port in str(value).split(LOCATION_SEPARATOR))
+                for value in values
+            ], dtype=bool)
+        else:
+            mask &= values.isin(chosen).to_numpy()
+    return df[mask]
+
+
+def assert_same_sums(actual, expected, path='kpis'):
+    """Recursive comparison of KPI dicts; missing dict keys count as 0 and NaN equals NaN"""
+    if isinstance(expected, dict) or isinstance(actual, dict):
+        for key in set(actual) | set(expected):
+            assert_same_sums(actual.get(key, 0), expected.get(key, 0), f"{path}[{key!r}]")
+        return
+    assert np.isclose(float(actual), float(expected), rtol=1e-9, atol=1e-6, equal_nan=True), \
+        f"{path}: {actual} != {expected}"
+
+
+def comparable(df):
+    """Source columns as plain floats and objects (None for missing), sorted by firm"""
+    columns = {
+        col: float_values(df[col]) if col in NUMERIC_COLUMNS
+        else [None if pd.isna(value) else value for value in df[col].to_numpy(dtype=object)]
+        for col in COLUMNS
+    }
+    return pd.DataFrame(columns).sort_values('Firm_Name', kind='stable', ignore_index=True)
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from apmb.cube import RollupCube
+from apmb.data_sources import concat_frames
+from apmb.kpis import kpi_sums
+from apmb.locations import ALLOCATION_RULES, location_totals
+
+from .helpers import (
+    FrameSource, assert_same_sums, dimension_options, edited_portfolio, matching_rows, random_selections,
+    raw_portfolio
+)
+
+COLUMNS = ['Investment_INR_Cr', 'Land_Requirement_Acres', 'Direct_Employment']
+
+
+@pytest.fixture(scope='module')
+def portfolio():
+    return FrameSource(raw_portfolio(seed=3)).load()
+
+
+def test_sums_match_row_aggregation(portfolio):
+    cube = RollupCube.build(portfolio)
+    rng = np.random.default_rng(0)
+    assert_same_sums(cube.sums(), kpi_sums(portfolio))
+    for selections in random_selections(dimension_options(portfolio), rng, 60):
+        assert_same_sums(cube.sums(selections), kpi_sums(matching_rows(portfolio, selections)), str(selections))
+
+
+@pytest.mark.parametrize('rule', ALLOCATION_RULES)
+def test_location_totals_match_row_aggregation(portfolio, rule):
+    cube = RollupCube.build(portfolio)
+    rng = np.random.default_rng(1)
+    for selections in random_selections(dimension_options(portfolio), rng, 30):
+        rows = matching_rows(portfolio, selections)
+        actual = cube.location_totals(selections, COLUMNS, rule)
+        if not len(rows):
+            assert np.allclose(actual.to_numpy(), 0)
+            continue
+        expected = location_totals(rows, COLUMNS, rule=rule)
+        assert set(expected.index) <= set(actual.index)
+        assert np.allclose(actual.loc[expected.index].to_numpy(), expected.to_numpy()), str(selections)
+        # Ports outside the selection are zero
+        assert np.allclose(actual.drop(expected.index).to_numpy(), 0), str(selections)
+
+
+def test_apply_changes_matches_rebuild(portfolio):
+    rng = np.random.default_rng(2)
+    removed = portfolio.take(rng.choice(len(portfolio), 40, replace=False))
+    # Appended rows bring new stage, investor type and port values
+    appended = FrameSource(edited_portfolio(raw_portfolio(60, seed=9), rng)).load()
+    current = concat_frames([portfolio.drop(index=removed.index), appended])
+    rebuilt = RollupCube.build(current)
+
+    cube = RollupCube.build(portfolio).apply_changes(removed, appended)
+    for selections in [{}] + random_selections(dimension_options(current), rng, 40):
+        assert_same_sums(cube.sums(selections), rebuilt.sums(selections), str(selections))
+        expected = rebuilt.location_totals(selections, COLUMNS, 'equal')
+        actual = cube.location_totals(selections, COLUMNS, 'equal').reindex(expected.index)
+        assert np.allclose(actual.to_numpy(), expected.to_numpy()), str(selections)
@@ -0,0 +1,122 @@
+import numpy as np
+import pytest
+
+from apmb.dataset import COMPACT_FRACTION, DatasetStore, build_dataset
+from apmb.kpis import compute_kpis
+
+from .helpers import (
+    FrameSource, assert_same_sums, comparable, dimension_options, edited_portfolio, random_selections, raw_portfolio
+)
+
+
+def live_rows(dataset):
+    return dataset.df.take(dataset.live_positions())
+
+
+def index_by_firm(dataset):
+    """{(column, value): firms} of the filter index, live rows only"""
+    firms = dataset.df['Firm_Name'].to_numpy(dtype=object)
+    live = dataset.filter_index.live
+    indexed = {}
+    for col, bitmaps in dataset.filter_index.bitmaps.items():
+        for value, bitmap in bitmaps.items():
+            rows = bitmap if live is None else bitmap & live
+            if rows.any():
+                indexed[col, value] = set(firms[rows])
+    return indexed
+
+
+def bridge_by_firm(dataset):
+    firms = dataset.df['Firm_Name'].to_numpy(dtype=object)
+    live = np.zeros(len(dataset.df), dtype=bool)
+    live[dataset.live_positions()] = True
+    rows = dataset.bridge['row'].to_numpy()
+    return sorted(zip(firms[rows[live[rows]]], dataset.bridge['location'].astype(object).to_numpy()[live[rows]]))
+
+
+def assert_matches_rebuild(dataset, source, rng):
+    """Every structure of `dataset` equals the one built from scratch for the source's current content"""
+    rebuilt = build_dataset(source.load(), 'rebuilt')
+    assert comparable(live_rows(dataset)).equals(comparable(rebuilt.df))
+    assert_same_sums(dataset.kpis, compute_kpis(rebuilt.df))
+    assert index_by_firm(dataset) == index_by_firm(rebuilt)
+    assert bridge_by_firm(dataset) == bridge_by_firm(rebuilt)
+    for selections in [{}] + random_selections(dimension_options(rebuilt.df), rng, 25):
+        assert_same_sums(dataset.cube.sums(selections), rebuilt.cube.sums(selections), str(selections))
+
+
+def test_incremental_refresh_matches_rebuild():
+    rng = np.random.default_rng(0)
+    source = FrameSource(raw_portfolio(800, seed=1))
+    store = DatasetStore(source, refresh_seconds=0)
+    for step in range(4):
+        before = store.current
+        source.update(edited_portfolio(source.df, rng, step))
+        dataset = store.refresh()
+        assert store.last_error is None
+        assert store.last_change['mode'] == 'incremental'
+        assert store.last_change['inserted'] == 15
+        assert store.last_change['deleted'] == 20
+        assert dataset is not before
+        assert_matches_rebuild(dataset, source, rng)
+
+
+def test_new_category_values_are_filterable():
+    rng = np.random.default_rng(1)
+    source = FrameSource(raw_portfolio(300, seed=2))
+    store = DatasetStore(source, refresh_seconds=0)
+    source.update(edited_portfolio(source.df, rng, step=7))
+    dataset = store.refresh()
+
+    assert 'Board Review 7' in dataset.filter_index.options('Current_Stage')
+    assert 'Joint Venture' in dataset.filter_index.options('Investor_Type')
+    assert 'Ramayapatnam 7' in dataset.filter_index.options('Location_Interest')
+    assert dataset.cube.sums({'Investor_Type': ('Joint Venture',)})['Rows'] == 5
+    assert dataset.cube.sums({'Location_Interest': ('Ramayapatnam 7',)})['Rows'] == 5
+
+
+def test_unchanged_rows_are_not_touched():
+    source = FrameSource(raw_portfolio(200, seed=4))
+    store = DatasetStore(source, refresh_seconds=0)
+    before = store.current
+    source.update(source.df.copy())
+    dataset = store.refresh()
+
+    assert (store.last_change['inserted'], store.last_change['updated'], store.last_change['deleted']) == (0, 0, 0)
+    assert dataset.df is before.df
+    assert dataset.filter_index.live is None
+
+
+def test_many_deletions_compact_the_frame():
+    rng = np.random.default_rng(2)
+    source = FrameSource(raw_portfolio(400, seed=5))
+    store = DatasetStore(source, refresh_seconds=0)
+    kept = rng.choice(400, int(400 * (1 - COMPACT_FRACTION)) - 10, replace=False)
+    source.update(source.df.take(np.sort(kept)).reset_index(drop=True))
+    dataset = store.refresh()
+
+    assert dataset.filter_index.live is None
+    assert len(dataset.df) == len(kept)
+    assert_matches_rebuild(dataset, source, rng)
+
+
+@pytest.mark.parametrize('mode, duplicate', [('reload', False), ('incremental', True)])
+def test_full_rebuild_fallbacks(mode, duplicate):
+    rng = np.random.default_rng(3)
+    source = FrameSource(raw_portfolio(300, seed=6))
+    store = DatasetStore(source, refresh_seconds=0, mode=mode)
+    edited = edited_portfolio(source.df, rng)
+    if duplicate:
+        edited.loc[1, 'Firm_Name'] = edited.loc[0, 'Firm_Name']
+    source.update(edited)
+    dataset = store.refresh()
+
+    assert store.last_change['mode'] == 'reload'
+    assert dataset.filter_index.live is None
+    assert_matches_rebuild(dataset, source, rng)
+
+
+def test_unknown_refresh_mode():
+    with pytest.raises(ValueError, match='REFRESH_MODE'):
+        DatasetStore(FrameSource(raw_portfolio(100)), mode='sometimes')
+
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from apmb.dataset import build_dataset
+from apmb.kpis import float_values
+from apmb.query import RANGE_COLUMNS, SortedColumns, plan_query, run_query
+
+from .helpers import FrameSource, dimension_options, matching_rows, random_selections, raw_portfolio
+
+SOURCE_RANGES = [col for col in RANGE_COLUMNS if col != 'Days_Since_Activity']
+
+
+@pytest.fixture(scope='module')
+def dataset():
+    return build_dataset(FrameSource(raw_portfolio(1200, seed=4)).load(), 'v')
+
+
+def random_ranges(sorted_columns, rng):
+    ranges = {}
+    for col in SOURCE_RANGES:
+        if rng.random() < 0.5:
+            low, high = np.sort(rng.uniform(*sorted_columns.bounds(col), size=2))
+            ranges[col] = (low, high)
+    return ranges
+
+
+def test_plan_matches_row_filters(dataset):
+    df = dataset.df
+    sorted_columns = SortedColumns.build(df, SOURCE_RANGES)
+    rng = np.random.default_rng(0)
+    for selections in random_selections(dimension_options(df), rng, 60):
+        ranges = random_ranges(sorted_columns, rng)
+        plan = plan_query(dataset.filter_index, sorted_columns, selections, ranges)
+        assert [p.estimate for p in plan] == sorted(p.estimate for p in plan)
+
+        positions = run_query(plan, dataset.filter_index, sorted_columns)
+        expected = matching_rows(df, selections)
+        for col, (low, high) in ranges.items():
+            values = float_values(expected[col])
+            expected = expected[(values >= low) & (values <= high)]
+        actual = np.arange(len(df)) if positions is None else positions
+        assert np.array_equal(actual, expected.index.to_numpy()), (selections, ranges)
+
+
+def test_unfiltered_plan_is_empty(dataset):
+    sorted_columns = SortedColumns.build(dataset.df, SOURCE_RANGES)
+    plan = plan_query(dataset.filter_index, sorted_columns, {'Investor_Type': ()}, {'Investment_INR_Cr': None})
+    assert plan == []
+    assert run_query(plan, dataset.filter_index, sorted_columns) is None
+
+
+def test_extend_matches_build(dataset):
+    df = dataset.df
+    rng = np.random.default_rng(1)
+    n_base = len(df) - 100
+    base_live = rng.random(n_base) > 0.1
+    live = np.concatenate([base_live & (rng.random(n_base) > 0.05), rng.random(100) > 0.1])
+
+    extended = SortedColumns.build(df.iloc[:n_base], SOURCE_RANGES, live=base_live).extend(df, live=live)
+    expected = SortedColumns.build(df, SOURCE_RANGES, live=live)
+    for col in SOURCE_RANGES:
+        assert np.array_equal(extended.orders[col], expected.orders[col]), col
+        assert np.array_equal(extended.sorted_values[col], expected.sorted_values[col]), col
+        assert extended.bounds(col) == expected.bounds(col), col
@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from apmb.search import FIELD_WEIGHTS, MIN_SCORE, SEARCH_FIELDS, TIGHTNESS_BONUS, SearchIndex, match_mask, trigrams
+
+from .helpers import FrameSource, raw_portfolio
+
+QUERIES = ['kakinada', 'kakinda port', 'shipyard', 'dpr submission', 'green hydrogen', 'zzzz', '']
+
+
+@pytest.fixture(scope='module')
+def portfolio():
+    return FrameSource(raw_portfolio(600, seed=5)).load()
+
+
+def brute_force_scores(df, query):
+    """Best weighted field score of every row, by comparing trigram sets row by row"""
+    query_grams = trigrams(query)
+    scores = np.zeros(len(df))
+    if not query_grams:
+        return scores
+    for field in SEARCH_FIELDS:
+        for i, value in enumerate(df[field].to_numpy(dtype=object)):
+            if pd.isna(value):
+                continue
+            grams = trigrams(value)
+            shared = len(grams & query_grams)
+            if shared < MIN_SCORE * len(query_grams):
+                continue
+            score = shared / len(query_grams) + TIGHTNESS_BONUS * (shared / len(grams))
+            scores[i] = max(scores[i], score * FIELD_WEIGHTS[field])
+    return scores
+
+
+@pytest.mark.parametrize('query', QUERIES)
+def test_row_scores_match_brute_force(portfolio, query):
+    index = SearchIndex.build(portfolio)
+    assert np.allclose(index.row_scores(query), brute_force_scores(portfolio, query))
+
+
+def test_search_ranks_masks_and_truncates(portfolio):
+    index = SearchIndex.build(portfolio)
+    scores = brute_force_scores(portfolio, 'kakinda')
+    positions, ranked = index.search('kakinda')
+    assert len(positions) == np.count_nonzero(scores)
+    assert np.all(np.diff(ranked) <= 0)
+
+    mask = np.arange(len(portfolio)) % 2 == 0
+    masked, _ = index.search('kakinda', mask)
+    assert set(masked) == set(positions[mask[positions]])
+
+    top, top_scores = index.search('kakinda', k=5)
+    assert np.allclose(top_scores, ranked[:5])
+
+
+def test_match_mask_agrees_with_the_index(portfolio):
+    values = portfolio['Location_Interest']
+    highlighted = match_mask(values, 'kakinda')
+    index = SearchIndex.build(portfolio, fields=['Location_Interest'])
+    assert np.array_equal(highlighted, index.row_scores('kakinda') > 0)
@@ -0,0 +1,141 @@
+import os
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from apmb import snapshots
+from apmb.kpis import compute_kpis
+from apmb.snapshots import TREND_KPIS, SnapshotSource, SnapshotStore
+
+from .helpers import FrameSource, comparable, edited_portfolio, raw_portfolio
+
+pytest.importorskip('pyarrow')
+
+START = date(2025, 11, 1)
+
+
+def record(store, day, raw, version):
+    df = FrameSource(raw).load()
+    return store.record(day, df, version, compute_kpis(df))
+
+
+def assert_same_rows(actual, raw):
+    assert comparable(actual).equals(comparable(FrameSource(raw).load()))
+
+
+def test_round_trip_across_keyframes(tmp_path, monkeypatch):
+    monkeypatch.setattr(snapshots, 'KEYFRAME_INTERVAL', 3)
+    rng = np.random.default_rng(0)
+    store = SnapshotStore(str(tmp_path))
+    raw, recorded = raw_portfolio(300, seed=1), {}
+    for step in range(7):
+        day = START + timedelta(days=step)
+        assert record(store, day, raw, f"v{step}")
+        recorded[day] = raw
+        raw = edited_portfolio(raw, rng, step)
+
+    assert store.rollups()['kind'].tolist() == ['full', 'delta', 'delta', 'full', 'delta', 'delta', 'full']
+    assert store.dates() == sorted(recorded, reverse=True)
+    for day, expected in recorded.items():
+        assert_same_rows(store.read(day), expected)
+
+    # A new store on the same directory sees the same history
+    reopened = SnapshotStore(str(tmp_path))
+    assert reopened.dates() == store.dates()
+    assert_same_rows(reopened.read(START + timedelta(days=5)), recorded[START + timedelta(days=5)])
+    assert_same_rows(SnapshotSource(reopened, START + timedelta(days=4)).load(), recorded[START + timedelta(days=4)])
+
+
+def test_deltas_hold_only_changed_rows(tmp_path):
+    rng = np.random.default_rng(1)
+    store = SnapshotStore(str(tmp_path))
+    raw = raw_portfolio(400, seed=2)
+    record(store, START, raw, 'v0')
+    record(store, START + timedelta(days=1), raw, 'v1')
+    edited = edited_portfolio(raw, rng)
+    record(store, START + timedelta(days=2), edited, 'v2')
+
+    assert store.rollups()['kind'].tolist() == ['full', 'delta', 'delta']
+    unchanged = pd.read_parquet(tmp_path / f"{START + timedelta(days=1)}.delta.parquet")
+    assert len(unchanged) == 0
+    delta = pd.read_parquet(tmp_path / f"{START + timedelta(days=2)}.delta.parquet")
+    # 25 updated (some of them deleted again), 20 deleted, 15 inserted
+    assert delta[snapshots.DELETED_COLUMN].sum() == 20
+    assert len(delta) <= 25 + 20 + 15
+
+
+def test_same_day_snapshot_is_replaced(tmp_path):
+    rng = np.random.default_rng(2)
+    store = SnapshotStore(str(tmp_path))
+    first, today = START, START + timedelta(days=1)
+    raw = raw_portfolio(300, seed=3)
+    record(store, first, raw, 'v0')
+
+    morning = edited_portfolio(raw, rng, 1)
+    evening = edited_portfolio(morning, rng, 2)
+    assert record(store, today, morning, 'v1')
+    assert record(store, today, evening, 'v2')
+    # The same version again is a no-op
+    assert not record(store, today, evening, 'v2')
+
+    rollups = store.rollups()
+    assert rollups['version'].tolist() == ['v0', 'v2']
+    assert rollups['Total_Investors'].iloc[-1] == len(evening)
+    assert_same_rows(store.read(today), evening)
+    assert_same_rows(store.read(first), raw)
+
+    # The replacement is encoded against the snapshot before it, and the next day builds on it
+    tomorrow = START + timedelta(days=2)
+    later = edited_portfolio(evening, rng, 3)
+    record(store, tomorrow, later, 'v3')
+    assert_same_rows(SnapshotStore(str(tmp_path)).read(tomorrow), later)
+
+
+def test_same_day_replacement_switches_kind(tmp_path):
+    store = SnapshotStore(str(tmp_path))
+    raw = raw_portfolio(200, seed=4)
+    record(store, START, raw, 'v0')
+    today = START + timedelta(days=1)
+    record(store, today, raw, 'v1')
+    # More than half the portfolio replaced: stored in full, and the earlier delta file removed
+    replaced = raw_portfolio(200, seed=5)
+    replaced['Firm_Name'] = [f"Other {i}" for i in range(len(replaced))]
+    record(store, today, replaced, 'v2')
+
+    assert store.rollups()['kind'].tolist() == ['full', 'full']
+    assert sorted(os.listdir(tmp_path)) == [f"{START}.full.parquet", f"{today}.full.parquet", 'rollups.parquet']
+    assert_same_rows(store.read(today), replaced)
+
+
+def test_past_dates_are_not_rewritten(tmp_path):
+    store = SnapshotStore(str(tmp_path))
+    raw = raw_portfolio(200, seed=6)
+    record(store, START + timedelta(days=1), raw, 'v0')
+    assert not record(store, START, raw_portfolio(200, seed=7), 'v1')
+    assert store.dates() == [START + timedelta(days=1)]
+    with pytest.raises(ValueError, match='No snapshot'):
+        store.read(START)
+
+
+def test_trend_reads_the_rollups(tmp_path):
+    rng = np.random.default_rng(3)
+    store = SnapshotStore(str(tmp_path))
+    raw, expected = raw_portfolio(200, seed=8), []
+    for step in range(5):
+        record(store, START + timedelta(days=step), raw, f"v{step}")
+        expected.append(compute_kpis(FrameSource(raw).load()))
+        raw = edited_portfolio(raw, rng, step)
+
+    trend = store.trend(START + timedelta(days=3), points=3)
+    assert trend['date'].dt.date.tolist() == [START + timedelta(days=day) for day in (1, 2, 3)]
+    for name in TREND_KPIS:
+        assert np.allclose(trend[name].to_numpy(), [float(kpis[name]) for kpis in expected[1:4]]), name
+
+
+def test_disabled_without_a_directory():
+    store = SnapshotStore(None)
+    assert not store.enabled
+    assert store.dates() == []
+    assert store.recorded(START, 'v0')
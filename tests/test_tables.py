@@ -0,0 +1,28 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from apmb.tables import filter_mask
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({'Land_Requirement_Acres': [1.0, 12.5, 1200.0, None]})
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('12.5', [False, True, False, False]),
+    ('>1,000', [False, False, True, False]),
+    ('<=.5', [False, False, False, False]),
+    ('1-20', [True, True, False, False]),
+    ('-5 - 12.', [True, False, False, False]),
+])
+def test_numeric_filters(df, text, expected):
+    assert filter_mask(df, 'Land_Requirement_Acres', text).tolist() == expected
+
+
+@pytest.mark.parametrize('text', ['12.5.', '1.2.3', '.', ',', '1,2.3.4-5', '>=', '10-'])
+def test_malformed_numbers_match_as_text(df, text):
+    values = df['Land_Requirement_Acres'].astype(str)
+    expected = values.str.contains(text, regex=False).to_numpy() & df['Land_Requirement_Acres'].notna().to_numpy()
+    assert np.array_equal(filter_mask(df, 'Land_Requirement_Acres', text), expected)
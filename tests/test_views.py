@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from apmb.dataset import DatasetStore, build_dataset_view
+from apmb.events import EventStore
+
+from .helpers import FrameSource, assert_same_sums, dimension_options, edited_portfolio, random_selections, raw_portfolio
+
+AS_OF = pd.Timestamp('2025-12-01')
+
+
+def assert_same_view(actual, expected, live, rng):
+    df, filter_index, sorted_columns, cube = actual
+    pd.testing.assert_frame_equal(
+        df.take(live).reset_index(drop=True).astype(object),
+        expected[0].take(live).reset_index(drop=True).astype(object)
+    )
+    for col, bitmaps in expected[1].bitmaps.items():
+        assert set(filter_index.bitmaps[col]) == set(bitmaps), col
+        for value, bitmap in bitmaps.items():
+            assert np.array_equal(filter_index.bitmaps[col][value], bitmap), (col, value)
+    for col, order in expected[2].orders.items():
+        assert np.array_equal(sorted_columns.orders[col], order), col
+        assert sorted_columns.bounds(col) == expected[2].bounds(col), col
+    for selections in [{}] + random_selections(dimension_options(expected[0].take(live)), rng, 20):
+        assert_same_sums(cube.sums(selections), expected[3].sums(selections), str(selections))
+
+
+@pytest.mark.parametrize('risk_source', ['manual', 'engine'])
+def test_extended_view_matches_rebuild(monkeypatch, risk_source):
+    monkeypatch.setenv('APMB_RISK_STATUS_SOURCE', risk_source)
+    rng = np.random.default_rng(0)
+    events = EventStore()
+    source = FrameSource(raw_portfolio(600, seed=8))
+    store = DatasetStore(source, refresh_seconds=0)
+    base = (store.current, build_dataset_view(store.current, events, AS_OF))
+    for step in range(3):
+        source.update(edited_portfolio(source.df, rng, step))
+        dataset = store.refresh()
+        view = build_dataset_view(dataset, events, AS_OF, base)
+        # The extended view reuses the base frame's rows
+        assert view[0]['Risk_Score'].iloc[:len(base[0].df)].equals(base[1][0]['Risk_Score'])
+        assert_same_view(view, build_dataset_view(dataset, events, AS_OF), dataset.live_positions(), rng)
+        base = (dataset, view)
+
+
+def test_unrelated_base_is_ignored():
+    rng = np.random.default_rng(1)
+    events = EventStore()
+    first = DatasetStore(FrameSource(raw_portfolio(200, seed=1)), refresh_seconds=0).current
+    other = DatasetStore(FrameSource(raw_portfolio(250, seed=2)), refresh_seconds=0).current
+    view = build_dataset_view(other, events, AS_OF, (first, build_dataset_view(first, events, AS_OF)))
+    assert_same_view(view, build_dataset_view(other, events, AS_OF), other.live_positions(), rng)